@@ -0,0 +1,28 @@
+/**
+ * Blog Search Endpoint
+ *
+ * GET /api/blog/search?q=heat+pump&limit=10
+ *
+ * Ranks blog posts against the pre-built search index (blog/search-index.bin)
+ * and returns their slugs, best match first. "Quoted phrases" must appear
+ * verbatim in a post for it to match.
+ */
+
+import { NextRequest, NextResponse } from 'next/server';
+import { searchBlogPosts } from '@/lib/blogSearch';
+
+const MAX_LIMIT = 50;
+
+export async function GET(request: NextRequest) {
+  const query = request.nextUrl.searchParams.get('q') || '';
+  const requested = parseInt(request.nextUrl.searchParams.get('limit') || '', 10);
+  const limit = Number.isFinite(requested) && requested > 0 ? Math.min(requested, MAX_LIMIT) : 10;
+
+  const results = await searchBlogPosts(query, limit);
+
+  return NextResponse.json({ query, results }, {
+    headers: {
+      'Cache-Control': 'public, max-age=60',
+    },
+  });
+}
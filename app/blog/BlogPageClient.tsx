@@ -1,6 +1,6 @@
 'use client';
 
-import { useState } from 'react';
+import { useEffect, useState } from 'react';
 import OnboardingChatPopup from '@/components/OnboardingChatPopup';
 import Link from 'next/link';
 import { BlogPost, BLOG_CATEGORIES } from '@/lib/blogService';
@@ -12,18 +12,51 @@ interface BlogPageClientProps {
 
 export default function BlogPageClient({ initialPosts }: BlogPageClientProps) {
   const [selectedCategory, setSelectedCategory] = useState<BlogPost['category'] | 'all'>('all');
+  const [searchQuery, setSearchQuery] = useState('');
+  // Slugs ranked by /api/blog/search, or null when there is no query
+  const [searchSlugs, setSearchSlugs] = useState<string[] | null>(null);
 
   console.log('BlogPageClient - Received posts:', initialPosts?.length || 0);
 
-  // Filter posts on the client side
-  const filteredPosts = selectedCategory === 'all' 
+  // Rank posts against the search index once typing pauses
+  useEffect(() => {
+    const query = searchQuery.trim();
+    if (!query) {
+      setSearchSlugs(null);
+      return;
+    }
+    const controller = new AbortController();
+    const timer = setTimeout(async () => {
+      try {
+        const response = await fetch(`/api/blog/search?q=${encodeURIComponent(query)}&limit=50`, {
+          signal: controller.signal,
+        });
+        const data = await response.json();
+        setSearchSlugs((data.results || []).map((result: { slug: string }) => result.slug));
+      } catch (error) {
+        if ((error as Error).name !== 'AbortError') console.error('Blog search failed:', error);
+      }
+    }, 250);
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [searchQuery]);
+
+  // Filter posts on the client side; a search keeps the matches, best first
+  const categoryPosts = selectedCategory === 'all' 
     ? initialPosts 
     : initialPosts.filter(post => post.category === selectedCategory);
+  const filteredPosts = searchSlugs === null
+    ? categoryPosts
+    : searchSlugs
+        .map(slug => categoryPosts.find(post => post.slug === slug))
+        .filter((post): post is BlogPost => post !== undefined);
 
   // Show onboarding link if onboarding not complete (localStorage check, client-side only)
   const [needsOnboarding, setNeedsOnboarding] = useState(false);
   const [onboardingOpen, setOnboardingOpen] = useState(false);
-  React.useEffect(() => {
+  useEffect(() => {
     if (typeof window !== 'undefined') {
       const userData = localStorage.getItem('userHomeData');
       if (!userData) setNeedsOnboarding(true);
@@ -78,8 +111,16 @@ export default function BlogPageClient({ initialPosts }: BlogPageClientProps) {
           </p>
         </div>
 
-        {/* Category Filter */}
+        {/* Search and Category Filter */}
         <div className="bg-white dark:bg-gray-800 rounded-xl shadow-md p-6 mb-8">
+          <input
+            type="search"
+            value={searchQuery}
+            onChange={(e) => setSearchQuery(e.target.value)}
+            placeholder='Search posts, e.g. heat pump or "price cap"'
+            aria-label="Search blog posts"
+            className="w-full mb-6 px-4 py-2 rounded-lg border border-gray-300 dark:border-gray-600 bg-white dark:bg-gray-700 text-gray-900 dark:text-white focus:outline-none focus:ring-2 focus:ring-green-600"
+          />
           <h3 className="text-lg font-bold text-gray-900 dark:text-white mb-4">
             Browse by Category
           </h3>
@@ -183,7 +224,9 @@ export default function BlogPageClient({ initialPosts }: BlogPageClientProps) {
             <div className="text-6xl mb-4">📝</div>
             <p className="text-gray-600 dark:text-gray-400 text-lg mb-2">
               {initialPosts && initialPosts.length > 0 
-                ? 'No blog posts found for this category'
+                ? searchSlugs !== null
+                  ? `No blog posts match "${searchQuery.trim()}"`
+                  : 'No blog posts found for this category'
                 : 'No blog posts available'}
             </p>
             <p className="text-sm text-gray-500">
@@ -12,6 +12,44 @@ interface BlogPostClientProps {
   post: BlogPost;
 }
 
+/**
+ * Markdown image with its size carried in the URL fragment, as written by
+ * the docx image stage, followed by the sizes of the smaller variants it wrote:
+ * ![alt](/blog-images/HASH-1600x900.webp#1600x900,480x270,960x540).
+ * Width and height stop the page jumping as images load, and those variants
+ * go in the srcset by name, so no size is ever recomputed here.
+ */
+function BlogImage({ src, alt }: { src?: unknown; alt?: string }) {
+  if (typeof src !== 'string') return null;
+  const [url, fragment = ''] = src.split('#');
+  const sizes = fragment.split(',').map(size => /^(\d+)x(\d+)$/.exec(size));
+  const dimensions = sizes[0];
+  const width = dimensions ? Number(dimensions[1]) : undefined;
+  const height = dimensions ? Number(dimensions[2]) : undefined;
+  const variant = /^(.*)-\d+x\d+(\.\w+)$/.exec(url);
+  const smaller = sizes.slice(1);
+  let srcSet: string | undefined;
+  if (variant && width && smaller.length && smaller.every(Boolean)) {
+    srcSet = smaller
+      .map(size => `${variant[1]}-${size![1]}x${size![2]}${variant[2]} ${size![1]}w`)
+      .concat(`${url} ${width}w`)
+      .join(', ');
+  }
+  return (
+    // eslint-disable-next-line @next/next/no-img-element
+    <img
+      src={url}
+      alt={alt || ''}
+      width={width}
+      height={height}
+      srcSet={srcSet}
+      sizes={srcSet ? '(min-width: 896px) 896px, 100vw' : undefined}
+      loading="lazy"
+      decoding="async"
+    />
+  );
+}
+
 export default function BlogPostClient({ post }: BlogPostClientProps) {
   const { user } = useAuth();
   const [liked, setLiked] = useState(false);
@@ -96,6 +134,22 @@ export default function BlogPostClient({ post }: BlogPostClientProps) {
           </div>
         )}
 
+        {/* Table of Contents - from the pre-rendered headings */}
+        {post.html && post.toc && post.toc.length > 1 && (
+          <nav aria-label="Table of contents" className="mb-10 p-5 rounded-xl bg-gray-50 dark:bg-gray-800/60 border border-gray-200 dark:border-gray-700">
+            <p className="text-sm font-semibold uppercase tracking-wide text-gray-500 dark:text-gray-400 mb-3">Contents</p>
+            <ul className="space-y-1 text-sm">
+              {post.toc.map(entry => (
+                <li key={entry.id} className={entry.level > 2 ? 'pl-4' : ''}>
+                  <a href={`#${entry.id}`} className="text-blue-600 dark:text-blue-400 hover:underline">
+                    {entry.text}
+                  </a>
+                </li>
+              ))}
+            </ul>
+          </nav>
+        )}
+
         {/* Content - Render Markdown with enhanced team-driven style */}
         <div
           className="prose prose-lg dark:prose-invert max-w-none mb-12
@@ -118,7 +172,12 @@ export default function BlogPostClient({ post }: BlogPostClientProps) {
             prose-card:bg-yellow-50 dark:prose-card:bg-yellow-900/20 prose-card:border prose-card:border-yellow-200 dark:prose-card:border-yellow-800 prose-card:rounded-xl prose-card:p-4 prose-card:my-6 prose-card:shadow
           "
         >
-          <ReactMarkdown>{post.content}</ReactMarkdown>
+          {post.html ? (
+            // Sanitized at build time: every tag and attribute comes from blog_pipeline/html_render.py
+            <div dangerouslySetInnerHTML={{ __html: post.html }} />
+          ) : (
+            <ReactMarkdown components={{ img: BlogImage }}>{post.content}</ReactMarkdown>
+          )}
         </div>
 
         {/* Actions */}
@@ -1,51 +1,11 @@
 """
 Summary of blog system fix
-"""
-
-print('\n' + '='*70)
-print('✓ BLOG SYSTEM FIXED - DEPLOYED TO PRODUCTION')
-print('='*70)
-print('\nPROBLEM IDENTIFIED:')
-print('  • App was using hardcoded MOCK_POSTS instead of markdown files')
-print('  • Old blog posts were showing up')
-print('  • New enhanced blog links were not working')
-print('\nSOLUTION IMPLEMENTED:')
-print('  • Updated blogService.ts to load from /blog/*.md files')
-print('  • Added gray-matter package for frontmatter parsing')
-print('  • Deprecated MOCK_POSTS array (kept for reference)')
-print('  • Fixed TypeScript types and server-side only imports')
-print('  • Build successful - all 12 new blogs will now load')
-print('\nDEPLOYMENT:')
-print('  • Commit: 8d58060')
-print('  • Status: Pushed to GitHub')
-print('  • Vercel: Auto-deploying now')
-print('  • URL: https://cost-saver-app.vercel.app/blog')
-print('\nNEW BLOG SLUGS (working links):')
 
-import os
-blogs = []
-for f in sorted(os.listdir('blog')):
-    if f.startswith('2025-') and f.endswith('.md'):
-        with open(f'blog/{f}', 'r', encoding='utf-8') as file:
-            content = file.read()
-            for line in content.split('\n'):
-                if 'slug:' in line:
-                    slug = line.split('slug:')[1].strip().strip('"').strip("'")
-                    blogs.append(slug)
-                    break
+Shim for `python -m blog_pipeline summary fix`, kept so existing commands keep working.
+"""
+import sys
 
-for i, slug in enumerate(blogs, 1):
-    print(f'  {i:2}. /blog/{slug}')
+from blog_pipeline.cli import main
 
-print('\n' + '='*70)
-print('BEFORE vs AFTER:')
-print('='*70)
-print('BEFORE: 7 old mock blog posts with hardcoded data')
-print('AFTER:  12 new ChatGPT-enhanced blogs from markdown files')
-print('\n✓ Old blogs removed')
-print('✓ New blogs loaded from /blog/*.md')
-print('✓ Links now work correctly')
-print('✓ SEO-optimized content live')
-print('\n' + '='*70)
-print('Wait 2-3 minutes for Vercel deployment to complete')
-print('='*70)
+if __name__ == '__main__':
+    sys.exit(main(['summary', 'fix', *sys.argv[1:]]))
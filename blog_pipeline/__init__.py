@@ -0,0 +1,7 @@
+"""
+Shared building blocks for the blog content tooling
+
+The commands themselves are run with python -m blog_pipeline (see cli.py);
+process_enhanced_blogs.py, fix_blog_formatting.py, extract_blogs.py and the
+summary scripts in the repository root are shims over it.
+"""
@@ -0,0 +1,5 @@
+import sys
+
+from blog_pipeline.cli import main
+
+sys.exit(main())
@@ -0,0 +1,444 @@
+"""
+Benchmark the content pipeline on synthetic corpora
+
+Generates a corpus of .docx sources in a temporary directory, then times each
+pipeline stage on its own over the whole corpus:
+
+    docx_extraction        blog_pipeline.docx_stream.extract_text
+    parse_blog_content     blog_pipeline.ingest.parse_blog_content
+    extract_blog_metadata  blog_pipeline.formatting.extract_blog_metadata
+    normalize_markdown     the formatting rules (formerly the fix_* passes)
+    prompt_build           blog_pipeline.prompt's streamed, sharded prompt
+    search_index           tokenise and serialise search-index.bin
+    post_manifest          manifest.json, related posts included
+    readability            blog_pipeline.readability's per-post scores
+    near_duplicates        MinHash signatures (cold cache) and candidate pairs
+    link_graph             internal link extraction (cold cache) and orphans
+    deployment_summary     blog_pipeline.summary.deployment_summary
+    blog_fix_summary       blog_pipeline.summary.blog_fix_summary
+
+Each stage runs --repeat times for wall time, then once more under
+tracemalloc for its peak allocation. Results are written as JSON (and
+compared against an earlier run with --compare), so throughput and memory
+regressions between versions show up as numbers:
+
+    python -m blog_pipeline.benchmark --shape mixed
+    python -m blog_pipeline.benchmark --shape dense --compare .blog_cache/benchmarks/dense-20250101-120000.json
+
+Corpus shapes: small (many short documents), huge (a few very long ones),
+dense (heavy on headings, lists, tables, blockquotes and code) and mixed
+(all three). --scale multiplies the document counts.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from datetime import datetime
+from xml.sax.saxutils import escape
+
+RESULTS_DIR = os.path.join('.blog_cache', 'benchmarks')
+RESULTS_VERSION = 1
+
+# Relative weights of block types in a section
+PROSE = {'paragraph': 6, 'list': 2, 'table': 0.3, 'quote': 0.3, 'code': 0.2}
+STRUCTURED = {'paragraph': 2, 'list': 4, 'table': 3, 'quote': 2, 'code': 1.5}
+
+# (document count, sections per document, block mix) groups
+SHAPES = {
+    'small': [(200, 4, PROSE)],
+    'huge': [(3, 600, PROSE)],
+    'dense': [(40, 40, STRUCTURED)],
+    'mixed': [(150, 4, PROSE), (2, 600, PROSE), (20, 40, STRUCTURED)],
+}
+
+_VOCABULARY = '''
+energy bill tariff heat pump boiler insulation loft cavity wall solar panel smart meter
+kwh unit rate standing charge ofgem price cap saving household draught thermostat
+radiator appliance washing machine tumble dryer fridge freezer supplier fixed variable
+economy grant scheme payback efficiency winter summer heating hot water electricity gas
+usage monthly annual estimate reading direct debit credit export battery inverter
+'''.split()
+
+# ============================================================================
+# SYNTHETIC CORPUS
+# ============================================================================
+
+def _words(rng, count):
+    return ' '.join(rng.choice(_VOCABULARY) for _ in range(count))
+
+def _sentence(rng):
+    text = _words(rng, rng.randint(8, 20))
+    return text[0].upper() + text[1:] + '.'
+
+def _block(rng, kind):
+    if kind == 'paragraph':
+        return [' '.join(_sentence(rng) for _ in range(rng.randint(2, 5)))]
+    if kind == 'list':
+        bullet = rng.choice(['* ', '• ', '- ', '*   '])
+        return [bullet + _sentence(rng) for _ in range(rng.randint(3, 8))]
+    if kind == 'table':
+        columns = rng.randint(3, 5)
+        rows = ['| ' + ' | '.join(_words(rng, 2).title() for _ in range(columns)) + ' |',
+                '|' + '---|' * columns]
+        for _ in range(rng.randint(3, 10)):
+            rows.append('| ' + ' | '.join(f"£{rng.randint(10, 2000)}" if rng.random() < 0.4 else _words(rng, 2)
+                                          for _ in range(columns)) + ' |')
+        return rows
+    if kind == 'quote':
+        return ['> ' + _sentence(rng) for _ in range(rng.randint(1, 3))]
+    return [f"```{rng.choice(['', 'python', 'bash'])}"] + [_words(rng, 6) for _ in range(rng.randint(2, 5))] + ['```']
+
+def synthetic_document(rng, number, sections, mix):
+    """Lines of one ChatGPT-style blog document (one Word paragraph per line)"""
+    title = _words(rng, rng.randint(5, 10)).title()
+    slug = '-'.join(title.lower().split())[:80]
+    lines = []
+    if rng.random() < 0.5:
+        lines += ['---', f'title: "{title}"', f'date: "2025-02-{number % 28 + 1:02d}"',
+                  f'excerpt: "{_sentence(rng)}"', 'tags: ["energy", "uk", "savings"]',
+                  f'slug: "{slug}-{number}"', 'author: "Cost Saver Team"',
+                  'readTime: "8 min read"', 'category: "guides"', '---']
+    lines += [f"# {title}", _sentence(rng)]
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    for section in range(sections):
+        lines.append(f"{'###' if rng.random() < 0.3 else '##'} {_words(rng, rng.randint(3, 7)).title()}")
+        for _ in range(rng.randint(2, 5)):
+            lines += _block(rng, rng.choices(kinds, weights)[0])
+    return title, lines
+
+_CONTENT_TYPES = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                  '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                  '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                  '<Default Extension="xml" ContentType="application/xml"/>'
+                  '<Override PartName="/word/document.xml" ContentType="application/'
+                  'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/></Types>')
+_RELS = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+         '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+         '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+         'relationships/officeDocument" Target="word/document.xml"/></Relationships>')
+
+def write_docx(path, lines):
+    """Minimal .docx with one paragraph per line, written straight as XML"""
+    body = ''.join(f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>' for line in lines)
+    document = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                f'<w:body>{body}</w:body></w:document>')
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', _CONTENT_TYPES)
+        archive.writestr('_rels/.rels', _RELS)
+        archive.writestr('word/document.xml', document)
+
+def generate_corpus(root, shape='mixed', scale=1.0, seed=1):
+    """Write a synthetic corpus under root. Returns its description"""
+    from blog_pipeline.markdown_normalizer import normalize_markdown
+
+    rng = random.Random(seed)
+    sources = os.path.join(root, 'ChatGPT', 'Blogs')
+    blog_dir = os.path.join(root, 'blog')
+    os.makedirs(sources)
+    os.makedirs(blog_dir)
+    number = 0
+    groups = []
+    for count, sections, mix in SHAPES[shape]:
+        count = max(1, round(count * scale))
+        groups.append({'docs': count, 'sections': sections, 'mix': mix})
+        for _ in range(count):
+            number += 1
+            title, lines = synthetic_document(rng, number, sections, mix)
+            write_docx(os.path.join(sources, f'blog{number}.docx'), lines)
+            # A matching published post, for the stages that read blog/
+            body = normalize_markdown('\n'.join(line for line in lines if not line.startswith(('---', 'title:', 'date:', 'excerpt:', 'tags:', 'slug:', 'author:', 'readTime:', 'category:'))))
+            words = len(body.split())
+            with open(os.path.join(blog_dir, f'2025-02-{number % 28 + 1:02d}-post-{number}.md'), 'w', encoding='utf-8') as f:
+                f.write(f'---\ntitle: "{title}"\ndate: "2025-02-{number % 28 + 1:02d}"\n'
+                        f'excerpt: "{title}"\ntags: ["energy", "uk", "savings"]\nslug: "post-{number}"\n'
+                        f'author: "Cost Saver Team"\nreadTime: "{max(1, words // 200)} min read"\n'
+                        f'category: "{rng.choice(["energy", "home-upgrades", "guides"])}"\n---\n\n{body}\n')
+    docx_files = sorted(os.path.join(sources, name) for name in os.listdir(sources))
+    return {
+        'shape': shape,
+        'scale': scale,
+        'seed': seed,
+        'groups': groups,
+        'docs': len(docx_files),
+        'docx_bytes': sum(os.path.getsize(path) for path in docx_files),
+        'files': docx_files,
+    }
+
+# ============================================================================
+# STAGES
+# ============================================================================
+
+class Corpus:
+    """Inputs shared by the stages, prepared once outside the timings"""
+
+    def __init__(self, root, description):
+        from blog_pipeline.docx_stream import extract_text
+
+        self.root = root
+        self.blog_dir = os.path.join(root, 'blog')
+        self.description = description
+        self.files = description['files']
+        self.texts = [extract_text(path) for path in self.files]
+        self.paragraph_texts = [extract_text(path, separator='\n\n', skip_empty=True) for path in self.files]
+        self.text_bytes = sum(len(text.encode('utf-8')) for text in self.texts)
+
+def _stage_docx_extraction(corpus):
+    from blog_pipeline.docx_stream import extract_text
+    for path in corpus.files:
+        extract_text(path)
+    return len(corpus.files), corpus.description['docx_bytes']
+
+def _stage_parse_blog_content(corpus):
+    from blog_pipeline.ingest import parse_blog_content
+    for text in corpus.texts:
+        parse_blog_content(text)
+    return len(corpus.texts), corpus.text_bytes
+
+def _stage_extract_blog_metadata(corpus):
+    from blog_pipeline.formatting import extract_blog_metadata
+    for text in corpus.paragraph_texts:
+        extract_blog_metadata(text)
+    return len(corpus.paragraph_texts), corpus.text_bytes
+
+def _stage_normalize_markdown(corpus):
+    from blog_pipeline.markdown_normalizer import normalize_markdown
+    for text in corpus.paragraph_texts:
+        normalize_markdown(text)
+    return len(corpus.paragraph_texts), corpus.text_bytes
+
+def _stage_prompt_build(corpus):
+    from blog_pipeline import prompt
+    from blog_pipeline.prompt_shards import PromptShardWriter
+    from blog_pipeline.ts_records import MockPost
+
+    posts = [MockPost(str(number), f"Post {number}", f"post-{number}", 'guides', '', [], '', text)
+             for number, text in enumerate(corpus.texts, start=1)]
+    output = os.path.join(corpus.root, 'prompt', 'ALL_Blogs_For_Enhancement.txt')
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    writer = PromptShardWriter(output, lambda shard: prompt.PROMPT_HEADER,
+                               lambda shard, count: prompt.PROMPT_FOOTER.format(count=count))
+    with writer:
+        for number, title, section in prompt.iter_post_sections([], posts):
+            writer.add_post(number, title, section)
+    return len(posts), corpus.text_bytes
+
+def _stage_search_index(corpus):
+    from blog_pipeline.search_index import write_search_index
+    cache_path = os.path.join(corpus.root, 'search_docs.json')
+    if os.path.exists(cache_path):
+        os.remove(cache_path)  # time a cold build, not a cache hit
+    _, count, _ = write_search_index(corpus.blog_dir, cache_path)
+    return count, corpus.text_bytes
+
+def _stage_post_manifest(corpus):
+    from blog_pipeline.post_manifest import build_manifest
+    from blog_pipeline.search_index import collect_documents
+    try:
+        from blog_pipeline.related_posts import top_related
+    except ImportError:
+        related = {}
+    else:
+        documents, _ = collect_documents(corpus.blog_dir, os.path.join(corpus.root, 'manifest_docs.json'))
+        related = top_related(documents)
+    manifest, _ = build_manifest(corpus.blog_dir, related)
+    return len(manifest['posts']), corpus.text_bytes
+
+def _stage_readability(corpus):
+    from blog_pipeline.readability import analyze, tokenize_blog
+    posts, _ = analyze(tokenize_blog(corpus.blog_dir))
+    return len(posts), corpus.text_bytes
+
+def _stage_near_duplicates(corpus):
+    from blog_pipeline.near_duplicates import load_index
+    cache_path = os.path.join(corpus.root, 'minhash.json')
+    if os.path.exists(cache_path):
+        os.remove(cache_path)  # time cold signatures, not a cache hit
+    index = load_index(corpus.blog_dir, cache_path=cache_path)
+    index.pairs()
+    return len(corpus.files), corpus.text_bytes
+
+def _stage_link_graph(corpus):
+    from blog_pipeline.link_graph import LinkGraph
+    cache_path = os.path.join(corpus.root, 'link_graph.json')
+    if os.path.exists(cache_path):
+        os.remove(cache_path)  # time a cold extraction, not a cache hit
+    graph = LinkGraph(corpus.blog_dir, cache_path=cache_path)
+    graph.orphans()
+    return len(corpus.files), corpus.text_bytes
+
+def _run_summary(corpus, name):
+    from blog_pipeline import summary
+    from blog_pipeline.corpus_stats import collect_stats
+    cache_path = os.path.join(corpus.root, 'corpus_stats.json')
+    if os.path.exists(cache_path):
+        os.remove(cache_path)  # time a cold scan, not a cache hit
+    posts = collect_stats(corpus.blog_dir, cache_path, summary.is_summary_post)
+    with contextlib.redirect_stdout(io.StringIO()):
+        getattr(summary, name)(corpus.blog_dir, posts)
+    return len(corpus.files), corpus.text_bytes
+
+def _stage_deployment_summary(corpus):
+    return _run_summary(corpus, 'deployment_summary')
+
+def _stage_blog_fix_summary(corpus):
+    return _run_summary(corpus, 'blog_fix_summary')
+
+STAGES = [
+    ('docx_extraction', _stage_docx_extraction),
+    ('parse_blog_content', _stage_parse_blog_content),
+    ('extract_blog_metadata', _stage_extract_blog_metadata),
+    ('normalize_markdown', _stage_normalize_markdown),
+    ('prompt_build', _stage_prompt_build),
+    ('search_index', _stage_search_index),
+    ('post_manifest', _stage_post_manifest),
+    ('readability', _stage_readability),
+    ('near_duplicates', _stage_near_duplicates),
+    ('link_graph', _stage_link_graph),
+    ('deployment_summary', _stage_deployment_summary),
+    ('blog_fix_summary', _stage_blog_fix_summary),
+]
+
+# ============================================================================
+# HARNESS
+# ============================================================================
+
+def measure(stage, corpus, repeat):
+    """Best/median wall time and throughput over repeat runs, then peak allocation"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        items, size = stage(corpus)
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    try:
+        stage(corpus)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    best = min(timings)
+    return {
+        'items': items,
+        'bytes': size,
+        'seconds': [round(value, 6) for value in timings],
+        'best_s': round(best, 6),
+        'median_s': round(statistics.median(timings), 6),
+        'items_per_s': round(items / best, 2) if best else None,
+        'mb_per_s': round(size / best / 1e6, 3) if best else None,
+        'peak_alloc_bytes': peak,
+    }
+
+def _git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_benchmark(shape='mixed', scale=1.0, seed=1, repeat=3, stages=None, keep=False):
+    """Generate a corpus, time every stage and return the results dict"""
+    root = tempfile.mkdtemp(prefix='blog-bench-')
+    try:
+        description = generate_corpus(root, shape, scale, seed)
+        corpus = Corpus(root, description)
+        results = {}
+        for name, stage in STAGES:
+            if stages and name not in stages:
+                continue
+            results[name] = measure(stage, corpus, repeat)
+            print(f"  {name:<22} {results[name]['best_s'] * 1000:10.1f} ms  "
+                  f"{results[name]['mb_per_s'] or 0:8.2f} MB/s  {results[name]['peak_alloc_bytes'] / 1e6:8.2f} MB peak")
+    finally:
+        if keep:
+            print(f"📁 Corpus kept in {root}")
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+    description = {key: value for key, value in description.items() if key != 'files'}
+    description['text_bytes'] = corpus.text_bytes
+    return {
+        'version': RESULTS_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'git': _git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'corpus': description,
+        'stages': results,
+    }
+
+def compare(results, baseline, threshold=0.10):
+    """Lines comparing two runs stage by stage, and whether any stage regressed"""
+    lines = []
+    regressed = False
+    for name, current in results['stages'].items():
+        before = baseline.get('stages', {}).get(name)
+        if not before:
+            lines.append(f"  {name:<22} (new stage)")
+            continue
+        time_change = current['best_s'] / before['best_s'] - 1 if before['best_s'] else 0.0
+        memory_change = (current['peak_alloc_bytes'] / before['peak_alloc_bytes'] - 1
+                         if before['peak_alloc_bytes'] else 0.0)
+        flag = ''
+        if time_change > threshold or memory_change > threshold:
+            flag = '  ⚠️  regression'
+            regressed = True
+        lines.append(f"  {name:<22} time {time_change:+7.1%}  peak memory {memory_change:+7.1%}{flag}")
+    return lines, regressed
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the blog content pipeline on a synthetic corpus')
+    parser.add_argument('--shape', choices=sorted(SHAPES), default='mixed', help='Corpus shape (default: mixed)')
+    parser.add_argument('--scale', type=float, default=1.0, help='Multiply the number of documents')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed for the corpus')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per stage (best is reported)')
+    parser.add_argument('--stage', action='append', choices=[name for name, _ in STAGES],
+                        help='Only run this stage (repeatable)')
+    parser.add_argument('--output', help=f'Results file (default: {RESULTS_DIR}/SHAPE-TIMESTAMP.json)')
+    parser.add_argument('--compare', metavar='RESULTS', help='Earlier results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='Slowdown or memory growth that counts as a regression (default: 0.10)')
+    parser.add_argument('--keep', action='store_true', help='Keep the generated corpus')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    print("=" * 60)
+    print(f"BENCHMARK: {args.shape} corpus x{args.scale:g}")
+    print("=" * 60)
+    results = run_benchmark(args.shape, args.scale, args.seed, args.repeat, args.stage, args.keep)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{args.shape}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    if os.path.dirname(output):
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+    corpus = results['corpus']
+    print(f"\n✓ {corpus['docs']} documents, {corpus['docx_bytes'] / 1e6:.1f} MB of docx")
+    print(f"📊 Results written to {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        lines, regressed = compare(results, baseline, args.threshold)
+        print(f"\nCompared with {args.compare} ({baseline.get('git') or 'unknown revision'}):")
+        for line in lines:
+            print(line)
+        if regressed:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
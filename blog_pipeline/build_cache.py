@@ -0,0 +1,122 @@
+"""
+Content-hash build manifest for the docx -> markdown pipeline
+
+Each pipeline records, per source document, the SHA-256 of its bytes, the
+fingerprint of the rules that converted it and the output file it produced.
+Unchanged sources are skipped on the next run. A (mtime, size) match is
+trusted without re-hashing, so a no-op rebuild only costs one stat per file.
+"""
+import hashlib
+import json
+import os
+
+CACHE_PATH = os.path.join('.blog_cache', 'build_manifest.json')
+MANIFEST_VERSION = 1
+
+def hash_file(path, chunk_size=1 << 20):
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def pipeline_fingerprint(version, *rule_files):
+    """Fingerprint a pipeline from its version string and the files holding its rules.
+
+    Editing any of the rule files invalidates every cached output of the pipeline.
+    """
+    digest = hashlib.sha256(str(version).encode('utf-8'))
+    for path in rule_files:
+        digest.update(b'\0')
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def _source_key(path):
+    return os.path.normpath(path).replace(os.sep, '/')
+
+class BuildCache:
+    """Persistent record of what each pipeline last built from which source"""
+
+    def __init__(self, pipeline, fingerprint, path=CACHE_PATH):
+        self.pipeline = pipeline
+        self.fingerprint = fingerprint
+        self.path = path
+        self._data = self._load()
+        section = self._data['pipelines'].get(pipeline)
+        if not section or section.get('fingerprint') != fingerprint:
+            # Rules changed (or first run): nothing cached for this pipeline is valid
+            section = {'fingerprint': fingerprint, 'sources': {}}
+            self._data['pipelines'][pipeline] = section
+            self._dirty = True
+        else:
+            self._dirty = False
+        self.sources = section['sources']
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                return data
+        except (OSError, ValueError):
+            pass
+        return {'version': MANIFEST_VERSION, 'pipelines': {}}
+
+    def output_for(self, source_path):
+        """Output path recorded for a source, or None"""
+        entry = self.sources.get(_source_key(source_path))
+        return entry['output'] if entry else None
+
+    def is_fresh(self, source_path):
+        """True if the source is unchanged since its recorded output was built"""
+        entry = self.sources.get(_source_key(source_path))
+        if not entry or not os.path.exists(entry['output']):
+            return False
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return False
+        if stat.st_mtime_ns == entry['mtime_ns'] and stat.st_size == entry['size']:
+            return True
+        # Touched but possibly identical (e.g. re-saved or checked out again)
+        if stat.st_size != entry['size'] or hash_file(source_path) != entry['sha256']:
+            return False
+        entry['mtime_ns'] = stat.st_mtime_ns
+        self._dirty = True
+        return True
+
+    def record(self, source_path, output_path):
+        """Remember that source_path (as it is now on disk) produced output_path"""
+        stat = os.stat(source_path)
+        self.sources[_source_key(source_path)] = {
+            'sha256': hash_file(source_path),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'output': output_path,
+        }
+        self._dirty = True
+
+    def clear(self):
+        """Drop every cached entry so the next run rebuilds everything"""
+        if self.sources:
+            self.sources.clear()
+            self._dirty = True
+
+    def forget(self, source_path):
+        if self.sources.pop(_source_key(source_path), None) is not None:
+            self._dirty = True
+
+    def save(self):
+        """Write the manifest back (atomically) if anything changed"""
+        if not self._dirty:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
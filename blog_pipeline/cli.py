@@ -0,0 +1,59 @@
+"""
+One command line for the blog content tooling
+
+    python -m blog_pipeline ingest    convert enhanced .docx posts to markdown
+    python -m blog_pipeline format    rebuild blog1-12 with proper formatting
+    python -m blog_pipeline prompt    build the ChatGPT enhancement prompt (--delta: changes only)
+    python -m blog_pipeline merge     merge a reply to a --delta prompt back into a post
+    python -m blog_pipeline summary   print the deployment or fix summary
+    python -m blog_pipeline stats     post, word and reading-time totals
+    python -m blog_pipeline readability  Flesch, keyword density and structure vs the prompt
+    python -m blog_pipeline render    pre-render posts to HTML with a table of contents
+    python -m blog_pipeline compress  write .gz/.br siblings of the generated files
+    python -m blog_pipeline duplicates  list near-duplicate posts (MinHash/LSH)
+    python -m blog_pipeline links     check internal links, list orphaned posts
+
+Each subcommand's module is imported only when it runs, so the quick ones
+never load the docx, classifier or process-pool machinery. Arguments after
+the subcommand go to that command (python -m blog_pipeline ingest --help).
+"""
+import importlib
+import sys
+
+# name -> (module, entry point, description)
+COMMANDS = {
+    'ingest': ('blog_pipeline.ingest', 'main', 'Convert enhanced ChatGPT .docx posts to markdown'),
+    'format': ('blog_pipeline.formatting', 'main', 'Rebuild blog1-12 with proper frontmatter and formatting'),
+    'prompt': ('blog_pipeline.prompt', 'main', 'Build the ChatGPT blog enhancement prompt'),
+    'merge': ('blog_pipeline.prompt_delta', 'merge_main', 'Merge a reply to a --delta prompt back into a post'),
+    'summary': ('blog_pipeline.summary', 'main', 'Print the deployment or blog fix summary'),
+    'stats': ('blog_pipeline.summary', 'stats_main', 'Post, word and reading-time totals'),
+    'readability': ('blog_pipeline.readability', 'main', 'Readability and SEO metrics against the prompt targets'),
+    'render': ('blog_pipeline.html_render', 'main', 'Pre-render posts to HTML with a table of contents'),
+    'compress': ('blog_pipeline.precompress', 'main', 'Write gzip/brotli siblings of the generated files'),
+    'duplicates': ('blog_pipeline.near_duplicates', 'main', 'List near-duplicate posts in blog/'),
+    'links': ('blog_pipeline.link_graph', 'main', 'Check internal links and map the link graph'),
+}
+
+def usage():
+    lines = ['usage: python -m blog_pipeline COMMAND [ARGS...]', '', 'commands:']
+    for name, (_, _, description) in COMMANDS.items():
+        lines.append(f'  {name:<12} {description}')
+    return '\n'.join(lines)
+
+def run(command, argv=None):
+    """Import a subcommand's module and call its entry point with argv"""
+    module_name, function, _ = COMMANDS[command]
+    # argparse takes the program name in usage messages from argv[0]
+    sys.argv[0] = f'python -m blog_pipeline {command}'
+    return getattr(importlib.import_module(module_name), function)(argv)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help'):
+        print(usage())
+        return 0
+    if argv[0] not in COMMANDS:
+        print(f"❌ Unknown command: {argv[0]}\n\n{usage()}", file=sys.stderr)
+        return 2
+    return run(argv[0], argv[1:])
@@ -0,0 +1,118 @@
+"""
+Split one combined ChatGPT reply into its posts, streaming
+
+The enhancement prompt asks for every post back in one reply, saved as
+Enhanced_Blogs_Output.docx (or pasted into a .txt). split_posts walks that
+document line by line and yields each post as soon as the frontmatter of the
+next one is confirmed, so only one post is held in memory at a time; .docx
+paragraphs come from docx_stream's streaming parser.
+
+A post starts at a '---' line followed by 'key: value' lines, including a
+title or slug, and a closing '---'. A '---' that isn't followed by
+frontmatter is an ordinary rule and stays in the post. Chatter before the first post is dropped. When a post is
+wrapped in a code fence (ChatGPT's ```markdown ... ```), it ends where that
+fence closes and the commentary after it is dropped too.
+
+    python -m blog_pipeline ingest --combined ChatGPT/Blogs/Enhanced_Blogs_Output.docx
+"""
+import re
+
+from blog_pipeline.docx_stream import iter_paragraphs
+
+# Longest run of lines a frontmatter block may have before it's given up on
+MAX_FRONTMATTER_LINES = 60
+
+_KEY_RE = re.compile(r'\s*([A-Za-z_][\w-]*)\s*:(\s|$)')
+_POST_KEYS = {'title', 'slug'}
+_CONTINUATION_RE = re.compile(r'\s+\S|\s*- ')
+_OPEN_FENCE_RE = re.compile(r'\s*(```|~~~)[\w-]*\s*')
+
+def iter_lines(path, images=None):
+    """Lines of a .docx (paragraph by paragraph) or text file, without line endings.
+
+    images is as for docx_stream.extract_text: called with each picture's
+    (relationship id, alt text), returning its markdown or None.
+    """
+    if path.lower().endswith('.docx'):
+        for paragraph in iter_paragraphs(path):
+            yield from paragraph.text.split('\n')
+            if images is not None:
+                for rid, alt in paragraph.images:
+                    markdown = images(rid, alt)
+                    if markdown:
+                        yield markdown
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            yield line.rstrip('\r\n')
+
+def _finished(lines):
+    """A post's lines with trailing blanks and an unclosed fence opener removed"""
+    while lines and not lines[-1].strip():
+        lines.pop()
+    if lines and _OPEN_FENCE_RE.fullmatch(lines[-1]):
+        lines.pop()
+        while lines and not lines[-1].strip():
+            lines.pop()
+    return '\n'.join(lines)
+
+def split_posts(lines):
+    """Yield the text of each post in a combined reply, in order.
+
+    If no frontmatter is found at all, the whole document is one post.
+    """
+    post = []
+    pending = None  # lines since a '---' that may open frontmatter
+    keys = 0  # frontmatter keys seen in pending
+    named = False  # one of them was title or slug
+    found = False
+    last = ''  # last non-blank line outside pending
+    wrapped = False  # the current post sits inside a ```markdown fence
+    inner = False  # inside a code block within a wrapped post
+    done = False  # a wrapped post's fence closed: drop chatter until the next post
+    for line in lines:
+        stripped = line.strip()
+        if pending is not None:
+            if stripped == '---' and named:
+                # Frontmatter confirmed: the post before it is complete
+                if found and not done:
+                    yield _finished(post)
+                found = True
+                wrapped, inner, done = bool(_OPEN_FENCE_RE.fullmatch(last)), False, False
+                post = pending + [line]
+                pending = None
+                continue
+            if stripped != '---' and len(pending) < MAX_FRONTMATTER_LINES:
+                key = _KEY_RE.match(line)
+                if key or not stripped or (keys and _CONTINUATION_RE.match(line)):
+                    pending.append(line)
+                    if key:
+                        keys += 1
+                        named = named or key.group(1).lower() in _POST_KEYS
+                    continue
+            # Not frontmatter after all
+            if not done:
+                post.extend(pending)
+            last = next((text for text in reversed(pending) if text.strip()), last)
+            pending = None
+
+        if stripped == '---':
+            pending, keys, named = [line], 0, False
+            continue
+        if stripped:
+            last = line
+        if done:
+            continue
+        if wrapped and _OPEN_FENCE_RE.fullmatch(line):
+            if inner or stripped not in ('```', '~~~'):
+                inner = not inner
+            else:
+                # The fence around the post closed; what follows is commentary
+                yield _finished(post)
+                post, done = [], True
+                continue
+        post.append(line)
+    if pending and not done:
+        post.extend(pending)
+    if (found and not done) or (not found and any(line.strip() for line in post)):
+        yield _finished(post)
@@ -0,0 +1,116 @@
+"""
+Per-post and per-category statistics for the published posts
+
+The summaries used to scan every line of every post for 'title:',
+'category:', 'readTime:' and 'slug:' (so a body line mentioning "category:"
+overwrote the real value) and then reopened each file to count its words.
+Here each post is read once, line by line: fields come only from the
+frontmatter block, and body words are counted in the same pass. Per-file
+results are cached in .blog_cache/ keyed by mtime and size, so a summary of
+an unchanged blog/ directory reads nothing but the cache and the stats.
+
+    python -m blog_pipeline stats
+"""
+import json
+import os
+from collections import namedtuple
+
+from blog_pipeline.frontmatter import FrontmatterError, parse_frontmatter
+from blog_pipeline.output_stage import write_if_changed
+from blog_pipeline.post_manifest import is_post_file
+
+CACHE_PATH = os.path.join('.blog_cache', 'corpus_stats.json')
+STATS_VERSION = 1
+
+PostStats = namedtuple('PostStats', 'filename title slug category read_time minutes words')
+CategoryTotals = namedtuple('CategoryTotals', 'posts words minutes')
+
+_FIELDS = ('title', 'slug', 'category', 'readTime')
+
+def _loose_fields(lines):
+    """key: value pairs from a frontmatter block gray-matter style parsing rejected"""
+    data = {}
+    for line in lines:
+        key, sep, value = line.partition(':')
+        if sep and key.strip() in _FIELDS:
+            data[key.strip()] = value.strip().strip('"').strip("'")
+    return data
+
+def _read_minutes(read_time):
+    """8 from '8 min read', 0 if there is no leading number"""
+    number = read_time.split()[0] if read_time.split() else ''
+    return int(number) if number.isdigit() else 0
+
+def scan_post(path):
+    """Frontmatter fields and body word count for one post, in a single read"""
+    block = []
+    words = 0
+    with open(path, 'r', encoding='utf-8') as f:
+        first = f.readline()
+        if first.rstrip('\r\n') == '---':
+            for line in f:
+                if line.startswith('---'):
+                    break
+                block.append(line.rstrip('\r\n'))
+        else:
+            words += len(first.split())
+        for line in f:
+            words += len(line.split())
+    try:
+        data = parse_frontmatter('\n'.join(block))
+    except FrontmatterError:
+        data = _loose_fields(block)
+    read_time = str(data.get('readTime') or '')
+    return {
+        'title': str(data.get('title') or ''),
+        'slug': str(data.get('slug') or ''),
+        'category': str(data.get('category') or ''),
+        'read_time': read_time,
+        'minutes': _read_minutes(read_time),
+        'words': words,
+    }
+
+def _load_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == STATS_VERSION:
+            return data['files']
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+def collect_stats(blog_dir='blog', cache_path=CACHE_PATH, include=is_post_file):
+    """PostStats for every included post in filename order, rescanning only changed files"""
+    cached = _load_cache(cache_path)
+    files = {}
+    posts = []
+    prefix = os.path.normpath(blog_dir).replace(os.sep, '/') + '/'
+    names = sorted(os.listdir(blog_dir))
+    for filename in names:
+        if not include(filename):
+            continue
+        path = os.path.join(blog_dir, filename)
+        key = prefix + filename
+        stat = os.stat(path)
+        entry = cached.get(key)
+        if entry is None or entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            entry = dict(scan_post(path), mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        files[key] = entry
+        posts.append(PostStats(filename, *(entry[field] for field in PostStats._fields[1:])))
+    # Keep entries for other directories and filters; drop posts that were deleted
+    present = {prefix + filename for filename in names}
+    merged = {key: value for key, value in cached.items() if not key.startswith(prefix) or key in present}
+    merged.update(files)
+    if merged != cached:
+        write_if_changed(cache_path, json.dumps({'version': STATS_VERSION, 'files': merged},
+                                                separators=(',', ':'), sort_keys=True))
+    return posts
+
+def category_totals(posts):
+    """CategoryTotals per category, in first-seen order"""
+    totals = {}
+    for post in posts:
+        count, words, minutes = totals.get(post.category, (0, 0, 0))
+        totals[post.category] = (count + 1, words + post.words, minutes + post.minutes)
+    return {category: CategoryTotals(*values) for category, values in totals.items()}
@@ -0,0 +1,248 @@
+"""
+Embedded images from .docx sources, optimised for the blog
+
+Pictures in the ChatGPT documents live in the docx zip as word/media/*
+parts, linked from word/document.xml by relationship id. For each document
+the image relationships are read from word/_rels/document.xml.rels and every
+part is streamed out of the zip and hashed. Work is keyed by content hash, so
+the same picture pasted into several posts is processed and stored once.
+
+Each new image is resized to the IMAGE_WIDTHS that fit within it (never
+upscaled) and recompressed as WebP, in a process pool. Files are written to
+public/blog-images/ as HASH-WIDTHxHEIGHT.webp, so the dimensions of an
+existing image are known from its name and nothing is redone on later runs.
+The markdown reference points at the largest variant and carries its size
+in the fragment, followed by the sizes of the smaller variants written for
+it: ![alt](/blog-images/HASH-1600x900.webp#1600x900,480x270,960x540).
+BlogPostClient and html_render turn that into width/height attributes and a
+srcset naming exactly those files, so the readers never recompute a size.
+
+Pillow is optional: without it PNG, JPEG, GIF and WebP images are copied
+as they are (at their original size) and other formats are skipped.
+"""
+import hashlib
+import io
+import os
+import posixpath
+import re
+import struct
+import zipfile
+from collections import namedtuple
+from xml.etree.ElementTree import iterparse
+
+from blog_pipeline.output_stage import write_if_changed
+
+IMAGE_DIR = os.path.join('public', 'blog-images')
+IMAGE_URL = '/blog-images'
+# Image references list the variants written, so readers need no copy of these
+IMAGE_WIDTHS = (480, 960, 1600)
+WEBP_QUALITY = 80
+HASH_LENGTH = 16
+
+RELS_PART = 'word/_rels/document.xml.rels'
+_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+_IMAGE_REL_TYPE = '/relationships/image'
+
+# Formats a browser can show as-is, for when Pillow isn't installed
+_WEB_FORMATS = {'.png': 'png', '.jpg': 'jpeg', '.jpeg': 'jpeg', '.gif': 'gif', '.webp': 'webp'}
+_VARIANT_RE = re.compile(r'-(\d+)x(\d+)\.(\w+)\Z')
+
+# variants: (width, height) of the smaller files written beside src, smallest first
+ImageAsset = namedtuple('ImageAsset', ['src', 'width', 'height', 'variants'], defaults=((),))
+
+def image_relationships(archive):
+    """{relationship id: zip member} for the document's embedded images"""
+    try:
+        f = archive.open(RELS_PART)
+    except KeyError:
+        return {}
+    images = {}
+    with f:
+        for event, elem in iterparse(f):
+            if (elem.tag == _REL and elem.get('Type', '').endswith(_IMAGE_REL_TYPE)
+                    and elem.get('TargetMode') != 'External'):
+                target = elem.get('Target', '')
+                member = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join('word', target))
+                images[elem.get('Id')] = member
+    return images
+
+def _hash_member(archive, member, chunk_size=1 << 16):
+    digest = hashlib.sha256()
+    with archive.open(member) as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+def image_size(data):
+    """(width, height) from a PNG, GIF, JPEG or WebP header, or None"""
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and len(data) >= 24:
+        return struct.unpack('>II', data[16:24])
+    if data[:6] in (b'GIF87a', b'GIF89a') and len(data) >= 10:
+        return struct.unpack('<HH', data[6:10])
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP' and len(data) >= 30:
+        chunk = data[12:16]
+        if chunk == b'VP8X':
+            return (int.from_bytes(data[24:27], 'little') + 1, int.from_bytes(data[27:30], 'little') + 1)
+        if chunk == b'VP8 ':
+            width, height = struct.unpack('<HH', data[26:30])
+            return width & 0x3fff, height & 0x3fff
+        if chunk == b'VP8L':
+            bits = int.from_bytes(data[21:25], 'little')
+            return (bits & 0x3fff) + 1, ((bits >> 14) & 0x3fff) + 1
+    if data[:2] == b'\xff\xd8':
+        position = 2
+        while position + 9 < len(data):
+            if data[position] != 0xff:
+                position += 1
+                continue
+            marker = data[position + 1]
+            if marker in (0xd8, 0x01) or 0xd0 <= marker <= 0xd7:
+                position += 2
+                continue
+            length = struct.unpack('>H', data[position + 2:position + 4])[0]
+            # SOF0-SOF15, except DHT (c4), JPG (c8) and DAC (cc)
+            if 0xc0 <= marker <= 0xcf and marker not in (0xc4, 0xc8, 0xcc):
+                height, width = struct.unpack('>HH', data[position + 5:position + 9])
+                return width, height
+            position += 2 + length
+    return None
+
+def variant_widths(width):
+    """Target widths for an image of this width, largest last, never upscaled"""
+    largest = min(width, IMAGE_WIDTHS[-1])
+    return [target for target in IMAGE_WIDTHS if target < largest] + [largest]
+
+def variant_sizes(width, height):
+    """(width, height) of every variant of an image, largest last.
+
+    The smaller heights are scaled from the largest variant, rounded half up.
+    """
+    widths = variant_widths(width)
+    top = widths[-1]
+    top_height = height if top == width else max(1, int(height * top / width + 0.5))
+    return [(target, max(1, int(top_height * target / top + 0.5))) for target in widths[:-1]] + [(top, top_height)]
+
+def _existing_assets(output_dir):
+    """{content hash: largest variant already on disk, listing the smaller ones}"""
+    found = {}
+    try:
+        names = os.listdir(output_dir)
+    except FileNotFoundError:
+        return {}
+    for name in names:
+        match = _VARIANT_RE.search(name)
+        if match:
+            digest = name[:-len(match.group(0))]
+            found.setdefault((digest, match.group(3)), {})[int(match.group(1))] = (int(match.group(2)), name)
+    assets = {}
+    for (digest, extension), variants in found.items():
+        width = max(variants)
+        height, name = variants[width]
+        if digest not in assets or width > assets[digest].width:
+            smaller = tuple((w, variants[w][0]) for w in sorted(variants) if w < width)
+            assets[digest] = ImageAsset(f'{IMAGE_URL}/{name}', width, height, smaller)
+    return assets
+
+def _variant_name(digest, width, height, extension):
+    return f'{digest}-{width}x{height}.{extension}'
+
+def _optimize_with_pillow(data, digest, output_dir):
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as image:
+        image = ImageOps.exif_transpose(image)
+        has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+        sizes = variant_sizes(image.width, image.height)
+        for width, height in sizes:
+            variant = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            buffer = io.BytesIO()
+            variant.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=6)
+            write_if_changed(os.path.join(output_dir, _variant_name(digest, width, height, 'webp')),
+                             buffer.getvalue())
+    width, height = sizes[-1]
+    return ImageAsset(f'{IMAGE_URL}/{_variant_name(digest, width, height, "webp")}', width, height,
+                      tuple(sizes[:-1]))
+
+def _copy_original(data, digest, member, output_dir):
+    extension = _WEB_FORMATS.get(posixpath.splitext(member)[1].lower())
+    size = image_size(data)
+    if extension is None or size is None:
+        return None
+    name = _variant_name(digest, size[0], size[1], 'jpg' if extension == 'jpeg' else extension)
+    write_if_changed(os.path.join(output_dir, name), data)
+    return ImageAsset(f'{IMAGE_URL}/{name}', *size)
+
+def _optimize_job(job):
+    """Worker entry point: write the variants of one image. Returns (hash, asset or None, message)"""
+    docx_path, member, digest, output_dir = job
+    with zipfile.ZipFile(docx_path) as archive:
+        data = archive.read(member)
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        asset = _copy_original(data, digest, member, output_dir)
+        message = None if asset else f"⚠️  Skipped {posixpath.basename(member)}: not a web image format (install Pillow to convert it)"
+        return digest, asset, message
+    try:
+        return digest, _optimize_with_pillow(data, digest, output_dir), None
+    except Exception as e:
+        # Pillow can't read it (EMF/WMF and the like): ship it as-is if a browser can
+        asset = _copy_original(data, digest, member, output_dir)
+        return digest, asset, None if asset else f"⚠️  Skipped {posixpath.basename(member)}: {e}"
+
+def optimize_images(jobs, workers=None):
+    """Run _optimize_job over jobs, across a process pool when there are several"""
+    if workers == 1 or len(jobs) < 2:
+        return [_optimize_job(job) for job in jobs]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(jobs))) as executor:
+        return list(executor.map(_optimize_job, jobs))
+
+def image_fragment(asset):
+    """URL fragment for an image: its size, then the sizes of its smaller variants"""
+    return ','.join(f'{width}x{height}' for width, height in ((asset.width, asset.height),) + tuple(asset.variants))
+
+class DocumentImages:
+    """Optimised images for one document, looked up by relationship id"""
+
+    def __init__(self, assets):
+        self.assets = assets
+
+    def __len__(self):
+        return len(self.assets)
+
+    def __call__(self, rid, alt):
+        """Markdown for a picture, for docx_stream.extract_text(images=...)"""
+        asset = self.assets.get(rid)
+        if asset is None:
+            return None
+        alt = ' '.join(alt.replace('[', '(').replace(']', ')').split())
+        return f'![{alt}]({asset.src}#{image_fragment(asset)})'
+
+def document_images(docx_path, output_dir=IMAGE_DIR, workers=None):
+    """Extract, deduplicate and optimise a document's images. Returns DocumentImages"""
+    try:
+        archive = zipfile.ZipFile(docx_path)
+    except zipfile.BadZipFile:
+        return DocumentImages({})
+    with archive:
+        relationships = image_relationships(archive)
+        names = set(archive.namelist())
+        hashes = {rid: _hash_member(archive, member) for rid, member in relationships.items() if member in names}
+    if not hashes:
+        return DocumentImages({})
+    assets = _existing_assets(output_dir)
+    jobs = {}
+    for rid, digest in hashes.items():
+        if digest not in assets and digest not in jobs:
+            jobs[digest] = (docx_path, relationships[rid], digest, output_dir)
+    if jobs:
+        os.makedirs(output_dir, exist_ok=True)
+        for digest, asset, message in optimize_images(list(jobs.values()), workers):
+            if message:
+                print(message)
+            if asset is not None:
+                assets[digest] = asset
+                print(f"🖼️  Image: {asset.src} ({asset.width}x{asset.height})")
+    return DocumentImages({rid: assets[digest] for rid, digest in hashes.items() if digest in assets})
@@ -0,0 +1,130 @@
+"""
+Streaming text extraction for .docx files
+
+Reads word/document.xml straight out of the zip with iterparse instead of
+building the python-docx object model. Paragraphs are yielded one at a time
+and each body element is dropped as soon as it has been read, so memory stays
+bounded however long the document is. The text of each paragraph matches
+python-docx's ``paragraph.text``; python-docx is used as a fallback for files
+that can't be streamed.
+"""
+import zipfile
+from collections import namedtuple
+from xml.etree.ElementTree import iterparse
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+A_NS = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+R_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+WP_NS = '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}'
+DOCUMENT_PART = 'word/document.xml'
+
+_BODY = W_NS + 'body'
+_P = W_NS + 'p'
+_R = W_NS + 'r'
+_HYPERLINK = W_NS + 'hyperlink'
+_T = W_NS + 't'
+_BR = W_NS + 'br'
+_TYPE = W_NS + 'type'
+_BLIP = A_NS + 'blip'
+_EMBED = R_NS + 'embed'
+_DOC_PR = WP_NS + 'docPr'
+
+# Run children and their text equivalents (w:t and w:br are handled separately)
+_RUN_TEXT = {
+    W_NS + 'tab': '\t',
+    W_NS + 'ptab': '\t',
+    W_NS + 'cr': '\n',
+    W_NS + 'noBreakHyphen': '-',
+}
+
+# images holds (relationship id, alt text) for each picture in the paragraph
+Paragraph = namedtuple('Paragraph', ['text', 'images'], defaults=((),))
+
+def _iter_streamed(archive):
+    """Yield body-level paragraphs of an open docx archive"""
+    stack = []
+    body = None
+    parts = []
+    images = []
+    alt = ''
+    with archive.open(DOCUMENT_PART) as f:
+        for event, elem in iterparse(f, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                stack.append(tag)
+                if tag == _BODY:
+                    body = elem
+                continue
+
+            stack.pop()
+            depth = len(stack)
+            # Only paragraphs that are direct children of w:body, like doc.paragraphs
+            in_body_p = depth > 2 and stack[1] == _BODY and stack[2] == _P
+            if in_body_p:
+                parent = stack[-1]
+                if parent == _R and (depth == 4 or (depth == 5 and stack[3] == _HYPERLINK)):
+                    if tag == _T:
+                        parts.append(elem.text or '')
+                    elif tag == _BR:
+                        if elem.get(_TYPE, 'textWrapping') == 'textWrapping':
+                            parts.append('\n')
+                    elif tag in _RUN_TEXT:
+                        parts.append(_RUN_TEXT[tag])
+                elif tag == _DOC_PR:
+                    # Comes before the picture's blip inside the same drawing
+                    alt = elem.get('descr') or elem.get('title') or ''
+                elif tag == _BLIP and elem.get(_EMBED):
+                    images.append((elem.get(_EMBED), alt))
+                    alt = ''
+
+            if depth == 2 and body is not None:
+                # A body-level element is complete: emit it and let it go
+                if tag == _P:
+                    yield Paragraph(''.join(parts), tuple(images))
+                parts = []
+                images = []
+                body.remove(elem)
+
+def _iter_python_docx(file_path):
+    """Fallback for documents the streaming reader can't open"""
+    from docx import Document
+
+    doc = Document(file_path)
+    for para in doc.paragraphs:
+        yield Paragraph(para.text)
+
+def iter_paragraphs(file_path):
+    """Yield Paragraph(text, images) for every body paragraph in a .docx"""
+    try:
+        archive = zipfile.ZipFile(file_path)
+    except zipfile.BadZipFile:
+        yield from _iter_python_docx(file_path)
+        return
+    with archive:
+        if DOCUMENT_PART not in archive.namelist():
+            yield from _iter_python_docx(file_path)
+            return
+        yield from _iter_streamed(archive)
+
+def extract_text(file_path, separator='\n', skip_empty=False, images=None):
+    """Join a document's paragraphs into one string.
+
+    With the defaults this matches '\\n'.join(p.text for p in doc.paragraphs).
+    skip_empty strips each paragraph and drops blank ones. images, if given,
+    is called with each picture's (relationship id, alt text) and returns its
+    markdown (or None), which goes in as its own paragraph after the text it
+    was anchored in.
+    """
+    texts = []
+    for paragraph in iter_paragraphs(file_path):
+        text = paragraph.text
+        if skip_empty:
+            text = text.strip()
+        if text or not skip_empty:
+            texts.append(text)
+        if images is not None:
+            for rid, alt in paragraph.images:
+                markdown = images(rid, alt)
+                if markdown:
+                    texts.append(markdown)
+    return separator.join(texts)
@@ -0,0 +1,291 @@
+"""
+Fix frontmatter and formatting for all blog posts
+
+    python -m blog_pipeline format [--force] [--watch] ...
+"""
+import argparse
+import os
+import re
+import time
+
+from blog_pipeline.build_cache import BuildCache, pipeline_fingerprint
+from blog_pipeline import docx_images, docx_stream, keyword_classifier, markdown_normalizer
+from blog_pipeline.docx_images import IMAGE_DIR, document_images
+from blog_pipeline.docx_stream import extract_text
+from blog_pipeline.html_render import render_posts
+from blog_pipeline.keyword_classifier import default_classifier
+from blog_pipeline.link_graph import LinkGraph, link_summary, print_broken
+from blog_pipeline.output_stage import OutputStage
+from blog_pipeline.precompress import generated_artifacts, precompress, report
+from blog_pipeline.post_manifest import write_post_manifest
+from blog_pipeline.search_index import write_search_index
+from blog_pipeline.slug_registry import SlugCollision, SlugRegistry
+from blog_pipeline.tracing import NULL_TRACER, Tracer, default_trace_path
+from blog_pipeline.watch import watch_sources
+from blog_pipeline.markdown_normalizer import normalize_markdown
+
+# Bump when the formatting rules change in a way the source hash can't see
+PIPELINE_VERSION = '1'
+
+def read_docx_and_extract_proper_content(blog_num, images=None):
+    """Read the Word doc again and extract content properly"""
+    file_path = f'ChatGPT/Blogs/blog{blog_num}.docx'
+    
+    # Non-empty paragraphs, streamed straight from the docx XML
+    return extract_text(file_path, separator='\n\n', skip_empty=True, images=images)
+
+def extract_blog_metadata(text):
+    """Extract title and create proper frontmatter"""
+    
+    # Find the main title (usually the first # heading)
+    title_match = re.search(r'^#\s+(.+)$', text, re.MULTILINE)
+    if not title_match:
+        # Try to find title in first line
+        lines = text.split('\n')
+        for line in lines[:5]:
+            if len(line) > 10 and not line.startswith('-'):
+                title = line.strip('#').strip()
+                break
+        else:
+            title = "Energy Saving Guide"
+    else:
+        title = title_match.group(1).strip()
+    
+    # Clean title
+    title = title.replace('Blog ', '').replace('blog ', '')
+    title = re.sub(r'^\d+\s*[–-]\s*', '', title)  # Remove "1 - " or "1 – "
+    
+    # Create slug from title
+    slug = title.lower()
+    slug = re.sub(r'[^\w\s-]', '', slug)
+    slug = re.sub(r'[-\s]+', '-', slug)
+    slug = slug[:80]  # Limit length
+    
+    # Extract excerpt (first paragraph after title)
+    excerpt_match = re.search(r'^#[^\n]+\n+(.+?)(?:\n\n|\n#)', text, re.DOTALL)
+    if excerpt_match:
+        excerpt = excerpt_match.group(1).strip()
+        # Take first 150 chars
+        if len(excerpt) > 150:
+            excerpt = excerpt[:147] + '...'
+    else:
+        excerpt = title
+    
+    # Category and tags from the keyword rules, scanning title and body
+    classification = default_classifier().classify(title, text)
+    category = classification.category
+    tags = classification.tags
+    
+    # Estimate read time based on word count
+    word_count = len(text.split())
+    read_time = max(5, min(15, word_count // 200))
+    
+    return {
+        'title': title,
+        'slug': slug,
+        'excerpt': excerpt,
+        'category': category,
+        'tags': tags,
+        'readTime': f"{read_time} min read"
+    }
+
+def create_proper_blog_file(blog_num, stage=None, registry=None, tracer=None, image_dir=IMAGE_DIR):
+    """Create properly formatted blog file, with its images optimised into image_dir (None to skip)"""
+    tracer = tracer or NULL_TRACER
+    with tracer.document(f'blog{blog_num}.docx'):
+        return _create_blog_file(blog_num, stage, registry, tracer, image_dir)
+
+def _create_blog_file(blog_num, stage, registry, tracer, image_dir):
+    if stage is None:
+        stage = OutputStage()
+    
+    print(f"\n🔧 Processing blog{blog_num}.docx...")
+    
+    # Optimise embedded images, then read content from Word doc with references to them
+    images = None
+    if image_dir:
+        with tracer.span('images'):
+            images = document_images(f'ChatGPT/Blogs/blog{blog_num}.docx', image_dir)
+    with tracer.span('extract_text'):
+        text = read_docx_and_extract_proper_content(blog_num, images)
+    
+    # Extract metadata
+    with tracer.span('extract_blog_metadata'):
+        metadata = extract_blog_metadata(text)
+    
+    # Remove any existing "Blog X –" prefixes from the content
+    text = re.sub(r'^Blog\s+\d+\s*[–-]\s*[^\n]+\n+', '', text, flags=re.MULTILINE)
+
+    # Remove the duplicate title if it appears twice
+    lines = text.split('\n')
+    if len(lines) > 1 and lines[0].strip() == lines[1].strip():
+        text = '\n'.join(lines[1:])
+
+    # Headings, lists, blank lines, blockquotes and code fences in one pass
+    with tracer.span('normalize_markdown'):
+        text = normalize_markdown(text)
+
+    # Create frontmatter
+    tags_str = ', '.join([f'"{tag}"' for tag in metadata['tags']])
+
+    frontmatter = f'''---\ntitle: "{metadata['title']}"\ndate: "2025-01-{blog_num:02d}"\nexcerpt: "{metadata['excerpt']}"\ntags: [{tags_str}]\nslug: "{metadata['slug']}"\nauthor: "Cost Saver Team"\nreadTime: "{metadata['readTime']}"\ncategory: "{metadata['category']}"\nfeatured: {str(blog_num <= 3).lower()}\n---'''
+
+    # Combine frontmatter and content
+    final_content = f"{frontmatter}\n\n{text.strip()}"
+
+    # Create filename
+    filename = f"2025-01-{blog_num:02d}-{metadata['slug']}.md"
+    output_path = f"blog/{filename}"
+
+    # Never overwrite a post that belongs to another source
+    if registry is not None:
+        registry.check(f'ChatGPT/Blogs/blog{blog_num}.docx', filename)
+
+    # Write file, leaving it untouched if nothing changed
+    with tracer.span('write'):
+        written = stage.write(output_path, final_content)
+    if written:
+        print(f"✓ Created: {filename}")
+    else:
+        print(f"✓ Unchanged on disk: {filename}")
+    print(f"  Title: {metadata['title']}")
+    print(f"  Category: {metadata['category']}")
+
+    return filename
+
+def update_derived_files(cache, stage, registry, tracer=None, html=False, compress=False):
+    """Save the build cache and slug registry, refresh the search index, HTML renders and
+    manifest, check the links, then write compressed siblings"""
+    tracer = tracer or NULL_TRACER
+    print(f"✍️  Posts: {stage.summary()}")
+    with tracer.span('save_state'):
+        cache.save()
+        registry.save()
+    with tracer.span('search_index'):
+        index_path, indexed, retokenised = write_search_index('blog')
+    print(f"🔎 Updated {index_path} ({indexed} posts, {retokenised} re-tokenised)")
+    if html:
+        with tracer.span('html_render'):
+            rendered, unchanged, _ = render_posts('blog')
+        print(f"📄 Rendered {rendered} posts to HTML ({unchanged} unchanged)")
+    with tracer.span('post_manifest'):
+        manifest_path, post_count, _ = write_post_manifest('blog')
+    print(f"🗂️  Updated {manifest_path} ({post_count} posts)")
+    with tracer.span('link_graph'):
+        graph = LinkGraph('blog')
+    print(f"🔗 Links: {link_summary(graph)}")
+    print_broken(graph)
+    if compress:
+        with tracer.span('precompress'):
+            compressed, results = precompress(generated_artifacts('blog', prompt_dir=None))
+        report(compressed, results)
+
+def watch(cache, registry, html=False, compress=False, image_dir=IMAGE_DIR):
+    """Rebuild blogs as their Word documents are saved until interrupted"""
+    def rebuild(changed, removed):
+        started = time.perf_counter()
+        stage = OutputStage()
+        rebuilt = 0
+        for file_path in changed:
+            match = re.fullmatch(r'blog(\d+)\.docx', os.path.basename(file_path))
+            if not match or not 1 <= int(match.group(1)) <= 12 or cache.is_fresh(file_path):
+                continue
+            try:
+                filename = create_proper_blog_file(int(match.group(1)), stage, registry, image_dir=image_dir)
+                registry.claim(file_path, filename, stage)
+            except Exception as e:
+                print(f"❌ Error processing {os.path.basename(file_path)}: {str(e)}")
+                continue
+            cache.record(file_path, f"blog/{filename}")
+            rebuilt += 1
+        if rebuilt:
+            update_derived_files(cache, stage, registry, html=html, compress=compress)
+            print(f"⚡ Rebuilt {rebuilt} blog(s) in {time.perf_counter() - started:.2f}s")
+
+    print("\n👀 Watching ChatGPT/Blogs for changes (Ctrl+C to stop)...")
+    watch_sources('ChatGPT/Blogs', rebuild)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Rebuild blog posts with proper formatting')
+    parser.add_argument('--force', action='store_true',
+                        help='Rebuild every source, ignoring the build cache')
+    parser.add_argument('--rule-stats', action='store_true',
+                        help='Print keyword rule hit counts for the posts rebuilt (use with --force for all)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and rebuild blogs as their documents are saved')
+    parser.add_argument('--no-images', action='store_true',
+                        help=f'Leave embedded images out instead of optimising them into {IMAGE_DIR}')
+    parser.add_argument('--adopt', action='store_true',
+                        help='Take over posts ingest published for the same documents, replacing them')
+    parser.add_argument('--html', action='store_true',
+                        help='Also pre-render the posts to HTML with a table of contents (blog/rendered/)')
+    parser.add_argument('--compress', action='store_true',
+                        help='Also write .gz (and, with brotli installed, .br) siblings of the generated files')
+    parser.add_argument('--trace', nargs='?', const=default_trace_path('fix_blog_formatting'), metavar='PATH',
+                        help='Record per-stage timings and memory as a Chrome trace '
+                             '(default: %(const)s)')
+    parser.add_argument('--trace-top', type=int, default=10, metavar='N',
+                        help='Slowest documents to list with --trace (default: 10)')
+    args = parser.parse_args(argv)
+
+    print("=" * 70)
+    print("FIXING ALL BLOG POSTS - PROPER FORMATTING")
+    print("=" * 70)
+    
+    created_files = []
+    stage = OutputStage()
+    registry = SlugRegistry('blog', 'format', args.adopt)
+    cache = BuildCache('fix_blog_formatting',
+                       pipeline_fingerprint(PIPELINE_VERSION, __file__, markdown_normalizer.__file__,
+                                            keyword_classifier.__file__, keyword_classifier.RULES_PATH,
+                                            docx_images.__file__, docx_stream.__file__))
+    if args.force:
+        cache.clear()
+    tracer = Tracer() if args.trace else NULL_TRACER
+    image_dir = None if args.no_images else IMAGE_DIR
+    
+    for i in range(1, 13):
+        file_path = f'ChatGPT/Blogs/blog{i}.docx'
+        try:
+            if cache.is_fresh(file_path):
+                print(f"⏭️  Unchanged: blog{i}.docx")
+                filename = os.path.basename(cache.output_for(file_path))
+                registry.claim(file_path, filename, stage)
+                created_files.append(filename)
+                stage.counts['unchanged'] += 1
+                continue
+            filename = create_proper_blog_file(i, stage, registry, tracer, image_dir)
+            registry.claim(file_path, filename, stage)
+            created_files.append(filename)
+            cache.record(file_path, f"blog/{filename}")
+        except SlugCollision as e:
+            # Published by the other pipeline (or another source): leave it be
+            print(f"⚠️  Skipped blog{i}.docx: {str(e)}")
+        except Exception as e:
+            print(f"❌ Error processing blog{i}: {str(e)}")
+            import traceback
+            traceback.print_exc()
+    
+    print()
+    update_derived_files(cache, stage, registry, tracer, args.html, args.compress)
+    if args.trace:
+        tracer.finish(args.trace, args.trace_top)
+    
+    print("\n" + "=" * 70)
+    print(f"✓ COMPLETED: {len(created_files)}/12 blogs successfully processed")
+    print("=" * 70)
+    
+    print("\n📋 Created files:")
+    for f in created_files:
+        print(f"  • {f}")
+
+    if args.rule_stats:
+        print("\n📊 Keyword rule hits:")
+        for line in default_classifier().hit_report():
+            print(line)
+
+    if args.watch:
+        watch(cache, registry, args.html, args.compress, image_dir)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Minimal frontmatter reader for blog posts
+
+Splits a post the same way gray-matter does in lib/blogService.ts and parses
+the flat YAML subset our posts use (quoted strings, [lists], booleans,
+numbers). Anything richer raises FrontmatterError, which is where gray-matter
+would have failed and blogService would have skipped the post.
+"""
+import json
+import re
+
+OPEN_DELIMITER = '---'
+CLOSE_DELIMITER = '\n---'
+
+_KEY_RE = re.compile(r'([A-Za-z_][\w-]*):(?:\s+(.*?))?\s*\Z')
+_NUMBER_RE = re.compile(r'-?\d+(\.\d+)?\Z')
+
+class FrontmatterError(ValueError):
+    """Frontmatter block that isn't the flat key: value YAML we understand"""
+
+def split_frontmatter(text):
+    """Return (frontmatter block, body), or (None, text) if there is no frontmatter.
+
+    Mirrors gray-matter: the block ends at the first '\\n---', and the body
+    starts after it with one leading newline removed.
+    """
+    if not text.startswith(OPEN_DELIMITER) or text[len(OPEN_DELIMITER):][:1] == '-':
+        return None, text
+    rest = text[len(OPEN_DELIMITER):]
+    close = rest.find(CLOSE_DELIMITER)
+    if close == -1:
+        return rest, ''
+    body = rest[close + len(CLOSE_DELIMITER):]
+    if body[:1] == '\r':
+        body = body[1:]
+    if body[:1] == '\n':
+        body = body[1:]
+    return rest[:close], body
+
+def has_frontmatter(text):
+    """Whether a markdown file opens with frontmatter. Posts do; notes kept
+    alongside them in blog/ (BLOG_FORMATTING_STANDARDS.md) don't"""
+    return split_frontmatter(text)[0] is not None
+
+def _parse_scalar(value):
+    if value == '' or value in ('null', '~'):
+        return None
+    if value in ('true', 'false'):
+        return value == 'true'
+    if value[0] == '"' and value[-1] == '"' and len(value) > 1:
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value[1:-1]
+    if value[0] == "'" and value[-1] == "'" and len(value) > 1:
+        return value[1:-1].replace("''", "'")
+    if _NUMBER_RE.match(value):
+        return float(value) if '.' in value else int(value)
+    return value
+
+def _parse_value(value):
+    if value.startswith('[') and value.endswith(']'):
+        try:
+            return json.loads(value)
+        except ValueError:
+            inner = value[1:-1].strip()
+            return [_parse_scalar(item.strip()) for item in inner.split(',')] if inner else []
+    return _parse_scalar(value)
+
+def parse_frontmatter(block):
+    """Parse a frontmatter block into a dict"""
+    data = {}
+    for line in block.split('\n'):
+        line = line.rstrip('\r')
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        match = _KEY_RE.match(stripped)
+        if not match:
+            raise FrontmatterError(f"Unsupported frontmatter line: {stripped[:60]!r}")
+        data[match.group(1)] = _parse_value(match.group(2) or '')
+    return data
+
+def read_post(text):
+    """Return (frontmatter dict, body) for a markdown post"""
+    block, body = split_frontmatter(text)
+    return (parse_frontmatter(block) if block is not None else {}), body
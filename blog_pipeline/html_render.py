@@ -0,0 +1,397 @@
+"""
+Pre-render blog posts to HTML with a table of contents
+
+Renders the markdown our posts actually use, once the normalizer has run:
+ATX headings, paragraphs, nested '-' / '1.' lists, blockquotes, fenced code,
+pipe tables, rules, and inline code, links, images, bold, italic and
+strikethrough. There is no raw-HTML passthrough: every piece of text is
+escaped and only the tags generated here reach the output, and link and
+image URLs are limited to http(s), mailto and site-relative ones, so the
+result is safe to inject with dangerouslySetInnerHTML.
+
+Every heading gets a stable id (GitHub-style: lower case, punctuation
+dropped, spaces to hyphens, -1/-2 suffixes for repeats), and the H2/H3
+headings form the table of contents.
+
+Each post is written to blog/rendered/STEM.json as {"version", "source", "toc",
+"html"}, where source is the SHA-256 of the markdown file it was rendered from
+and version fingerprints this renderer (and docx_images, whose size fragments
+it reads), so editing either re-renders every post. An image's srcset lists
+the variants named in its fragment. The
+manifest lists the rendered file and TOC for posts whose render is current,
+and blogService serves that HTML instead of rendering the markdown.
+
+    python -m blog_pipeline render [blog_dir]
+"""
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+from functools import lru_cache
+
+from blog_pipeline import docx_images
+from blog_pipeline.build_cache import pipeline_fingerprint
+from blog_pipeline.frontmatter import FrontmatterError, read_post
+from blog_pipeline.output_stage import OutputStage
+from blog_pipeline.post_manifest import is_post_file
+
+RENDERED_DIR = 'rendered'
+RENDER_VERSION = 1
+TOC_LEVELS = (2, 3)
+
+_FENCE_RE = re.compile(r'(\s*)(`{3,}|~{3,})\s*([\w+#-]*)')
+_HEADING_RE = re.compile(r'(#{1,6})[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*\Z')
+_RULE_RE = re.compile(r' {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*\Z')
+_LIST_RE = re.compile(r'( *)([-*+•]|\d{1,9}[.)])[ \t]+(.*)')
+_TABLE_SEPARATOR_RE = re.compile(r'\|?[ \t]*:?-+:?[ \t]*(\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*\Z')
+
+_ESCAPABLE_RE = re.compile(r'\\([!-/:-@\[-`{-~])')
+_INLINE_RE = re.compile(
+    r'(?P<code>`+)(?P<code_text>.+?)(?P=code)'
+    r'|!\[(?P<alt>[^\]]*)\]\((?P<src>[^)\s]+)(?:\s+"(?P<img_title>[^"]*)")?\)'
+    r'|\[(?P<label>[^\]]+)\]\((?P<href>[^)\s]+)(?:\s+"(?P<link_title>[^"]*)")?\)'
+    r'|<(?P<autolink>(?:https?://|mailto:)[^>\s]+)>'
+)
+_EMPHASIS = [
+    (re.compile(r'\*\*(?=\S)(.+?)(?<=\S)\*\*'), r'<strong>\1</strong>'),
+    (re.compile(r'(?<!\w)__(?=\S)(.+?)(?<=\S)__(?!\w)'), r'<strong>\1</strong>'),
+    (re.compile(r'(?<![\w*])\*(?=[^\s*])(.+?)(?<=[^\s*])\*(?![\w*])'), r'<em>\1</em>'),
+    (re.compile(r'(?<![\w_])_(?=[^\s_])(.+?)(?<=[^\s_])_(?![\w_])'), r'<em>\1</em>'),
+    (re.compile(r'~~(?=\S)(.+?)(?<=\S)~~'), r'<del>\1</del>'),
+]
+_HARD_BREAK_RE = re.compile(r' {2,}\n')
+_SIZE_FRAGMENT_RE = re.compile(r'#(\d+)x(\d+)((?:,\d+x\d+)*)\Z')
+_VARIANT_RE = re.compile(r'(.*)-\d+x\d+(\.\w+)\Z')
+_SAFE_SCHEME_RE = re.compile(r'(https?|mailto):', re.IGNORECASE)
+_SCHEME_RE = re.compile(r'[a-zA-Z][a-zA-Z0-9+.-]*:')
+_ANCHOR_DROP_RE = re.compile(r'[^\w\- ]')
+_MARKUP_RE = re.compile(r'!?\[([^\]]*)\]\([^)]*\)|[*_`~]')
+
+# Backslash-escaped characters are parked in the private use area while the
+# inline markup is parsed, then put back as literal (escaped) text
+_PARK = 0xE000
+
+def _park(match):
+    return chr(_PARK + ord(match.group(1)))
+
+def _unpark(text):
+    return re.sub('[\ue000-\ue07f]', lambda m: html.escape(chr(ord(m.group(0)) - _PARK)), text)
+
+def _escape(text):
+    return html.escape(text, quote=True)
+
+def safe_url(url):
+    """url if it is http(s), mailto or relative, else '#'"""
+    url = url.strip()
+    if _SCHEME_RE.match(url) and not _SAFE_SCHEME_RE.match(url):
+        return '#'
+    return url
+
+def plain_text(markdown):
+    """Inline markdown reduced to its text, e.g. for anchors and the TOC"""
+    return ' '.join(_MARKUP_RE.sub(r'\1', _ESCAPABLE_RE.sub(r'\1', markdown)).split())
+
+def heading_anchor(text, used):
+    """Stable, unique id for a heading, recording it in used"""
+    base = _ANCHOR_DROP_RE.sub('', plain_text(text).lower()).replace(' ', '-') or 'section'
+    anchor = base
+    suffix = 0
+    while anchor in used:
+        suffix += 1
+        anchor = f'{base}-{suffix}'
+    used.add(anchor)
+    return anchor
+
+def _image(alt, src, title):
+    src = safe_url(src)
+    attributes = [f'src="{_escape(src)}"', f'alt="{_escape(alt)}"']
+    size = _SIZE_FRAGMENT_RE.search(src)
+    if size:
+        width, height = int(size.group(1)), int(size.group(2))
+        src = src[:size.start()]
+        attributes[0] = f'src="{_escape(src)}"'
+        attributes += [f'width="{width}"', f'height="{height}"']
+        variant = _VARIANT_RE.match(src)
+        smaller = [pair.split('x') for pair in size.group(3).split(',')[1:]]
+        if variant and smaller:
+            # The variants docx_images listed after the size, as BlogPostClient reads them
+            candidates = [f'{variant.group(1)}-{w}x{h}{variant.group(2)} {w}w' for w, h in smaller]
+            candidates.append(f'{src} {width}w')
+            attributes += [f'srcset="{_escape(", ".join(candidates))}"',
+                           'sizes="(min-width: 896px) 896px, 100vw"']
+    if title:
+        attributes.append(f'title="{_escape(title)}"')
+    attributes += ['loading="lazy"', 'decoding="async"']
+    return f'<img {" ".join(attributes)}>'
+
+def _text(text):
+    text = _escape(text)
+    for pattern, replacement in _EMPHASIS:
+        text = pattern.sub(replacement, text)
+    return _HARD_BREAK_RE.sub('<br>\n', text)
+
+def render_inline(text):
+    """Inline markdown to HTML"""
+    text = _ESCAPABLE_RE.sub(_park, text)
+    out = []
+    position = 0
+    for match in _INLINE_RE.finditer(text):
+        out.append(_text(text[position:match.start()]))
+        position = match.end()
+        if match.group('code'):
+            out.append(f'<code>{_unpark_code(match.group("code_text").strip())}</code>')
+        elif match.group('src') is not None:
+            out.append(_image(_unpark_raw(match.group('alt')), _unpark_raw(match.group('src')),
+                              _unpark_raw(match.group('img_title') or '')))
+        elif match.group('href') is not None:
+            href = safe_url(_unpark_raw(match.group('href')))
+            title = match.group('link_title')
+            title_attribute = f' title="{_escape(_unpark_raw(title))}"' if title else ''
+            out.append(f'<a href="{_escape(href)}"{title_attribute}>{_text(match.group("label"))}</a>')
+        else:
+            url = match.group('autolink')
+            out.append(f'<a href="{_escape(safe_url(url))}">{_escape(url)}</a>')
+    out.append(_text(text[position:]))
+    return _unpark(''.join(out))
+
+def _unpark_raw(text):
+    return re.sub('[\ue000-\ue07f]', lambda m: chr(ord(m.group(0)) - _PARK), text)
+
+def _unpark_code(text):
+    # Backslashes are literal inside code spans
+    return _escape(re.sub('[\ue000-\ue07f]', lambda m: '\\' + chr(ord(m.group(0)) - _PARK), text))
+
+def _split_row(line):
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    return [cell.strip() for cell in re.split(r'(?<!\\)\|', line)]
+
+def _alignment(cell):
+    cell = cell.strip()
+    if cell.startswith(':') and cell.endswith(':'):
+        return 'center'
+    if cell.endswith(':'):
+        return 'right'
+    if cell.startswith(':'):
+        return 'left'
+    return None
+
+class _Renderer:
+    def __init__(self):
+        self.toc = []
+        self.anchors = set()
+
+    def blocks(self, lines):
+        out = []
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            if not line.strip():
+                i += 1
+                continue
+            fence = _FENCE_RE.match(line)
+            if fence and fence.end() == len(line.rstrip()):
+                i = self._code(lines, i, fence, out)
+                continue
+            heading = _HEADING_RE.match(line)
+            if heading:
+                self._heading(len(heading.group(1)), heading.group(2), out)
+                i += 1
+                continue
+            if _RULE_RE.match(line):
+                out.append('<hr>')
+                i += 1
+                continue
+            if line.lstrip().startswith('>'):
+                i = self._blockquote(lines, i, out)
+                continue
+            if _LIST_RE.match(line):
+                i = self._list(lines, i, out)
+                continue
+            if '|' in line and i + 1 < len(lines) and _TABLE_SEPARATOR_RE.match(lines[i + 1].strip()):
+                i = self._table(lines, i, out)
+                continue
+            i = self._paragraph(lines, i, out)
+        return out
+
+    def _starts_block(self, line):
+        return (not line.strip() or _HEADING_RE.match(line) or _RULE_RE.match(line)
+                or line.lstrip().startswith('>') or _FENCE_RE.match(line) or _LIST_RE.match(line))
+
+    def _code(self, lines, i, fence, out):
+        marker = fence.group(2)
+        language = fence.group(3)
+        body = []
+        i += 1
+        while i < len(lines) and not lines[i].strip().startswith(marker):
+            body.append(lines[i])
+            i += 1
+        class_attribute = f' class="language-{_escape(language)}"' if language else ''
+        out.append(f'<pre><code{class_attribute}>{_escape(chr(10).join(body))}\n</code></pre>')
+        return i + 1
+
+    def _heading(self, level, text, out):
+        anchor = heading_anchor(text, self.anchors)
+        if level in TOC_LEVELS:
+            self.toc.append({'id': anchor, 'text': plain_text(text), 'level': level})
+        out.append(f'<h{level} id="{anchor}">{render_inline(text)}</h{level}>')
+
+    def _blockquote(self, lines, i, out):
+        inner = []
+        while i < len(lines) and lines[i].strip() and (lines[i].lstrip().startswith('>') or inner):
+            line = lines[i].lstrip()
+            if line.startswith('>'):
+                line = line[2:] if line.startswith('> ') else line[1:]
+            elif self._starts_block(lines[i]):
+                break
+            inner.append(line)
+            i += 1
+        out.append('<blockquote>\n' + '\n'.join(self.blocks(inner)) + '\n</blockquote>')
+        return i
+
+    def _list(self, lines, i, out):
+        first = _LIST_RE.match(lines[i])
+        indent = len(first.group(1))
+        ordered = first.group(2)[0].isdigit()
+        items = []
+        while i < len(lines):
+            line = lines[i]
+            match = _LIST_RE.match(line)
+            if match and len(match.group(1)) == indent and match.group(2)[0].isdigit() == ordered:
+                items.append([match.group(3)])
+                i += 1
+            elif match and len(match.group(1)) > indent and items:
+                nested = []
+                i = self._list(lines, i, nested)
+                items[-1].append(nested[0])
+            elif line.strip() and items and line.startswith(' ' * (indent + 2)) and not match:
+                items[-1][0] += '\n' + line.strip()
+                i += 1
+            elif not line.strip() and i + 1 < len(lines) and (
+                    (_LIST_RE.match(lines[i + 1]) and len(_LIST_RE.match(lines[i + 1]).group(1)) >= indent)):
+                i += 1  # a blank line between items keeps the list going
+            else:
+                break
+        tag = 'ol' if ordered else 'ul'
+        start = int(first.group(2)[:-1]) if ordered else 1
+        start_attribute = f' start="{start}"' if start != 1 else ''
+        rendered = []
+        for text, *nested in items:
+            rendered.append(f'<li>{render_inline(text.rstrip())}{"".join(nested)}</li>')
+        out.append(f'<{tag}{start_attribute}>\n' + '\n'.join(rendered) + f'\n</{tag}>')
+        return i
+
+    def _table(self, lines, i, out):
+        header = _split_row(lines[i])
+        alignments = [_alignment(cell) for cell in _split_row(lines[i + 1])]
+        i += 2
+        rows = []
+        while i < len(lines) and '|' in lines[i] and lines[i].strip():
+            rows.append(_split_row(lines[i]))
+            i += 1
+
+        def cells(row, tag):
+            rendered = []
+            for index in range(len(header)):
+                text = row[index] if index < len(row) else ''
+                align = alignments[index] if index < len(alignments) else None
+                style = f' style="text-align:{align}"' if align else ''
+                rendered.append(f'<{tag}{style}>{render_inline(text)}</{tag}>')
+            return '<tr>' + ''.join(rendered) + '</tr>'
+
+        body = '\n'.join(cells(row, 'td') for row in rows)
+        out.append(f'<table>\n<thead>\n{cells(header, "th")}\n</thead>\n'
+                   + (f'<tbody>\n{body}\n</tbody>\n' if rows else '') + '</table>')
+        return i
+
+    def _paragraph(self, lines, i, out):
+        text = [lines[i].strip() if not lines[i].endswith('  ') else lines[i].lstrip()]
+        i += 1
+        while i < len(lines) and not self._starts_block(lines[i]):
+            if '|' in lines[i] and i + 1 < len(lines) and _TABLE_SEPARATOR_RE.match(lines[i + 1].strip()):
+                break
+            text.append(lines[i].strip() if not lines[i].endswith('  ') else lines[i].lstrip())
+            i += 1
+        out.append(f'<p>{render_inline(chr(10).join(text))}</p>')
+        return i
+
+def render_markdown(markdown):
+    """(html, toc) for a markdown body; toc is [{'id', 'text', 'level'}] for H2/H3"""
+    renderer = _Renderer()
+    blocks = renderer.blocks(markdown.replace('\r\n', '\n').expandtabs(4).split('\n'))
+    return '\n'.join(blocks) + '\n', renderer.toc
+
+def rendered_name(filename):
+    """Rendered file for a post, relative to the blog directory"""
+    return f'{RENDERED_DIR}/{filename[:-len(".md")]}.json'
+
+@lru_cache(maxsize=None)
+def render_fingerprint():
+    """RENDER_VERSION plus the code that shapes a render, stored with every render"""
+    return pipeline_fingerprint(RENDER_VERSION, __file__, docx_images.__file__)
+
+def source_digest(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def read_rendered(blog_dir, filename, text):
+    """The stored render of a post if it was made from exactly this text, else None"""
+    try:
+        with open(os.path.join(blog_dir, rendered_name(filename)), 'r', encoding='utf-8') as f:
+            rendered = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if rendered.get('version') != render_fingerprint() or rendered.get('source') != source_digest(text):
+        return None
+    return rendered
+
+def render_posts(blog_dir='blog', stage=None):
+    """Render every post in blog_dir whose markdown changed, and drop renders of removed posts.
+
+    Returns (rendered, unchanged, failed filenames).
+    """
+    if stage is None:
+        stage = OutputStage()
+    rendered_dir = os.path.join(blog_dir, RENDERED_DIR)
+    wanted = set()
+    rendered = unchanged = 0
+    failed = []
+    for filename in sorted(os.listdir(blog_dir)):
+        if not is_post_file(filename):
+            continue
+        with open(os.path.join(blog_dir, filename), 'r', encoding='utf-8', newline='') as f:
+            text = f.read()
+        wanted.add(os.path.basename(rendered_name(filename)))
+        if read_rendered(blog_dir, filename, text) is not None:
+            unchanged += 1
+            continue
+        try:
+            _, body = read_post(text)
+        except FrontmatterError:
+            failed.append(filename)
+            continue
+        html_text, toc = render_markdown(body)
+        stage.write(os.path.join(blog_dir, rendered_name(filename)), json.dumps(
+            {'version': render_fingerprint(), 'source': source_digest(text), 'toc': toc, 'html': html_text},
+            ensure_ascii=False, separators=(',', ':')))
+        rendered += 1
+    if os.path.isdir(rendered_dir):
+        for name in os.listdir(rendered_dir):
+            if name.endswith('.json') and name not in wanted:
+                stage.delete(os.path.join(rendered_dir, name))
+    return rendered, unchanged, failed
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    blog_dir = argv[0] if argv else 'blog'
+    rendered, unchanged, failed = render_posts(blog_dir)
+    print(f"✓ Rendered {rendered} posts to {os.path.join(blog_dir, RENDERED_DIR)} ({unchanged} unchanged)")
+    for filename in failed:
+        print(f"⚠️  Skipped {filename}: unparseable frontmatter")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,555 @@
+"""
+Process all enhanced blog posts from ChatGPT and create markdown files
+
+    python -m blog_pipeline ingest [--all] [--watch] ...
+"""
+import argparse
+import contextlib
+import io
+import os
+import re
+import time
+from datetime import datetime
+
+from blog_pipeline.build_cache import BuildCache, pipeline_fingerprint
+from blog_pipeline.combined_output import iter_lines, split_posts
+from blog_pipeline import docx_images, docx_stream
+from blog_pipeline.docx_images import IMAGE_DIR, document_images
+from blog_pipeline.docx_stream import extract_text
+from blog_pipeline.html_render import render_posts
+from blog_pipeline.link_graph import LinkGraph, link_summary, print_broken
+from blog_pipeline.output_stage import DeferredStage, OutputStage
+from blog_pipeline.precompress import generated_artifacts, precompress, report
+from blog_pipeline.post_manifest import write_post_manifest
+from blog_pipeline.search_index import write_search_index
+from blog_pipeline.slug_registry import SlugCollision, SlugRegistry
+from blog_pipeline.tracing import NULL_TRACER, Tracer, default_trace_path
+from blog_pipeline.watch import watch_sources
+
+# Bump when the conversion rules change in a way the source hash can't see
+PIPELINE_VERSION = '1'
+
+def extract_text_from_docx(file_path, images=None):
+    """Extract all text from a Word document"""
+    return extract_text(file_path, images=images)
+
+def parse_blog_content(text):
+    """Parse the blog content to extract frontmatter and markdown"""
+    # Look for frontmatter markers
+    frontmatter_pattern = r'---\s*\n(.*?)\n---\s*\n(.*)'
+    match = re.search(frontmatter_pattern, text, re.DOTALL)
+    
+    if match:
+        frontmatter = match.group(1)
+        content = match.group(2)
+        return frontmatter, content
+    else:
+        # If no proper frontmatter, try to extract it manually
+        return None, text
+
+def extract_slug_from_frontmatter(frontmatter):
+    """Extract slug from frontmatter"""
+    slug_match = re.search(r'slug:\s*["\']?([^"\'\n]+)["\']?', frontmatter)
+    if slug_match:
+        return slug_match.group(1).strip()
+    return None
+
+def extract_date_from_frontmatter(frontmatter):
+    """Extract date from frontmatter"""
+    date_match = re.search(r'date:\s*["\']?([^"\'\n]+)["\']?', frontmatter)
+    if date_match:
+        return date_match.group(1).strip()
+    return None
+
+def clean_frontmatter(frontmatter):
+    """Clean and standardize frontmatter"""
+    lines = frontmatter.split('\n')
+    cleaned_lines = []
+    
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            # Remove any markdown formatting from frontmatter
+            line = line.replace('**', '').replace('*', '')
+            cleaned_lines.append(line)
+    
+    return '\n'.join(cleaned_lines)
+
+def process_blog_file(blog_num, blogs_dir, output_dir, file_path=None, stage=None, registry=None, tracer=None,
+                      image_dir=IMAGE_DIR, image_workers=None, duplicates=None):
+    """Process a single blog file.
+
+    Embedded images are optimised into image_dir (None to leave them out)
+    and referenced from the markdown where they appeared. With a
+    DuplicateIndex, a near-duplicate of another post is refused.
+    """
+    if file_path is None:
+        file_path = os.path.join(blogs_dir, f'blog{blog_num}.docx')
+    tracer = tracer or NULL_TRACER
+    with tracer.document(os.path.basename(file_path)):
+        return _convert_blog_file(blog_num, output_dir, file_path, stage, registry, tracer,
+                                  image_dir, image_workers, duplicates)
+
+def _convert_blog_file(blog_num, output_dir, file_path, stage, registry, tracer, image_dir, image_workers,
+                       duplicates):
+    if stage is None:
+        stage = OutputStage()
+    source_name = os.path.basename(file_path)
+    
+    if not os.path.exists(file_path):
+        print(f"⚠️  File not found: {source_name}")
+        return None
+    
+    print(f"\n📄 Processing {source_name}...")
+    
+    # Optimise embedded images, then extract text with references to them
+    images = None
+    if image_dir:
+        with tracer.span('images'):
+            images = document_images(file_path, image_dir, image_workers)
+    with tracer.span('extract_text'):
+        text = extract_text_from_docx(file_path, images)
+    return convert_post_text(blog_num, text, output_dir, file_path, stage, registry, tracer, duplicates)
+
+def convert_post_text(blog_num, text, output_dir, source, stage, registry=None, tracer=None, duplicates=None):
+    """Write one post's extracted text as markdown, registered against source. Returns its filename"""
+    tracer = tracer or NULL_TRACER
+    source_name = os.path.basename(source)
+    
+    # Parse frontmatter and content
+    with tracer.span('parse_blog_content'):
+        frontmatter, content = parse_blog_content(text)
+    
+    if not frontmatter:
+        print(f"⚠️  Could not find frontmatter in {source_name}, attempting manual extraction...")
+        # Try to find title and create basic frontmatter
+        title_match = re.search(r'^#\s+(.+)$', text, re.MULTILINE)
+        if title_match:
+            title = title_match.group(1)
+            # Create slug from title
+            slug = re.sub(r'[^\w\s-]', '', title.lower())
+            slug = re.sub(r'[-\s]+', '-', slug)
+            
+            # Create basic frontmatter
+            frontmatter = f'''title: "{title}"
+date: "2025-01-{blog_num:02d}"
+excerpt: "{title}"
+tags: ["energy", "savings", "uk"]
+slug: "{slug}"
+author: "Cost Saver Team"
+readTime: "8 min read"
+category: "guides"
+featured: false'''
+            content = text
+    else:
+        frontmatter = clean_frontmatter(frontmatter)
+    
+    # Extract slug and date for filename
+    slug = extract_slug_from_frontmatter(frontmatter)
+    date = extract_date_from_frontmatter(frontmatter)
+    
+    if not slug:
+        # Generate slug from blog number
+        slug = f"blog-post-{blog_num}"
+        print(f"⚠️  No slug found, using: {slug}")
+    
+    if not date:
+        date = f"2025-01-{blog_num:02d}"
+        print(f"⚠️  No date found, using: {date}")
+    
+    # Clean the date for filename (remove quotes and extra chars)
+    date_clean = date.replace('"', '').replace("'", '').strip()
+    
+    # Create filename
+    filename = f"{date_clean}-{slug}.md"
+    output_path = os.path.join(output_dir, filename)
+    
+    # Create final markdown content
+    final_content = f"---\n{frontmatter}\n---\n\n{content.strip()}"
+    
+    # Never overwrite a post that belongs to another source
+    if registry is not None:
+        registry.check(source, filename)
+    
+    # Nor one that is a rewrite of another source's post
+    if duplicates is not None:
+        with tracer.span('near_duplicates'):
+            previous = registry.output_for(source) if registry is not None else None
+            duplicates.check(filename, final_content, ignore=[previous] if previous else [])
+    
+    # Write to file, leaving it untouched if nothing changed
+    with tracer.span('write'):
+        written = stage.write(output_path, final_content)
+    if written:
+        print(f"✓ Created: {filename}")
+    else:
+        print(f"✓ Unchanged on disk: {filename}")
+    if duplicates is not None:
+        duplicates.add_post(filename, final_content)
+    return filename
+
+def _natural_sort_key(path):
+    """Sort blog2.docx before blog10.docx"""
+    return [int(part) if part.isdigit() else part.lower()
+            for part in re.split(r'(\d+)', path)]
+
+def discover_docx_files(blogs_dir):
+    """Find every .docx under the input directory, in a stable order"""
+    found = []
+    for root, dirs, files in os.walk(blogs_dir):
+        dirs.sort()
+        for name in files:
+            # Skip Word lock files like ~$blog1.docx
+            if name.lower().endswith('.docx') and not name.startswith('~$'):
+                found.append(os.path.join(root, name))
+    return sorted(found, key=_natural_sort_key)
+
+def _blog_number(file_path, position):
+    """Use the N in blogN.docx, falling back to the discovery position"""
+    match = re.match(r'blog(\d+)\.docx$', os.path.basename(file_path), re.IGNORECASE)
+    return int(match.group(1)) if match else position
+
+def _process_job(job, tracer=None):
+    """Worker entry point: convert one document and capture its log output.
+
+    Nothing is written: the post comes back as (path, bytes) writes for the
+    parent to apply once it has claimed the slug. With tracing on, a worker records into its own Tracer and returns the
+    events for the parent to merge; in-process jobs record into tracer.
+    """
+    blog_num, file_path, output_dir, registry, trace, image_dir, duplicates = job
+    local_tracer = Tracer() if trace and tracer is None else None
+    log = io.StringIO()
+    stage = DeferredStage()
+    filename, error = None, None
+    with contextlib.redirect_stdout(log):
+        try:
+            filename = process_blog_file(blog_num, None, output_dir, file_path=file_path,
+                                         stage=stage, registry=registry, tracer=tracer or local_tracer,
+                                         image_dir=image_dir, image_workers=1, duplicates=duplicates)
+        except Exception as e:
+            error = str(e)
+    events = []
+    if local_tracer is not None:
+        local_tracer.stop()
+        events = local_tracer.events
+    return file_path, filename, error, log.getvalue(), stage.counts, stage.writes, events
+
+def open_duplicate_index(output_dir, block=True):
+    """Near-duplicate index over the posts in output_dir, or None without NumPy"""
+    try:
+        from blog_pipeline.near_duplicates import load_index
+    except ImportError:
+        print("⚠️  NumPy is not installed: skipping the near-duplicate check")
+        return None
+    return load_index(output_dir, block=block)
+
+def open_build_cache(output_dir):
+    """Build manifest for this script and output directory, keyed on its rules"""
+    return BuildCache(f'process_enhanced_blogs:{output_dir}',
+                      pipeline_fingerprint(PIPELINE_VERSION, __file__, docx_images.__file__,
+                                           docx_stream.__file__))
+
+def process_all(blogs_dir, output_dir, workers=None, cache=None, stage=None, registry=None, tracer=None,
+                image_dir=IMAGE_DIR, duplicates=None):
+    """Convert every discovered .docx across a process pool.
+
+    Returns (file_path, filename, error, log) tuples in discovery order,
+    whatever order the workers finish in. Sources the cache reports as
+    unchanged are not sent to the pool. Each worker's write counts are
+    merged into stage, and each output is claimed in the slug registry,
+    which deletes a source's previous post if its slug changed. Workers
+    only render: each post is written here, in discovery order, after its
+    slug has been claimed, so a source that loses a slug to an earlier one
+    in the same batch never overwrites it. Worker trace events are merged
+    into tracer. Workers check their posts against the duplicates index as
+    it was before the batch; the posts of the batch are then checked against
+    each other here.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if stage is None:
+        stage = OutputStage()
+    tracer = tracer or NULL_TRACER
+    jobs = [(_blog_number(path, position), path, output_dir, registry, tracer.enabled, image_dir, duplicates)
+            for position, path in enumerate(discover_docx_files(blogs_dir), start=1)]
+    results = {}
+    pending = []
+    for job in jobs:
+        file_path = job[1]
+        if cache is not None and cache.is_fresh(file_path):
+            filename = os.path.basename(cache.output_for(file_path))
+            log = f"⏭️  Unchanged: {os.path.basename(file_path)}\n"
+            try:
+                if registry is not None:
+                    registry.claim(file_path, filename, stage)
+            except SlugCollision as e:
+                results[file_path] = (file_path, None, str(e), log)
+                continue
+            results[file_path] = (file_path, filename, None, log)
+            stage.counts['unchanged'] += 1
+        else:
+            pending.append(job)
+    if pending:
+        pooled = workers != 1
+        if not pooled:
+            built = [_process_job(job, tracer if tracer.enabled else None) for job in pending]
+        else:
+            workers = min(workers or os.cpu_count() or 1, len(pending))
+            # Small chunks keep the pool busy when a few documents are much larger than the rest
+            chunksize = max(1, len(pending) // (workers * 4))
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                built = list(executor.map(_process_job, pending, chunksize=chunksize))
+        for file_path, filename, error, log, counts, writes, events in built:
+            stage.merge(counts)
+            tracer.merge(events)
+            if filename and not error:
+                error = _publish(file_path, filename, writes, stage, registry, duplicates if pooled else None)
+            if cache is not None and filename and not error:
+                cache.record(file_path, os.path.join(output_dir, filename))
+            results[file_path] = (file_path, filename, error, log)
+    return [results[job[1]] for job in jobs]
+
+def _publish(file_path, filename, writes, stage, registry, duplicates):
+    """Claim a worker's post and apply its writes. Returns the error, or None.
+
+    With duplicates (a pooled batch), the post is first checked against the
+    posts published earlier in the batch, which its worker couldn't see.
+    """
+    text = writes[-1][1].decode('utf-8') if writes else None
+    try:
+        if duplicates is not None and text is not None:
+            previous = registry.output_for(file_path) if registry is not None else None
+            duplicates.check(filename, text, ignore=[previous] if previous else [])
+        if registry is not None:
+            # Two sources in the same batch may have produced the same slug
+            registry.claim(file_path, filename, stage)
+    except ValueError as e:  # SlugCollision or NearDuplicate
+        return str(e)
+    for path, data in writes:
+        stage.write(path, data)
+    if duplicates is not None and text is not None:
+        duplicates.add_post(filename, text)
+    return None
+
+def process_combined(path, output_dir, stage=None, registry=None, tracer=None, image_dir=IMAGE_DIR,
+                     duplicates=None):
+    """Convert every post in one combined ChatGPT reply (.docx or .txt).
+
+    The reply is streamed and each post is written as soon as the next one's
+    frontmatter is found, so memory is bounded by one post. Posts are
+    registered as PATH#SLUG, so reordering the reply doesn't disturb them.
+    Returns the filenames written.
+    """
+    if stage is None:
+        stage = OutputStage()
+    tracer = tracer or NULL_TRACER
+    name = os.path.basename(path)
+    if not os.path.exists(path):
+        print(f"⚠️  File not found: {name}")
+        return []
+    os.makedirs(output_dir, exist_ok=True)
+    images = None
+    if image_dir and path.lower().endswith('.docx'):
+        with tracer.span('images'):
+            images = document_images(path, image_dir)
+    created = []
+    for position, text in enumerate(split_posts(iter_lines(path, images)), start=1):
+        frontmatter, _ = parse_blog_content(text)
+        slug = extract_slug_from_frontmatter(frontmatter) if frontmatter else None
+        source = f"{path}#{slug or position}"
+        print(f"\n📄 Processing post {position} of {name}...")
+        try:
+            with tracer.document(f"{name}#{position}"):
+                filename = convert_post_text(position, text, output_dir, source, stage, registry, tracer,
+                                             duplicates)
+            if registry is not None:
+                registry.claim(source, filename, stage)
+        except ValueError as e:  # SlugCollision or NearDuplicate
+            print(f"❌ Error processing post {position} of {name}: {str(e)}")
+            continue
+        created.append(filename)
+    return created
+
+def update_derived_files(output_dir, cache, stage, registry, tracer=None, html=False, compress=False):
+    """Save the build cache and slug registry, refresh the search index, HTML renders and
+    manifest, check the links, then write compressed siblings"""
+    tracer = tracer or NULL_TRACER
+    print(f"✍️  Posts: {stage.summary()}")
+    with tracer.span('save_state'):
+        cache.save()
+        registry.save()
+    with tracer.span('search_index'):
+        index_path, indexed, retokenised = write_search_index(output_dir)
+    print(f"🔎 Updated {index_path} ({indexed} posts, {retokenised} re-tokenised)")
+    if html:
+        with tracer.span('html_render'):
+            rendered, unchanged, _ = render_posts(output_dir)
+        print(f"📄 Rendered {rendered} posts to HTML ({unchanged} unchanged)")
+    with tracer.span('post_manifest'):
+        manifest_path, post_count, _ = write_post_manifest(output_dir)
+    print(f"🗂️  Updated {manifest_path} ({post_count} posts)")
+    with tracer.span('link_graph'):
+        graph = LinkGraph(output_dir)
+    print(f"🔗 Links: {link_summary(graph)}")
+    print_broken(graph)
+    if compress:
+        with tracer.span('precompress'):
+            compressed, results = precompress(generated_artifacts(output_dir, prompt_dir=None))
+        report(compressed, results)
+
+def watch(blogs_dir, output_dir, cache, registry, all_sources=False, html=False, compress=False,
+          duplicates=None, image_dir=IMAGE_DIR):
+    """Reconvert documents as they are saved until interrupted"""
+    def wanted(file_path):
+        return all_sources or re.fullmatch(r'blog(\d+)\.docx', os.path.basename(file_path)) is not None
+
+    def rebuild(changed, removed):
+        started = time.perf_counter()
+        stage = OutputStage()
+        positions = {path: position for position, path in enumerate(discover_docx_files(blogs_dir), start=1)}
+        rebuilt = 0
+        for file_path in changed:
+            # Saving without edits touches the file but leaves its hash alone
+            if not wanted(file_path) or cache.is_fresh(file_path):
+                continue
+            try:
+                filename = process_blog_file(_blog_number(file_path, positions.get(file_path, 0)),
+                                             blogs_dir, output_dir, file_path=file_path,
+                                             stage=stage, registry=registry, image_dir=image_dir,
+                                             duplicates=duplicates)
+            except Exception as e:
+                print(f"❌ Error processing {os.path.basename(file_path)}: {str(e)}")
+                continue
+            if filename:
+                registry.claim(file_path, filename, stage)
+                cache.record(file_path, os.path.join(output_dir, filename))
+                rebuilt += 1
+        for file_path in removed:
+            if not wanted(file_path):
+                continue
+            cache.forget(file_path)
+            deleted = registry.release(file_path, stage)
+            if deleted:
+                print(f"🗑️  Source removed: {os.path.basename(file_path)}, deleted {deleted}")
+                rebuilt += 1
+        if rebuilt:
+            update_derived_files(output_dir, cache, stage, registry, html=html, compress=compress)
+            print(f"⚡ Rebuilt {rebuilt} post(s) in {time.perf_counter() - started:.2f}s")
+
+    print(f"\n👀 Watching {blogs_dir} for changes (Ctrl+C to stop)...")
+    watch_sources(blogs_dir, rebuild)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Convert enhanced ChatGPT blog documents to markdown')
+    parser.add_argument('--input', default='ChatGPT/Blogs', help='Directory containing the .docx sources')
+    parser.add_argument('--output', default='blog', help='Directory to write markdown posts to')
+    parser.add_argument('--all', action='store_true',
+                        help='Discover every .docx under --input instead of blog1-12.docx')
+    parser.add_argument('--combined', metavar='PATH',
+                        help='Split one combined ChatGPT reply (.docx or .txt) into posts instead')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for --all (default: one per CPU core)')
+    parser.add_argument('--force', action='store_true',
+                        help='Rebuild every source, ignoring the build cache')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and reconvert documents as they are saved')
+    parser.add_argument('--image-dir', default=IMAGE_DIR,
+                        help=f'Where optimised images from the documents go (default: {IMAGE_DIR})')
+    parser.add_argument('--no-images', action='store_true',
+                        help='Leave embedded images out of the generated posts')
+    parser.add_argument('--adopt', action='store_true',
+                        help='Take over posts format published for the same documents, replacing them')
+    parser.add_argument('--allow-duplicates', action='store_true',
+                        help='Write near-duplicates of existing posts with a warning instead of refusing them')
+    parser.add_argument('--html', action='store_true',
+                        help='Also pre-render the posts to HTML with a table of contents (blog/rendered/)')
+    parser.add_argument('--compress', action='store_true',
+                        help='Also write .gz (and, with brotli installed, .br) siblings of the generated files')
+    parser.add_argument('--trace', nargs='?', const=default_trace_path('process_enhanced_blogs'), metavar='PATH',
+                        help='Record per-stage timings and memory as a Chrome trace '
+                             '(default: %(const)s)')
+    parser.add_argument('--trace-top', type=int, default=10, metavar='N',
+                        help='Slowest documents to list with --trace (default: 10)')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    blogs_dir = args.input
+    output_dir = args.output
+    
+    print("=" * 60)
+    print("PROCESSING ENHANCED BLOG POSTS")
+    print("=" * 60)
+    
+    created_files = []
+    stage = OutputStage()
+    registry = SlugRegistry(output_dir, 'ingest', args.adopt)
+    cache = open_build_cache(output_dir)
+    if args.force:
+        cache.clear()
+    tracer = Tracer() if args.trace else NULL_TRACER
+    image_dir = None if args.no_images else args.image_dir
+    duplicates = open_duplicate_index(output_dir, block=not args.allow_duplicates)
+    
+    if args.combined:
+        # One reply holding every post, split as it streams
+        created_files = process_combined(args.combined, output_dir, stage, registry, tracer, image_dir,
+                                         duplicates)
+    elif args.all:
+        # Fan the whole directory out across a process pool
+        for file_path, filename, error, log in process_all(blogs_dir, output_dir, args.workers, cache, stage,
+                                                           registry, tracer, image_dir, duplicates):
+            print(log, end='')
+            if error:
+                print(f"❌ Error processing {os.path.basename(file_path)}: {error}")
+            elif filename:
+                created_files.append(filename)
+    else:
+        # Process all 12 blogs
+        for i in range(1, 13):
+            file_path = os.path.join(blogs_dir, f'blog{i}.docx')
+            try:
+                if cache.is_fresh(file_path):
+                    print(f"⏭️  Unchanged: blog{i}.docx")
+                    filename = os.path.basename(cache.output_for(file_path))
+                    registry.claim(file_path, filename, stage)
+                    created_files.append(filename)
+                    stage.counts['unchanged'] += 1
+                    continue
+                filename = process_blog_file(i, blogs_dir, output_dir, stage=stage, registry=registry,
+                                             tracer=tracer, image_dir=image_dir, duplicates=duplicates)
+                if filename:
+                    registry.claim(file_path, filename, stage)
+                    created_files.append(filename)
+                    cache.record(file_path, os.path.join(output_dir, filename))
+            except SlugCollision as e:
+                # Published by the other pipeline (or another source): leave it be
+                print(f"⚠️  Skipped blog{i}.docx: {str(e)}")
+            except Exception as e:
+                print(f"❌ Error processing blog{i}.docx: {str(e)}")
+                continue
+    
+    print()
+    update_derived_files(output_dir, cache, stage, registry, tracer, args.html, args.compress)
+    if args.trace:
+        tracer.finish(args.trace, args.trace_top)
+    
+    print("\n" + "=" * 60)
+    print(f"✓ COMPLETED: {len(created_files)} blog posts created")
+    print("=" * 60)
+    
+    print("\nCreated files:")
+    for filename in created_files:
+        print(f"  • {filename}")
+    
+    print("\n📋 Next steps:")
+    print("1. Review the created markdown files in /blog folder")
+    print("2. Commit changes: git add blog/ && git commit -m 'Add 12 enhanced blog posts'")
+    print("3. Deploy: git push")
+    
+    if args.watch:
+        watch(blogs_dir, output_dir, cache, registry, all_sources=args.all, html=args.html, compress=args.compress,
+              duplicates=duplicates, image_dir=image_dir)
+
+if __name__ == '__main__':
+    main()
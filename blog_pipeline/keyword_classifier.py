@@ -0,0 +1,172 @@
+"""
+Keyword classifier for blog post categories and tags
+
+The rules live in keyword_rules.json: each category and tag lists the
+keywords that count towards it. Every keyword from every rule is compiled into
+one Aho-Corasick automaton, so a post's title and body are scanned once,
+character by character, whatever the number of rules. Each hit is weighted by
+where it occurs (title, heading or body text); the best-scoring category wins
+and every tag that reaches its minimum score is added.
+
+Hit counts are kept per rule and keyword across every post classified, for
+tuning the rules:
+
+    python -m blog_pipeline.keyword_classifier blog/*.md
+"""
+import json
+import os
+import sys
+from collections import Counter, namedtuple, deque
+
+RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'keyword_rules.json')
+
+Classification = namedtuple('Classification', ['category', 'tags', 'scores', 'hits'])
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over lowercase keywords.
+
+    Matches only count where the keyword starts a word, so 'bill' finds
+    'bills' but not 'rebill', the same way the old substring checks read.
+    """
+
+    def __init__(self, keywords):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        for keyword in keywords:
+            state = 0
+            for ch in keyword:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                    self._goto[state][ch] = next_state
+                state = next_state
+            self._out[state] += (keyword,)
+
+        # Breadth-first, so each fail target is finished before it is used
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] += self._out[self._fail[next_state]]
+
+    def iter_matches(self, text):
+        """Yield (start, keyword) for every keyword occurrence in text"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for keyword in out[state]:
+                start = index - len(keyword) + 1
+                if start == 0 or not text[start - 1].isalnum():
+                    yield start, keyword
+
+class KeywordClassifier:
+    """Category and tag rules compiled into a single keyword automaton"""
+
+    def __init__(self, rules):
+        self.weights = rules['weights']
+        self.default_category = rules['default_category']
+        self.base_tags = list(rules['base_tags'])
+        self.rules = []  # (kind, name, min score)
+        self._keyword_rules = {}
+        for kind, key in (('category', 'categories'), ('tag', 'tags')):
+            for rule in rules[key]:
+                rule_id = len(self.rules)
+                self.rules.append((kind, rule['name'], rule.get('min_score', rules['min_score'][kind])))
+                for keyword in rule['keywords']:
+                    self._keyword_rules.setdefault(keyword.lower(), []).append(rule_id)
+        self._automaton = KeywordAutomaton(self._keyword_rules)
+        self.hit_counts = Counter()  # (rule name, keyword) -> hits across every post
+
+    @classmethod
+    def from_file(cls, path=RULES_PATH):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _zones(self, title, body):
+        yield 'title', title
+        for line in body.split('\n'):
+            yield ('heading' if line.startswith('#') else 'body'), line
+
+    def classify(self, title, body):
+        """Classification for one post; body is its markdown"""
+        scores = [0.0] * len(self.rules)
+        hits = Counter()
+        for zone, text in self._zones(title, body):
+            weight = self.weights[zone]
+            for start, keyword in self._automaton.iter_matches(text.lower()):
+                for rule_id in self._keyword_rules[keyword]:
+                    scores[rule_id] += weight
+                    hits[self.rules[rule_id][1], keyword] += 1
+        self.hit_counts.update(hits)
+
+        category = self.default_category
+        best = 0.0
+        tags = list(self.base_tags)
+        for rule_id, (kind, name, min_score) in enumerate(self.rules):
+            score = scores[rule_id]
+            if score < min_score:
+                continue
+            if kind == 'tag':
+                if name not in tags:
+                    tags.append(name)
+            elif score > best:
+                # Ties go to the rule listed first
+                category, best = name, score
+        named_scores = {name: score for (kind, name, min_score), score in zip(self.rules, scores) if score}
+        return Classification(category, tags, named_scores, hits)
+
+    def hit_report(self):
+        """Lines summarising rule hits so far, busiest rules first"""
+        per_rule = Counter()
+        for (name, keyword), count in self.hit_counts.items():
+            per_rule[name] += count
+        lines = []
+        for kind, name, min_score in sorted(self.rules, key=lambda rule: -per_rule[rule[1]]):
+            keywords = ', '.join(f"{keyword} {count}" for (rule, keyword), count
+                                 in self.hit_counts.most_common() if rule == name)
+            lines.append(f"  {kind:<8} {name:<16} {per_rule[name]:>5}  {keywords or '-'}")
+        return lines
+
+_default_classifier = None
+
+def default_classifier():
+    """Classifier for keyword_rules.json, compiled once per process"""
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = KeywordClassifier.from_file()
+    return _default_classifier
+
+def main(argv=None):
+    from blog_pipeline.frontmatter import FrontmatterError, read_post
+
+    argv = sys.argv[1:] if argv is None else argv
+    classifier = KeywordClassifier.from_file()
+    for file_path in argv:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            try:
+                data, body = read_post(f.read())
+            except FrontmatterError:
+                print(f"⚠️  Skipped {file_path}: unsupported frontmatter")
+                continue
+        result = classifier.classify(str(data.get('title') or ''), body)
+        print(f"📄 {os.path.basename(file_path)}")
+        print(f"   {result.category}  [{', '.join(result.tags)}]")
+    print("\n📊 Rule hits:")
+    for line in classifier.hit_report():
+        print(line)
+
+if __name__ == '__main__':
+    main()
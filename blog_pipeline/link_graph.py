@@ -0,0 +1,307 @@
+"""
+Internal link graph and broken-link check for the blog
+
+The enhancement prompt asks for 3-5 internal links per post, to app pages
+(/dashboard, /tariffs, ...) and to other posts, but slugs are regenerated
+whenever a title changes and nothing notices the links that pointed at the
+old one. This reads every markdown link and image in every post in one pass
+into an adjacency index (outbound and inbound links per slug) and checks
+each internal target with set lookups against:
+
+- the routes of the Next.js app directory (app/**/page.tsx, route.ts;
+  route groups dropped, [dynamic] segments matched as wildcards)
+- the files under public/ (images from docx_images, robots.txt, ...)
+- the slugs of the posts themselves, for /blog/SLUG
+
+Markdown files without frontmatter, such as BLOG_FORMATTING_STANDARDS.md,
+are notes rather than posts and are left out. External links, mailto: and
+in-page #anchors are not checked. A relative
+link resolves against /blog/, as it would from a post's page.
+
+Extracted links and their results are cached in .blog_cache/ by content
+hash. A rerun re-extracts and re-checks only the posts that changed, plus
+the links into any slug that appeared or disappeared; when the routes
+change, every link is re-checked.
+
+    python -m blog_pipeline links [blog_dir] [--json PATH]
+
+exits with status 1 when any link is broken.
+"""
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+from collections import namedtuple
+from urllib.parse import unquote
+
+from blog_pipeline.frontmatter import FrontmatterError, has_frontmatter, read_post, split_frontmatter
+from blog_pipeline.output_stage import write_if_changed
+from blog_pipeline.post_manifest import is_post_file, post_slug
+
+CACHE_PATH = os.path.join('.blog_cache', 'link_graph.json')
+CACHE_VERSION = 1
+APP_DIR = 'app'
+PUBLIC_DIR = 'public'
+BLOG_ROUTE = '/blog'
+
+# Internal links per post the enhancement prompt asks for
+LINK_TARGET = (3, 5)
+
+ROUTE_FILES = frozenset(['page.tsx', 'page.ts', 'page.jsx', 'page.js', 'page.mdx', 'route.ts', 'route.js'])
+
+Link = namedtuple('Link', 'target line image')
+Broken = namedtuple('Broken', 'file line target')
+
+_FENCE_RE = re.compile(r'\s*(```|~~~)')
+_CODE_SPAN_RE = re.compile(r'(`+).*?\1')
+_INLINE_RE = re.compile(r'(!?)\[(?:[^\]\\]|\\.)*\]\(\s*(<[^>]*>|[^)\s]*)(?:\s+(?:"[^"]*"|\'[^\']*\'|\([^)]*\)))?\s*\)')
+_REFERENCE_RE = re.compile(r' {0,3}\[[^\]]+\]:\s*(<[^>]*>|\S+)')
+_SCHEME_RE = re.compile(r'[A-Za-z][A-Za-z0-9+.-]*:')
+
+def extract_links(text):
+    """Every markdown link and image in a post (code excluded), in order"""
+    _, body = split_frontmatter(text)
+    first_line = text[:len(text) - len(body)].count('\n') + 1
+    links = []
+    fenced = False
+    for number, line in enumerate(body.split('\n'), start=first_line):
+        if _FENCE_RE.match(line):
+            fenced = not fenced
+            continue
+        if fenced:
+            continue
+        line = _CODE_SPAN_RE.sub('', line)
+        for match in _INLINE_RE.finditer(line):
+            links.append(Link(match.group(2).strip('<>'), number, bool(match.group(1))))
+        reference = _REFERENCE_RE.match(line)
+        if reference:
+            links.append(Link(reference.group(1).strip('<>'), number, False))
+    return links
+
+def internal_path(target):
+    """Site path a link points at, or None for external links, mail and in-page anchors"""
+    if not target:
+        return ''
+    if target.startswith('#') or target.startswith('//') or _SCHEME_RE.match(target):
+        return None
+    path = unquote(target.split('#', 1)[0].split('?', 1)[0])
+    if not path:
+        return None  # '?query' alone stays on the same page
+    path = posixpath.normpath(posixpath.join(BLOG_ROUTE + '/', path))
+    return '/' if path in ('.', '/', '//') else path.rstrip('/')
+
+def app_routes(app_dir=APP_DIR):
+    """(static paths, dynamic patterns) served by a Next.js app directory"""
+    static = set()
+    dynamic = set()
+    for directory, subdirs, files in os.walk(app_dir):
+        # Private (_x) and parallel (@x) folders aren't part of the URL
+        subdirs[:] = [name for name in subdirs if not name.startswith(('_', '@'))]
+        if not ROUTE_FILES.intersection(files):
+            continue
+        relative = os.path.relpath(directory, app_dir)
+        segments = [] if relative == '.' else relative.split(os.sep)
+        segments = tuple(segment for segment in segments if not segment.startswith('('))
+        if any(segment.startswith('[') for segment in segments):
+            dynamic.add(segments)
+        else:
+            static.add('/' + '/'.join(segments))
+    return static, dynamic
+
+def public_paths(public_dir=PUBLIC_DIR):
+    """URL path of every file served from public/"""
+    paths = set()
+    for directory, _, files in os.walk(public_dir):
+        relative = os.path.relpath(directory, public_dir)
+        prefix = '' if relative == '.' else '/' + relative.replace(os.sep, '/')
+        paths.update(f"{prefix}/{name}" for name in files)
+    return paths
+
+def _matches_dynamic(segments, pattern):
+    if pattern and pattern[-1].startswith('[['):  # optional catch-all
+        return segments[:len(pattern) - 1] == pattern[:-1] or _matches_dynamic(segments, pattern[:-1])
+    if pattern and pattern[-1].startswith('[...'):
+        if len(segments) < len(pattern):
+            return False
+        segments = segments[:len(pattern) - 1]
+        pattern = pattern[:-1]
+    if len(segments) != len(pattern):
+        return False
+    return all(part.startswith('[') or part == segment for part, segment in zip(pattern, segments))
+
+class Routes:
+    """Every internal path a link may point at"""
+
+    def __init__(self, app_dir=APP_DIR, public_dir=PUBLIC_DIR):
+        self.static, dynamic = app_routes(app_dir)
+        self.static |= public_paths(public_dir)
+        # /blog/SLUG is checked against the posts instead
+        self.dynamic = sorted(pattern for pattern in dynamic if pattern[:1] != (BLOG_ROUTE[1:],))
+        self.fingerprint = hashlib.sha256(json.dumps([sorted(self.static), self.dynamic]).encode('utf-8')).hexdigest()
+
+    def exists(self, path, slugs):
+        """True if path is a route, a public file or /blog/SLUG for a known slug"""
+        if path in self.static:
+            return True
+        head, _, slug = path.rpartition('/')
+        if head == BLOG_ROUTE:
+            return slug.lower() in slugs
+        segments = tuple(path.strip('/').split('/'))
+        return any(_matches_dynamic(segments, pattern) for pattern in self.dynamic)
+
+def _load_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == CACHE_VERSION:
+            return data
+    except (OSError, ValueError):
+        pass
+    return {}
+
+class LinkGraph:
+    """Links between the posts of one directory and the app, with broken ones flagged"""
+
+    def __init__(self, blog_dir='blog', app_dir=APP_DIR, public_dir=PUBLIC_DIR, cache_path=CACHE_PATH):
+        self.blog_dir = blog_dir
+        cached = _load_cache(cache_path)
+        cached_posts = cached.get('posts', {})
+        routes = Routes(app_dir, public_dir)
+
+        self.posts = {}
+        self.extracted = 0
+        changed = set()
+        for filename in sorted(os.listdir(blog_dir)):
+            if not is_post_file(filename):
+                continue
+            with open(os.path.join(blog_dir, filename), 'rb') as f:
+                raw = f.read()
+            if not has_frontmatter(raw.decode('utf-8')):
+                continue
+            digest = hashlib.sha256(raw).hexdigest()
+            entry = cached_posts.get(filename)
+            if entry is None or entry['sha256'] != digest:
+                text = raw.decode('utf-8')
+                try:
+                    data, _ = read_post(text)
+                except FrontmatterError:
+                    data = {}
+                entry = {'sha256': digest, 'slug': post_slug(filename, data),
+                         'links': [list(link) for link in extract_links(text)], 'broken': []}
+                changed.add(filename)
+                self.extracted += 1
+            self.posts[filename] = entry
+
+        # The site serves the first file for a slug
+        self.slugs = {}
+        for filename, entry in self.posts.items():
+            self.slugs.setdefault(entry['slug'], filename)
+        old_slugs = {entry['slug'] for entry in cached_posts.values()}
+
+        # Inbound edges by target path, for re-checking only the links into changed slugs
+        self._by_path = {}
+        for filename, entry in self.posts.items():
+            for index, (target, line, image) in enumerate(entry['links']):
+                path = internal_path(target)
+                if path is not None:
+                    self._by_path.setdefault(path, []).append((filename, index))
+
+        if cached.get('routes') != routes.fingerprint:
+            recheck = {(filename, index) for edges in self._by_path.values() for filename, index in edges}
+        else:
+            recheck = {(filename, index) for filename in changed
+                       for index, link in enumerate(self.posts[filename]['links'])
+                       if internal_path(link[0]) is not None}
+            for slug in old_slugs.symmetric_difference(self.slugs):
+                recheck.update(self._by_path.get(f"{BLOG_ROUTE}/{slug}", ()))
+        broken = {filename: set(entry['broken']) for filename, entry in self.posts.items()}
+        for filename, index in recheck:
+            path = internal_path(self.posts[filename]['links'][index][0])
+            if path and routes.exists(path, self.slugs):
+                broken[filename].discard(index)
+            else:
+                broken[filename].add(index)
+        for filename, entry in self.posts.items():
+            entry['broken'] = sorted(broken[filename])
+        self.rechecked = len(recheck)
+
+        if cached.get('routes') != routes.fingerprint or self.posts != cached_posts:
+            write_if_changed(cache_path, json.dumps({'version': CACHE_VERSION, 'routes': routes.fingerprint,
+                                                     'posts': self.posts}, separators=(',', ':')))
+
+    def links(self, filename):
+        return [Link(*link) for link in self.posts[filename]['links']]
+
+    def broken(self):
+        """Every broken link, as Broken(file, line, target), in file order"""
+        return [Broken(filename, entry['links'][index][1], entry['links'][index][0])
+                for filename, entry in self.posts.items() for index in entry['broken']]
+
+    def outbound(self, filename):
+        """Internal paths a post links to (images excluded), with repeats"""
+        paths = (internal_path(target) for target, line, image in self.posts[filename]['links'] if not image)
+        return [path for path in paths if path]
+
+    def inbound(self, slug):
+        """Files of the other posts that link to /blog/SLUG"""
+        edges = self._by_path.get(f"{BLOG_ROUTE}/{slug}", ())
+        return sorted({filename for filename, index in edges
+                       if self.posts[filename]['slug'] != slug and not self.posts[filename]['links'][index][2]})
+
+    def orphans(self):
+        """Slugs of posts no other post links to"""
+        return [slug for slug in self.slugs if not self.inbound(slug)]
+
+    def adjacency(self):
+        """{slug: {'outbound': [paths], 'inbound': [slugs], 'broken': [targets]}} for every served post"""
+        return {slug: {
+            'outbound': sorted(set(self.outbound(filename))),
+            'inbound': sorted(self.posts[other]['slug'] for other in self.inbound(slug)),
+            'broken': [self.posts[filename]['links'][index][0] for index in self.posts[filename]['broken']],
+        } for slug, filename in self.slugs.items()}
+
+def link_summary(graph):
+    """'12 posts, 40 internal links, 1 broken, 3 orphaned' for a LinkGraph"""
+    links = sum(len(graph.outbound(filename)) for filename in graph.slugs.values())
+    return (f"{len(graph.slugs)} posts, {links} internal links, {len(graph.broken())} broken, "
+            f"{len(graph.orphans())} orphaned")
+
+def print_broken(graph):
+    for broken in graph.broken():
+        print(f"❌ {broken.file}:{broken.line} → {broken.target or '(empty)'}")
+
+def report(graph):
+    """Print per-post link counts, the broken links and the orphaned posts"""
+    print("=" * 60)
+    print("INTERNAL LINKS")
+    print("=" * 60)
+    in_target = 0
+    for slug, filename in graph.slugs.items():
+        outbound = len(graph.outbound(filename))
+        in_target += LINK_TARGET[0] <= outbound <= LINK_TARGET[1]
+        print(f"📄 {slug[:60]:<60} out {outbound:>3}  in {len(graph.inbound(slug)):>3}")
+    print("-" * 60)
+    print_broken(graph)
+    for slug in graph.orphans():
+        print(f"🏝️  Orphaned: {slug} (no links from other posts)")
+    print(f"  {LINK_TARGET[0]}-{LINK_TARGET[1]} internal links: {in_target}/{len(graph.slugs)} posts")
+    print(f"🔗 {link_summary(graph)} ({graph.rechecked} link(s) re-checked)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check the links in every post and map the internal link graph')
+    parser.add_argument('blog_dir', nargs='?', default='blog', help='Directory of posts (default: blog)')
+    parser.add_argument('--app', default=APP_DIR, help=f'Next.js app directory (default: {APP_DIR})')
+    parser.add_argument('--public', default=PUBLIC_DIR, help=f'Static files directory (default: {PUBLIC_DIR})')
+    parser.add_argument('--json', metavar='PATH', help='Write the outbound/inbound links of every post as JSON')
+    args = parser.parse_args(argv)
+    graph = LinkGraph(args.blog_dir, args.app, args.public)
+    report(graph)
+    if args.json:
+        write_if_changed(args.json, json.dumps(graph.adjacency(), ensure_ascii=False, indent=2))
+        print(f"📊 Wrote {args.json}")
+    return 1 if graph.broken() else 0
+
+if __name__ == '__main__':
+    main()
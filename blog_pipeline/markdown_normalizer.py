@@ -0,0 +1,171 @@
+"""
+Single-pass markdown normalizer for blog posts
+
+Applies the blog formatting rules (see blog/BLOG_FORMATTING_STANDARDS.md) in
+one walk over the lines of a post:
+
+- blank line before and after every heading, only one H1 (later ones become
+  H2), and an H3 with no H2 in the preceding five lines is promoted to H2
+- '*' and '•' bullets become '- '
+- runs of blank lines collapse to one
+- blank line before blockquote lines, and code fences split onto their own lines
+
+Each rule is a generator stage over lines, so the text is split once, joined
+once and never rescanned. The output is identical to the original chain of
+fix_headings, fix_lists, fix_tables, fix_blank_lines and fix_blocks regex
+passes, including their quirks.
+"""
+import re
+
+_HEADING_RE = re.compile(r'#+ ')
+_FENCE_OPEN_RE = re.compile(r'```[a-zA-Z]*\Z')
+
+_BULLETS = ('*', '•')
+_H2_WINDOW = 5
+
+def _fix_headings(lines):
+    """Heading spacing, single H1 and no skipped levels"""
+    count = 0
+    last_blank = True  # nothing emitted yet
+    last_h2 = -_H2_WINDOW - 1
+    h1_found = False
+    for line in lines:
+        is_heading = _HEADING_RE.match(line) is not None
+        if is_heading:
+            if count and not last_blank:
+                yield ''
+                count += 1
+                last_blank = True
+            if line.startswith('# '):
+                if h1_found:
+                    line = '#' + line
+                else:
+                    h1_found = True
+            elif line.startswith('### ') and last_h2 < count - _H2_WINDOW:
+                line = line[1:]
+        if line.startswith('## '):
+            last_h2 = count
+        yield line
+        count += 1
+        last_blank = not line.strip()
+        if is_heading:
+            yield ''
+            count += 1
+            last_blank = True
+
+def _bullet_rest(line):
+    """For a line starting with a bullet, the text after the bullet's whitespace.
+
+    Returns None if the line isn't a bullet. The whitespace after a bullet may
+    run on past the end of the line (the original regex was '\\s+' in
+    MULTILINE mode), so '' means "keep consuming the following lines".
+    """
+    if not line or line[0] not in _BULLETS:
+        return None
+    if len(line) > 1 and not line[1].isspace():
+        return None
+    return line[1:].lstrip()
+
+def _fix_lists(lines):
+    """Normalise '*' and '•' bullets to '- '"""
+    # While a bullet's whitespace runs on into the following lines, pending
+    # holds the text emitted so far; fallback is what to emit instead if the
+    # text ends before any whitespace was consumed (a lone final bullet).
+    pending = None
+    fallback = None
+    for line in lines:
+        prefix = ''
+        if pending is not None:
+            stripped = line.lstrip()
+            if not stripped:
+                fallback = None
+                continue
+            prefix, pending, fallback = pending, None, None
+            if len(stripped) != len(line):
+                # Content resumes mid-line, where the bullet rule can't match again
+                yield prefix + stripped
+                continue
+
+        rest = _bullet_rest(line)
+        if rest is None:
+            yield prefix + line
+        elif rest:
+            yield prefix + '- ' + rest
+        else:
+            pending = prefix + '- '
+            fallback = prefix + line if len(line) == 1 else None
+    if pending is not None:
+        yield pending if fallback is None else fallback
+
+def _fix_blank_lines(lines):
+    """Collapse runs of blank lines to a single blank line"""
+    blanks = 0
+    first = True
+    for line in lines:
+        if first:
+            first = False
+            yield line
+        elif line:
+            if blanks:
+                yield ''
+                blanks = 0
+            yield line
+        else:
+            blanks += 1
+    if blanks:
+        # The final line closes the run rather than being part of it
+        if blanks > 1:
+            yield ''
+        yield ''
+
+def _fix_blockquotes(lines):
+    """Blank line before blockquote lines that follow text"""
+    previous = None
+    previous_consumed = False
+    for line in lines:
+        consumed = False
+        if previous and line.startswith('> ') and not previous_consumed:
+            yield ''
+            # The match ran to the end of a bare '> ' line, so it can't also
+            # serve as the text before the next quote line
+            consumed = line == '> '
+        yield line
+        previous = line
+        previous_consumed = consumed
+
+def _fix_fence_openings(lines):
+    """Newline before an opening fence (```lang) wherever it sits on its line"""
+    previous = None
+    for line in lines:
+        if previous is not None:
+            match = _FENCE_OPEN_RE.search(previous)
+            if match:
+                yield previous[:match.start()]
+                yield previous[match.start():]
+            else:
+                yield previous
+        previous = line
+    if previous is not None:
+        yield previous
+
+def _fix_fence_closings(lines):
+    """Newline after the ``` that starts any line but the first"""
+    first = True
+    for line in lines:
+        if not first and line.startswith('```'):
+            yield '```'
+            yield line[3:]
+        else:
+            yield line
+        first = False
+
+def normalize_markdown(text):
+    """Apply every blog formatting rule to a markdown body in a single pass"""
+    lines = text.split('\n')
+    lines = _fix_headings(lines)
+    lines = _fix_lists(lines)
+    lines = _fix_blank_lines(lines)
+    lines = _fix_blockquotes(lines)
+    lines = _fix_fence_openings(lines)
+    lines = _fix_fence_closings(lines)
+    return '\n'.join(lines)
@@ -0,0 +1,225 @@
+"""
+Near-duplicate posts from MinHash signatures and LSH buckets
+
+ChatGPT rewrites a post a little differently every round, so an exact hash
+can't tell that blog-post-5.md and its properly titled twin are the same
+post. Instead every post body is cut into overlapping SHINGLE_WORDS-word
+shingles and summarised by a MinHash signature: for each of NUM_HASHES
+random hash functions, the smallest hash of any shingle. The fraction of
+positions where two signatures agree estimates the Jaccard similarity of
+their shingle sets.
+
+Comparing every new post against every existing one is quadratic, so the
+signatures are split into BANDS bands of ROWS values and bucketed by band.
+Only posts sharing at least one bucket are compared, which finds pairs above
+roughly (1 / BANDS) ** (1 / ROWS) similarity in near-linear time. Signatures
+are computed with NumPy and cached in .blog_cache/ by content hash.
+
+Ingest refuses to write a post whose estimated similarity to a post already
+in blog/ reaches DUPLICATE_THRESHOLD (--allow-duplicates only warns). To list
+the near-duplicate pairs already in the directory:
+
+    python -m blog_pipeline duplicates [blog_dir]
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import zlib
+from collections import namedtuple
+
+import numpy as np
+
+from blog_pipeline.frontmatter import FrontmatterError, read_post
+from blog_pipeline.output_stage import write_if_changed
+from blog_pipeline.post_manifest import is_post_file
+
+CACHE_PATH = os.path.join('.blog_cache', 'minhash.json')
+SHINGLE_WORDS = 3
+NUM_HASHES = 128
+BANDS = 32
+ROWS = NUM_HASHES // BANDS
+DUPLICATE_THRESHOLD = 0.5
+SEED = 20250101
+# Bump when shingling or hashing changes, to invalidate cached signatures
+HASH_VERSION = 1
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+# Odd multiplier for combining word hashes into a shingle hash
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+# Multiply-shift hash functions: the top 32 bits of (a * x + b) mod 2**64, a odd
+_rng = np.random.default_rng(SEED)
+_A = _rng.integers(0, 1 << 63, NUM_HASHES, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_B = _rng.integers(0, 1 << 63, NUM_HASHES, dtype=np.uint64)
+
+Match = namedtuple('Match', 'file similarity')
+
+class NearDuplicate(ValueError):
+    """A post too similar to one already in the output directory"""
+
+def shingles(text):
+    """Sorted unique 64-bit hashes of the text's SHINGLE_WORDS-word shingles.
+
+    Each distinct word is hashed once (CRC-32); a shingle's hash combines
+    the hashes of its words in order, over whole arrays at a time.
+    """
+    words = _WORD_RE.findall(text.lower())
+    table = {word: zlib.crc32(word.encode('utf-8')) for word in set(words)}
+    hashes = np.fromiter(map(table.__getitem__, words), dtype=np.uint64, count=len(words))
+    width = min(SHINGLE_WORDS, len(hashes))
+    count = len(hashes) - width + 1 if width else 0
+    combined = np.zeros(count, dtype=np.uint64)
+    for offset in range(width):
+        combined = combined * _MIX + hashes[offset:offset + count]
+    return np.unique(combined)
+
+def minhash(text):
+    """MinHash signature of a post body (uint32[NUM_HASHES]), or None if it has no words"""
+    values = shingles(text)
+    if not len(values):
+        return None
+    hashes = (_A[:, None] * values[None, :] + _B[:, None]) >> np.uint64(32)
+    return hashes.min(axis=1).astype(np.uint32)
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of two signatures"""
+    return float(np.count_nonzero(a == b)) / NUM_HASHES
+
+def post_body(text):
+    """The body of a post, or all of it if the frontmatter can't be parsed"""
+    try:
+        return read_post(text)[1]
+    except FrontmatterError:
+        return text
+
+class DuplicateIndex:
+    """MinHash signatures of the posts in one output directory, bucketed by LSH band"""
+
+    def __init__(self, output_dir, threshold=DUPLICATE_THRESHOLD, block=True):
+        self.output_dir = output_dir
+        self.threshold = threshold
+        self.block = block
+        self._signatures = {}
+        self._buckets = {}
+
+    def _keys(self, signature):
+        return [(band, signature[band * ROWS:(band + 1) * ROWS].tobytes()) for band in range(BANDS)]
+
+    def add(self, filename, signature):
+        """Index a post's signature, replacing any earlier one for the same file"""
+        self.remove(filename)
+        if signature is None:
+            return
+        self._signatures[filename] = signature
+        for key in self._keys(signature):
+            self._buckets.setdefault(key, set()).add(filename)
+
+    def remove(self, filename):
+        signature = self._signatures.pop(filename, None)
+        if signature is None:
+            return
+        for key in self._keys(signature):
+            bucket = self._buckets[key]
+            bucket.discard(filename)
+            if not bucket:
+                del self._buckets[key]
+
+    def add_post(self, filename, text):
+        self.add(filename, minhash(post_body(text)))
+
+    def matches(self, signature, ignore=()):
+        """Indexed posts at or above the threshold, most similar first"""
+        if signature is None:
+            return []
+        candidates = set()
+        for key in self._keys(signature):
+            candidates.update(self._buckets.get(key, ()))
+        found = []
+        for filename in candidates:
+            # A post deleted since it was indexed (say, by a slug move) no longer counts
+            if filename in ignore or not os.path.exists(os.path.join(self.output_dir, filename)):
+                continue
+            score = similarity(signature, self._signatures[filename])
+            if score >= self.threshold:
+                found.append(Match(filename, score))
+        return sorted(found, key=lambda match: (-match.similarity, match.file))
+
+    def check(self, filename, text, ignore=()):
+        """Raise NearDuplicate if the post would duplicate another (just warn if not blocking).
+
+        filename itself and the files in ignore (the source's own previous
+        output) are never counted. Returns the matches.
+        """
+        found = self.matches(minhash(post_body(text)), set(ignore) | {filename})
+        if found:
+            best = found[0]
+            message = f"{filename} is {best.similarity:.0%} similar to {best.file}"
+            if self.block:
+                raise NearDuplicate(message)
+            print(f"⚠️  Near-duplicate: {message}")
+        return found
+
+    def pairs(self):
+        """(file, file, similarity) for every indexed pair at or above the threshold"""
+        candidates = set()
+        for bucket in self._buckets.values():
+            if len(bucket) > 1:
+                members = sorted(bucket)
+                candidates.update((a, b) for i, a in enumerate(members) for b in members[i + 1:])
+        found = []
+        for a, b in candidates:
+            score = similarity(self._signatures[a], self._signatures[b])
+            if score >= self.threshold:
+                found.append((a, b, score))
+        return sorted(found, key=lambda pair: (-pair[2], pair[0], pair[1]))
+
+def _load_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('config') == [HASH_VERSION, SHINGLE_WORDS, NUM_HASHES, SEED]:
+            return data['signatures']
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+def load_index(output_dir='blog', threshold=DUPLICATE_THRESHOLD, block=True, cache_path=CACHE_PATH):
+    """DuplicateIndex over every post in output_dir, hashing only posts whose bytes changed"""
+    index = DuplicateIndex(output_dir, threshold, block)
+    if not os.path.isdir(output_dir):
+        return index
+    cached = _load_cache(cache_path)
+    signatures = {}
+    for filename in sorted(os.listdir(output_dir)):
+        if not is_post_file(filename):
+            continue
+        with open(os.path.join(output_dir, filename), 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        signature = cached.get(digest)
+        if signature is None:
+            signature = minhash(post_body(raw.decode('utf-8')))
+            signature = None if signature is None else signature.tolist()
+        signatures[digest] = signature
+        index.add(filename, None if signature is None else np.asarray(signature, dtype=np.uint32))
+    if signatures != cached:
+        write_if_changed(cache_path, json.dumps({'config': [HASH_VERSION, SHINGLE_WORDS, NUM_HASHES, SEED],
+                                                 'signatures': signatures}, separators=(',', ':')))
+    return index
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='List near-duplicate posts')
+    parser.add_argument('blog_dir', nargs='?', default='blog')
+    parser.add_argument('--threshold', type=float, default=DUPLICATE_THRESHOLD,
+                        help='Estimated Jaccard similarity that counts as a duplicate (default: %(default)s)')
+    args = parser.parse_args(argv)
+    pairs = load_index(args.blog_dir, args.threshold).pairs()
+    for a, b, score in pairs:
+        print(f"🔁 {score:.0%}  {a}")
+        print(f"         {b}")
+    print(f"✓ {len(pairs)} near-duplicate pair(s) at {args.threshold:.0%} or more")
+
+if __name__ == '__main__':
+    main()
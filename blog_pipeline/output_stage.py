@@ -0,0 +1,104 @@
+"""
+Write-if-changed output stage
+
+Rewriting a post with identical bytes still bumps its mtime, which is enough
+for Next.js to rebuild and for Vercel to redeploy. Every generated file goes
+through here instead: the new bytes are compared with what is on disk (size
+first, then SHA-256) and only files that really changed are written, via a
+temporary file in the same directory and an atomic rename, so a reader never
+sees a half-written post.
+"""
+import hashlib
+import os
+
+def _digest(data):
+    return hashlib.sha256(data).digest()
+
+def _file_digest(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+def same_contents(path, data):
+    """True if path already holds exactly these bytes"""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        return _file_digest(path) == _digest(data)
+    except OSError:
+        return False
+
+def atomic_write(path, data):
+    """Replace path with data in one rename"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_if_changed(path, data):
+    """Write data (str is UTF-8 encoded) unless path already holds it. Returns True if written"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if same_contents(path, data):
+        return False
+    atomic_write(path, data)
+    return True
+
+class OutputStage:
+    """Writes and deletes generated files, counting what actually happened"""
+
+    def __init__(self):
+        self.counts = {'written': 0, 'unchanged': 0, 'deleted': 0}
+
+    def write(self, path, data):
+        """Write path if its contents changed. Returns True if it was written"""
+        written = write_if_changed(path, data)
+        self.counts['written' if written else 'unchanged'] += 1
+        return written
+
+    def delete(self, path):
+        """Remove a generated file if it exists. Returns True if it was removed"""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return False
+        self.counts['deleted'] += 1
+        return True
+
+    def merge(self, counts):
+        """Add counts from a stage that ran in another process"""
+        for key, value in counts.items():
+            self.counts[key] += value
+
+    def summary(self):
+        return (f"{self.counts['written']} written, {self.counts['unchanged']} unchanged, "
+                f"{self.counts['deleted']} deleted")
+
+class DeferredStage(OutputStage):
+    """An OutputStage that holds its writes for another process to apply.
+
+    A process-pool worker renders through one of these and returns .writes,
+    so the parent can resolve slug ownership before anything reaches disk.
+    Deletes are not deferred.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, path, data):
+        """Queue path to be written. Returns True if it would change on disk"""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        self.writes.append((path, data))
+        return not same_contents(path, data)
@@ -0,0 +1,129 @@
+"""
+Pre-parsed manifest of every post in blog/
+
+lib/blogService.ts loads blog/manifest.json once instead of listing the
+directory and running gray-matter over every post on each call. Each entry
+carries the frontmatter (as gray-matter would return it), the derived slug,
+word count and read time, and the UTF-8 byte offset of the body inside the
+markdown file so a single post's body can be read without re-parsing. The
+SHA-256 of the file is stored with the offset, and blogService only trusts
+the offset while the file still has that hash. Files
+whose frontmatter gray-matter would reject are listed under "skipped", so the
+site can tell a complete manifest from a stale one. When NumPy is available
+each entry also lists its most similar posts under "related" (see
+blog_pipeline/related_posts.py) and its readability and keyword figures
+under "metrics" (see blog_pipeline/readability.py). Posts with an up-to-date
+HTML render (see blog_pipeline/html_render.py) list it under "rendered",
+with their "toc".
+
+Run directly to rebuild the manifest after editing posts by hand:
+
+    python -m blog_pipeline.post_manifest
+"""
+import hashlib
+import json
+import math
+import os
+import re
+
+from blog_pipeline.frontmatter import FrontmatterError, read_post
+from blog_pipeline.output_stage import write_if_changed
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 2
+WORDS_PER_MINUTE = 200
+
+_DATE_PREFIX_RE = re.compile(r'^\d{4}-\d{2}-\d{2}-')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def is_post_file(filename):
+    """Same filter as blogService: markdown files other than READMEs"""
+    return filename.endswith('.md') and 'readme' not in filename.lower()
+
+def post_slug(filename, data):
+    """Slug the site serves a post under (frontmatter slug, else from the filename)"""
+    slug = data.get('slug') or _DATE_PREFIX_RE.sub('', filename)[:-len('.md')]
+    return str(slug).lower()
+
+def word_count(body):
+    """Word count as blogService's calculateReadTime computes it"""
+    return len(_WHITESPACE_RE.split(body))
+
+def build_post_entry(filename, text):
+    """Manifest entry for one post, or None if its frontmatter can't be parsed"""
+    try:
+        data, body = read_post(text)
+    except FrontmatterError:
+        return None
+    words = word_count(body)
+    offset = len(text) - len(body)
+    raw = text.encode('utf-8')
+    return {
+        'file': filename,
+        'slug': post_slug(filename, data),
+        'data': data,
+        'wordCount': words,
+        'readMinutes': math.ceil(words / WORDS_PER_MINUTE),
+        'bodyOffset': len(text[:offset].encode('utf-8')),
+        'fileBytes': len(raw),
+        'sha256': hashlib.sha256(raw).hexdigest(),
+    }
+
+def _related_posts(blog_dir):
+    try:
+        from blog_pipeline.related_posts import related_posts
+    except ImportError:
+        return {}
+    return related_posts(blog_dir)
+
+def _post_metrics(blog_dir):
+    try:
+        from blog_pipeline.readability import post_metrics
+    except ImportError:
+        return {}
+    return post_metrics(blog_dir)
+
+def build_manifest(blog_dir='blog', related=None):
+    """Manifest dict for every post in blog_dir, plus the files that were skipped"""
+    from blog_pipeline.html_render import read_rendered, rendered_name
+
+    if related is None:
+        related = _related_posts(blog_dir)
+    metrics = _post_metrics(blog_dir)
+    posts = []
+    skipped = []
+    for filename in sorted(os.listdir(blog_dir)):
+        if not is_post_file(filename):
+            continue
+        with open(os.path.join(blog_dir, filename), 'r', encoding='utf-8', newline='') as f:
+            text = f.read()
+        entry = build_post_entry(filename, text)
+        if entry is None:
+            skipped.append(filename)
+        else:
+            if entry['slug'] in related:
+                entry['related'] = related[entry['slug']]
+            if filename in metrics:
+                entry['metrics'] = metrics[filename]
+            rendered = read_rendered(blog_dir, filename, text)
+            if rendered is not None:
+                entry['rendered'] = rendered_name(filename)
+                entry['toc'] = rendered['toc']
+            posts.append(entry)
+    return {'version': MANIFEST_VERSION, 'posts': posts, 'skipped': skipped}, skipped
+
+def write_post_manifest(blog_dir='blog', related=None):
+    """Rebuild blog_dir/manifest.json. Returns (path, post count, skipped files)"""
+    manifest, skipped = build_manifest(blog_dir, related)
+    path = os.path.join(blog_dir, MANIFEST_NAME)
+    write_if_changed(path, json.dumps(manifest, ensure_ascii=False, separators=(',', ':')))
+    return path, len(manifest['posts']), skipped
+
+def main():
+    path, count, skipped = write_post_manifest()
+    print(f"✓ Wrote {path} ({count} posts)")
+    for filename in skipped:
+        print(f"⚠️  Skipped {filename}: unsupported frontmatter")
+
+if __name__ == '__main__':
+    main()
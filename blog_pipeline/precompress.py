@@ -0,0 +1,173 @@
+"""
+Precompressed gzip and brotli siblings for the generated artifacts
+
+Static hosts (and a CDN in front of Next.js) can serve POST.md.gz or
+manifest.json.br as-is when the client accepts the encoding, instead of
+compressing the same bytes on every request. For each artifact this writes
+PATH.gz (level 9, mtime 0 so the bytes are reproducible) and, when the brotli
+package is installed, PATH.br (quality 11). Artifacts are compressed in a
+process pool, and only when their SHA-256 differs from the one recorded in
+.blog_cache/precompress.json (or a sibling has gone missing), so a rerun over
+unchanged output compresses nothing. When an artifact recorded there is
+deleted, the siblings written for it are removed; no other .gz/.br file is
+ever touched.
+
+    python -m blog_pipeline compress [PATH ...]
+
+With no paths, every generated artifact in blog/ and the ChatGPT prompt
+files are compressed.
+"""
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+from collections import namedtuple
+
+from blog_pipeline.output_stage import OutputStage, write_if_changed
+from blog_pipeline.post_manifest import is_post_file
+
+CACHE_PATH = os.path.join('.blog_cache', 'precompress.json')
+CACHE_VERSION = 1
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+ENCODINGS = ('.gz', '.br')
+
+# Below this gzip's framing outweighs any saving
+MIN_SIZE = 256
+
+Compressed = namedtuple('Compressed', 'path digest size gzip brotli')
+
+def have_brotli():
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def generated_artifacts(blog_dir='blog', prompt_dir=os.path.join('ChatGPT', 'Blogs')):
+    """Every artifact the content pipeline writes that is worth serving compressed (prompt_dir=None: blog/ only)"""
+    paths = []
+    if os.path.isdir(blog_dir):
+        for filename in sorted(os.listdir(blog_dir)):
+            if is_post_file(filename) or filename in ('manifest.json', 'search-index.bin'):
+                paths.append(os.path.join(blog_dir, filename))
+        paths += sorted(glob.glob(os.path.join(blog_dir, 'rendered', '*.json')))
+    if prompt_dir:
+        paths += sorted(glob.glob(os.path.join(prompt_dir, 'ALL_Blogs_For_Enhancement*.txt')))
+        paths += sorted(glob.glob(os.path.join(prompt_dir, 'ALL_Blogs_For_Enhancement.manifest.json')))
+    return paths
+
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def _compress_job(job):
+    """Worker entry point: write the siblings of one artifact. Returns Compressed"""
+    path, brotli_wanted = job
+    with open(path, 'rb') as f:
+        data = f.read()
+    gzip_data = gzip.compress(data, GZIP_LEVEL, mtime=0)
+    write_if_changed(path + '.gz', gzip_data)
+    brotli_size = None
+    if brotli_wanted:
+        import brotli
+        brotli_data = brotli.compress(data, quality=BROTLI_QUALITY)
+        write_if_changed(path + '.br', brotli_data)
+        brotli_size = len(brotli_data)
+    return Compressed(path, hashlib.sha256(data).hexdigest(), len(data), len(gzip_data), brotli_size)
+
+def compress_files(jobs, workers=None):
+    """Run _compress_job over jobs, across a process pool when there are several"""
+    if workers == 1 or len(jobs) < 2:
+        return [_compress_job(job) for job in jobs]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(jobs))) as executor:
+        return list(executor.map(_compress_job, jobs))
+
+def _load_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == CACHE_VERSION:
+            return data['files']
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+def _remove_orphans(cached, stage):
+    """Delete the .gz/.br siblings this module wrote for cached artifacts that no longer exist"""
+    for key in cached:
+        if not os.path.exists(key):
+            for encoding in ENCODINGS:
+                stage.delete(key + encoding)
+
+def precompress(paths, cache_path=CACHE_PATH, workers=None, stage=None):
+    """Write compressed siblings for paths whose contents changed.
+
+    Returns (compressed, all) lists of Compressed: the artifacts compressed
+    this run, and every artifact (from the cache where unchanged).
+    """
+    if stage is None:
+        stage = OutputStage()
+    brotli_wanted = have_brotli()
+    cached = _load_cache(cache_path)
+    results = {}
+    jobs = []
+    for path in paths:
+        if not os.path.isfile(path) or os.path.getsize(path) < MIN_SIZE:
+            continue
+        key = os.path.normpath(path).replace(os.sep, '/')
+        entry = cached.get(key)
+        if (entry is not None and entry['digest'] == _file_digest(path)
+                and os.path.exists(path + '.gz')
+                and (entry['brotli'] is not None or not brotli_wanted)
+                and (entry['brotli'] is None or os.path.exists(path + '.br'))):
+            results[key] = Compressed(path, entry['digest'], entry['size'], entry['gzip'], entry['brotli'])
+        else:
+            jobs.append((path, brotli_wanted))
+    compressed = compress_files(jobs, workers)
+    for result in compressed:
+        results[os.path.normpath(result.path).replace(os.sep, '/')] = result
+        stage.counts['written'] += 1
+    _remove_orphans(cached, stage)
+
+    # Keep entries for artifacts elsewhere; drop ones whose file is gone
+    merged = {key: value for key, value in cached.items() if os.path.exists(key)}
+    merged.update({key: result._asdict() for key, result in results.items()})
+    for entry in merged.values():
+        entry.pop('path', None)
+    if merged != cached:
+        write_if_changed(cache_path, json.dumps({'version': CACHE_VERSION, 'files': merged},
+                                                separators=(',', ':'), sort_keys=True))
+    return compressed, list(results.values())
+
+def ratio_summary(results):
+    """'N artifacts, 243 KB -> gzip 38% / brotli 31%' over a list of Compressed"""
+    size = sum(result.size for result in results)
+    if not size:
+        return f"{len(results)} artifacts"
+    gzip_size = sum(result.gzip for result in results)
+    summary = f"{len(results)} artifacts, {size / 1024:,.0f} KB -> gzip {gzip_size / size:.0%}"
+    if results and all(result.brotli is not None for result in results):
+        summary += f" / brotli {sum(result.brotli for result in results) / size:.0%}"
+    return summary
+
+def report(compressed, results):
+    """Print what was compressed and the overall ratio"""
+    print(f"🗜️  Compressed {len(compressed)} changed artifact(s); {ratio_summary(results)} of original size")
+    if not have_brotli():
+        print("   (install brotli for .br siblings)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write gzip and brotli siblings for the generated artifacts')
+    parser.add_argument('paths', nargs='*', help='Files to compress (default: every generated artifact)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: one per CPU core)')
+    args = parser.parse_args(argv)
+    compressed, results = precompress(args.paths or generated_artifacts(), workers=args.workers)
+    report(compressed, results)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,327 @@
+"""
+Build the ChatGPT blog enhancement prompt from the published markdown post(s)
+and the MOCK_POSTS in lib/blogService.ts
+
+The prompt is streamed to ChatGPT/Blogs/ALL_Blogs_For_Enhancement.txt. If it
+would exceed the token budget it is split into ALL_Blogs_For_Enhancement_partNN.txt
+shards, each with the full instructions and never splitting a post, and
+ALL_Blogs_For_Enhancement.manifest.json maps each post to its shard.
+
+The mock posts are read with a proper TypeScript scanner (blog_pipeline.ts_records),
+and --export-markdown writes the same records out as blog/-style markdown files.
+With --delta only posts and H2 sections changed since the last round are sent
+(see blog_pipeline.prompt_delta); --mark-sent records this build as that round.
+A delta reply is merged back into a markdown file, so --delta covers the
+--markdown posts only: export the mock posts with --export-markdown and pass
+those files to include them.
+
+    python -m blog_pipeline prompt [--markdown PATH] [--token-budget N] ...
+"""
+import argparse
+import json
+import math
+import os
+import re
+import sys
+
+from blog_pipeline.prompt_delta import SectionState, section_block
+from blog_pipeline.prompt_shards import DEFAULT_TOKEN_BUDGET, PromptShardWriter
+from blog_pipeline.ts_records import extract_mock_posts
+
+OUTPUT_PATH = 'ChatGPT/Blogs/ALL_Blogs_For_Enhancement.txt'
+MARKDOWN_BLOG = 'blog/2025-01-01-understanding-uk-energy-bill-guide-2025.md'
+
+PROMPT_HEADER = """==============================================
+CHATGPT BLOG ENHANCEMENT PROMPT
+==============================================
+
+INSTRUCTIONS FOR CHATGPT:
+
+Please review and enhance ALL the following blog posts for the Cost Saver app (a UK energy cost management application).
+
+ENHANCEMENT GOALS:
+1. FACTUAL ACCURACY: Verify all UK energy statistics, regulations, and pricing information are current for December 2025
+2. SEO OPTIMIZATION:
+   - Improve keyword density for: UK energy bills, energy saving tips, reduce energy costs, energy tariffs, smart meters, heat pumps, solar panels, insulation
+   - Add relevant long-tail keywords naturally
+   - Optimize meta descriptions (150-160 characters)
+   - Improve heading hierarchy (H1, H2, H3)
+   - Include internal linking opportunities
+3. READABILITY: Ensure content is accessible to average UK households (Flesch reading ease: 60-70)
+4. ENGAGEMENT: Add compelling hooks, clear CTAs, and practical examples with real numbers
+5. STRUCTURE: Improve heading hierarchy, add bullet points, break up long paragraphs (max 3-4 sentences)
+6. VALUE: Ensure every section provides actionable insights that help users save money
+7. CONSISTENCY: Maintain consistent tone and style across all blog posts
+
+QUALITY CRITERIA:
+- Use UK English spelling and terminology throughout
+- Include current 2025 UK energy price cap figures (Q4 2024/Q1 2025)
+- Reference Ofgem regulations, Energy Saving Trust, and other authorities
+- Provide specific, measurable savings figures (£ amounts, percentages, timeframes)
+- Include real-world examples for different UK household types (1-bed flat, 3-bed semi, 4-bed detached)
+- Maintain friendly, helpful, authoritative tone
+- Ensure all statistics are verifiable
+- Add specific dates where relevant ("as of December 2025")
+- Include comparison tables where useful
+- Add "Pro Tips", "Warning" and "Key Takeaway" callout boxes
+- Include FAQs at end where appropriate
+
+OUTPUT FORMAT FOR EACH BLOG:
+1. ✅ Enhanced blog content in full markdown format with frontmatter
+2. 📋 Summary of key changes made
+3. 🔍 Primary & secondary SEO keywords used
+4. 🔗 Suggested internal links (to /dashboard, /tariffs, /products, /bills, /account, /about)
+5. ⚠️ Any factual corrections or updates needed
+6. 📊 Estimated readability improvement
+
+TARGET METRICS PER BLOG:
+- Reading time: 5-12 minutes
+- Keyword density: 1-2% for primary keywords
+- Paragraph length: Max 3-4 sentences
+- Heading frequency: Every 150-200 words
+- Internal links: 3-5 per post
+- External authority links: 1-2 per post
+- Bullet points: Use liberally for lists
+- Tables: Include for comparisons
+- Examples: 2-3 real-world scenarios per post
+
+==============================================
+EXISTING BLOG POSTS TO ENHANCE
+==============================================
+
+"""
+
+DELTA_NOTE = """NOTE: This is a delta round. Posts marked "changed sections only" include just
+the sections that are new or changed since the last round, each between
+<<<SECTION anchor>>> and <<<END SECTION>>> lines. Enhance only those sections
+and return each one, in full, between the same two lines with the anchor
+unchanged, so it can be merged back into the post. Posts without these
+markers are new: enhance them in full as below.
+
+"""
+
+PROMPT_FOOTER = """
+-----------------------------------------------------------
+END OF ALL BLOG POSTS
+-----------------------------------------------------------
+
+==============================================
+DELIVERABLES REQUIRED:
+==============================================
+
+For EACH of the {count} blog posts above, provide:
+
+1. **Full Enhanced Markdown** with this frontmatter structure:
+```markdown
+---
+title: "Compelling SEO-Optimized Title"
+date: "2025-01-0X"
+excerpt: "150-160 character summary for SEO"
+tags: ["tag1", "tag2", "tag3", "tag4", "tag5"]
+slug: "url-friendly-slug"
+author: "Cost Saver Team"
+readTime: "X min read"
+category: "energy|home-upgrades|products|guides|news"
+featured: true/false
+---
+```
+
+2. **Change Summary** - What you improved
+3. **SEO Keywords** - Primary and secondary
+4. **Internal Links** - Where to link within app
+5. **Fact Check** - Any corrections needed
+
+==============================================
+NEXT STEPS AFTER ENHANCEMENT:
+==============================================
+
+1. ChatGPT reviews and enhances all {count} blog posts
+2. User saves output as "Enhanced_Blogs_Output.docx"
+3. Development team will:
+   - Extract enhanced markdown
+   - Create new .md files for the mock-data posts in /blog folder
+   - Update existing post #1
+   - Update blog index and navigation
+   - Deploy to production
+
+CRITICAL REMINDERS:
+✓ Verify all statistics are accurate for December 2025
+✓ Update energy price cap figures (currently around £1,717/year typical)
+✓ Check all grant amounts (BUS grant £7,500 for heat pumps as of 2024)
+✓ Ensure product recommendations are current
+✓ Add disclaimers for financial advice
+✓ Include "last updated" dates in frontmatter
+✓ Make content actionable with clear next steps
+✓ Add Cost Saver app CTAs naturally throughout
+
+Thank you for helping improve the Cost Saver app content to drive more user engagement and traffic!
+"""
+
+def load_mock_posts(ts_path='lib/blogService.ts'):
+    """Structured records for every post in MOCK_POSTS"""
+    posts = extract_mock_posts(ts_path)
+    print(f"Found {len(posts)} mock blog posts")
+    return posts
+
+def mock_post_markdown(post):
+    """A mock post as a blog/ markdown file with frontmatter"""
+    read_time = max(1, math.ceil(len(post.content.split()) / 200))
+    frontmatter = '\n'.join([
+        f"title: {json.dumps(post.title, ensure_ascii=False)}",
+        f"date: {json.dumps(post.date)}",
+        f"excerpt: {json.dumps(post.excerpt, ensure_ascii=False)}",
+        f"tags: {json.dumps(post.tags, ensure_ascii=False)}",
+        f"slug: {json.dumps(post.slug)}",
+        'author: "Cost Saver Team"',
+        f'readTime: "{read_time} min read"',
+        f"category: {json.dumps(post.category)}",
+    ])
+    return f"---\n{frontmatter}\n---\n\n{post.content.strip()}\n"
+
+def export_markdown(posts, output_dir):
+    """Write each mock post to output_dir as DATE-SLUG.md"""
+    os.makedirs(output_dir, exist_ok=True)
+    for post in posts:
+        filename = f"{post.date}-{post.slug}.md" if post.date else f"{post.slug}.md"
+        with open(os.path.join(output_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(mock_post_markdown(post))
+        print(f"📄 Exported {filename}")
+
+def delta_section(number, source, delta):
+    """Prompt section for a post with only its new or changed sections, in merge markers"""
+    unchanged = '; '.join(section.heading or 'Introduction' for section in delta.unchanged) or 'none'
+    removed = f"Removed since last round: {'; '.join(delta.removed)}\n" if delta.removed else ''
+    blocks = '\n'.join(section_block(section) for section in delta.changed)
+    return f"""
+-----------------------------------------------------------
+BLOG POST #{number} (changed sections only)
+-----------------------------------------------------------
+{source}
+Status: NEEDS ENHANCEMENT (CHANGED SECTIONS ONLY)
+Already enhanced, for context only: {unchanged}
+{removed}
+{blocks}
+"""
+
+def iter_post_sections(markdown_paths, mock_posts, state=None, delta_only=False):
+    """Yield (post number, title, prompt section) one post at a time.
+
+    Every markdown post is diffed against state (a SectionState) when one is
+    given. With delta_only, posts unchanged since the last build are skipped
+    and changed ones carry only their new or changed sections. Mock posts have
+    no file to merge a reply into, so they are always sent in full.
+    """
+    number = 0
+    for md_path in markdown_paths:
+        if not os.path.exists(md_path):
+            print(f"⚠️  Markdown blog not found, skipping: {md_path}")
+            continue
+        with open(md_path, 'r', encoding='utf-8') as f:
+            md_blog = f.read()
+        number += 1
+        title_match = re.search(r'^title:\s*"?(.+?)"?\s*$', md_blog, re.MULTILINE)
+        title = title_match.group(1) if title_match else os.path.basename(md_path)
+        delta = state.diff(os.path.basename(md_path), md_blog) if state else None
+        if delta_only and delta.status == 'unchanged':
+            continue
+        if delta_only and delta.status == 'changed':
+            yield number, title, delta_section(number, f"Filename: {os.path.basename(md_path)}\n"
+                                                       "Source: /blog folder (published)", delta)
+            continue
+        yield number, title, f"""
+-----------------------------------------------------------
+BLOG POST #{number} (from markdown file)
+-----------------------------------------------------------
+Filename: {os.path.basename(md_path)}
+Source: /blog folder (published)
+Status: NEEDS ENHANCEMENT
+
+{md_blog}
+
+"""
+
+    for post in mock_posts:
+        number += 1
+        content = post.content
+        title = post.title or f"Blog Post {number}"
+        yield number, title, f"""
+-----------------------------------------------------------
+BLOG POST #{number}
+-----------------------------------------------------------
+Title: {title}
+Source: Mock data in blogService.ts (NOT YET CREATED AS FILE)
+Status: NEEDS ENHANCEMENT + FILE CREATION
+
+{content}
+
+"""
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Build the ChatGPT blog enhancement prompt')
+    parser.add_argument('--markdown', action='append', default=None,
+                        help=f'Published markdown post to include (repeatable, default: {MARKDOWN_BLOG})')
+    parser.add_argument('--output', default=OUTPUT_PATH, help='Prompt file to write')
+    parser.add_argument('--export-markdown', metavar='DIR',
+                        help='Also write the mock posts to DIR as markdown files with frontmatter')
+    parser.add_argument('--token-budget', type=int, default=DEFAULT_TOKEN_BUDGET,
+                        help=f'Estimated tokens per prompt file (default: {DEFAULT_TOKEN_BUDGET})')
+    parser.add_argument('--delta', action='store_true',
+                        help='Only include posts and H2 sections changed since the last round')
+    parser.add_argument('--mark-sent', action='store_true',
+                        help='Record this build as sent, so the next --delta build is compared against it')
+    parser.add_argument('--compress', action='store_true',
+                        help='Also write .gz (and, with brotli installed, .br) siblings of the prompt files')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    mock_posts = load_mock_posts()
+    if args.export_markdown:
+        export_markdown(mock_posts, args.export_markdown)
+
+    markdown_paths = args.markdown or [MARKDOWN_BLOG]
+    if args.delta:
+        # merge writes a reply back into a post file, and the mock posts have none
+        if not any(os.path.exists(path) for path in markdown_paths):
+            print("❌ --delta needs a published markdown post to merge replies into, and there is none: "
+                  "write the mock posts out with --export-markdown DIR and pass them with --markdown",
+                  file=sys.stderr)
+            return 1
+        if mock_posts:
+            print(f"⚠️  --delta leaves out the {len(mock_posts)} mock post(s): a reply to them can't be merged "
+                  "back (export them with --export-markdown and pass them with --markdown)")
+            mock_posts = []
+
+    total = 0
+    state = SectionState()
+    header = PROMPT_HEADER + DELTA_NOTE if args.delta else PROMPT_HEADER
+    writer = PromptShardWriter(args.output, lambda shard: header,
+                               lambda shard, count: PROMPT_FOOTER.format(count=count),
+                               token_budget=args.token_budget)
+    with writer:
+        for number, title, section in iter_post_sections(markdown_paths, mock_posts,
+                                                         state, args.delta):
+            writer.add_post(number, title, section)
+            total += 1
+            print(f"Added Blog #{number}: {title}")
+
+    # Only a prompt that was actually sent (or a merged reply) moves the baseline
+    if args.mark_sent:
+        state.save()
+        print("📌 Recorded this build as the baseline for the next --delta round")
+
+    if args.delta and not total:
+        print("⏭️  Nothing changed since the last round")
+    print(f"\n✓ Document created successfully!")
+    for shard in writer.shards:
+        print(f"Location: {shard['file']} ({len(shard['posts'])} blogs, ~{shard['tokens']:,} tokens, {shard['chars']:,} characters)")
+    for number in writer.oversized:
+        print(f"⚠️  Blog #{number} alone exceeds the {args.token_budget:,} token budget")
+    print(f"Shard manifest: {writer.manifest_path}")
+    print(f"Total blogs: {total}")
+    if args.compress:
+        from blog_pipeline.precompress import precompress, report
+        report(*precompress([shard['file'] for shard in writer.shards] + [writer.manifest_path]))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""
+Delta-only enhancement prompts from per-section content hashes
+
+The SHA-256 of every post, and of every H2 section in it, is recorded in
+.blog_cache/prompt_sections.json when a prompt is marked as sent
+(prompt --mark-sent) and when a reply is merged back. Building a prompt only
+reads that record, so it can be rebuilt as often as needed. With --delta a
+build compares against it: unchanged posts are left out, new posts are sent
+in full, and changed posts send only the sections that are new or changed. Each of those sections is wrapped in markers carrying its
+heading anchor, and the unchanged headings are listed for context:
+
+    <<<SECTION energy-price-cap>>>
+    ## Energy Price Cap
+    ...
+    <<<END SECTION>>>
+
+ChatGPT is asked to return each section inside the same markers, so the
+reply can be merged back into the post:
+
+    python -m blog_pipeline merge blog/POST.md reply.txt
+
+A post's "introduction" section is everything before its first H2: the
+frontmatter, title and opening paragraphs.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+from collections import namedtuple
+
+from blog_pipeline.html_render import heading_anchor
+from blog_pipeline.output_stage import write_if_changed
+
+STATE_PATH = os.path.join('.blog_cache', 'prompt_sections.json')
+STATE_VERSION = 1
+INTRODUCTION = 'introduction'
+
+Section = namedtuple('Section', 'anchor heading text')
+PostDelta = namedtuple('PostDelta', 'status changed unchanged removed')
+
+_H2_RE = re.compile(r'##[ \t]+(.+?)[ \t#]*$')
+_FENCE_RE = re.compile(r'\s*(```|~~~)')
+_REPLY_RE = re.compile(r'^<<<SECTION ([^>\s]+)>>>\n(.*?)\n?<<<END SECTION>>>', re.MULTILINE | re.DOTALL)
+
+def _digest(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def split_sections(markdown):
+    """Sections of a post: the introduction, then one per H2 (fenced code is not split)"""
+    sections = []
+    used = {INTRODUCTION}
+    anchor, heading, lines = INTRODUCTION, '', []
+    fenced = False
+    for line in markdown.splitlines(keepends=True):
+        if _FENCE_RE.match(line):
+            fenced = not fenced
+        match = None if fenced else _H2_RE.match(line.rstrip('\r\n'))
+        if match:
+            sections.append(Section(anchor, heading, ''.join(lines)))
+            anchor, heading, lines = heading_anchor(match.group(1), used), match.group(1), []
+        lines.append(line)
+    sections.append(Section(anchor, heading, ''.join(lines)))
+    if not sections[0].text.strip():
+        sections.pop(0)
+    return sections
+
+def section_block(section):
+    """A section wrapped in the markers merge_reply looks for"""
+    return f"<<<SECTION {section.anchor}>>>\n{section.text.rstrip()}\n<<<END SECTION>>>\n"
+
+def parse_reply(reply):
+    """{anchor: text} for every marked section in a ChatGPT reply"""
+    return {anchor: text.rstrip() + '\n' for anchor, text in _REPLY_RE.findall(reply.replace('\r\n', '\n'))}
+
+def merge_reply(markdown, reply):
+    """The post with each section found in reply swapped in. Returns (markdown, merged anchors)"""
+    replacements = parse_reply(reply)
+    merged = []
+    out = []
+    sections = split_sections(markdown)
+    for index, section in enumerate(sections):
+        text = replacements.get(section.anchor)
+        if text is None:
+            out.append(section.text)
+            continue
+        merged.append(section.anchor)
+        # Keep the blank line that separated this section from the next
+        out.append(text + ('\n' if index < len(sections) - 1 else ''))
+    return ''.join(out), merged
+
+class SectionState:
+    """Post and section hashes from the last prompt build"""
+
+    def __init__(self, path=STATE_PATH):
+        self.path = path
+        self.posts = self._load()
+        self._seen = {}
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == STATE_VERSION:
+                return data['posts']
+        except (OSError, ValueError, KeyError):
+            pass
+        return {}
+
+    def diff(self, key, markdown):
+        """How a post differs from the last round, and remember it for save()"""
+        sections = split_sections(markdown)
+        hashes = {section.anchor: _digest(section.text) for section in sections}
+        self._seen[key] = {'hash': _digest(markdown), 'sections': hashes}
+        previous = self.posts.get(key)
+        if previous is None:
+            return PostDelta('new', sections, [], [])
+        if previous['hash'] == self._seen[key]['hash']:
+            return PostDelta('unchanged', [], sections, [])
+        old = previous['sections']
+        changed = [section for section in sections if old.get(section.anchor) != hashes[section.anchor]]
+        unchanged = [section for section in sections if old.get(section.anchor) == hashes[section.anchor]]
+        removed = [anchor for anchor in old if anchor not in hashes]
+        return PostDelta('changed', changed, unchanged, removed)
+
+    def save(self):
+        """Record every post diffed this run as the new baseline"""
+        posts = dict(self.posts, **self._seen)
+        write_if_changed(self.path, json.dumps({'version': STATE_VERSION, 'posts': posts},
+                                               ensure_ascii=False, separators=(',', ':'), sort_keys=True))
+        self.posts = posts
+        self._seen = {}
+
+def merge_main(argv=None):
+    parser = argparse.ArgumentParser(description='Merge the sections of a ChatGPT reply back into a post')
+    parser.add_argument('post', help='Markdown post the delta prompt was built from')
+    parser.add_argument('reply', help='Text file holding the reply with its <<<SECTION>>> markers')
+    args = parser.parse_args(argv)
+    with open(args.post, 'r', encoding='utf-8') as f:
+        markdown = f.read()
+    with open(args.reply, 'r', encoding='utf-8') as f:
+        reply = f.read()
+    merged_markdown, merged = merge_reply(markdown, reply)
+    missing = sorted(set(parse_reply(reply)) - set(merged))
+    write_if_changed(args.post, merged_markdown)
+    # The merged sections are enhanced already: don't send them again next round
+    state = SectionState()
+    state.diff(os.path.basename(args.post), merged_markdown)
+    state.save()
+    print(f"✓ Merged {len(merged)} section(s) into {args.post}")
+    for anchor in missing:
+        print(f"⚠️  No section '{anchor}' in {args.post}, left out")
+
+if __name__ == '__main__':
+    merge_main()
@@ -0,0 +1,138 @@
+"""
+Streaming, token-budgeted prompt files for ChatGPT
+
+PromptShardWriter writes prompt sections straight to disk as they are
+produced, starting a new shard whenever the next post would push the current
+one past the token budget. Every shard repeats the instructions header and
+deliverables footer so each can be pasted into its own conversation, and a
+post is never split across shards (a post bigger than the whole budget gets a
+shard to itself). A JSON manifest records which posts went into which shard.
+
+Token counts are a local estimate, with no tokenizer download: roughly four
+characters per token for English prose, but never less than one token per
+word or symbol, which covers markdown punctuation, tables and numbers.
+"""
+import glob
+import json
+import math
+import os
+import re
+
+CHARS_PER_TOKEN = 4
+DEFAULT_TOKEN_BUDGET = 100_000
+MANIFEST_VERSION = 1
+
+_PIECE_RE = re.compile(r'\w+|[^\w\s]')
+_PART_RE = re.compile(r'_part\d+')
+
+def estimate_tokens(text):
+    """Fast upper-leaning token estimate for GPT-style tokenizers"""
+    if not text:
+        return 0
+    return max(math.ceil(len(text) / CHARS_PER_TOKEN), len(_PIECE_RE.findall(text)))
+
+class PromptShardWriter:
+    """Write prompt posts across one or more shard files under a token budget.
+
+    header and footer are callables returning the text for a shard, given the
+    shard number and (for the footer) the number of posts it holds. If
+    everything fits in one shard it is written to base_path itself;
+    otherwise shards are base_part01.txt, base_part02.txt, ...
+    """
+
+    def __init__(self, base_path, header, footer, token_budget=DEFAULT_TOKEN_BUDGET):
+        self.base_path = base_path
+        self.header = header
+        self.footer = footer
+        self.token_budget = token_budget
+        stem, self._suffix = os.path.splitext(base_path)
+        self._stem = stem
+        self.manifest_path = f"{stem}.manifest.json"
+        self.shards = []
+        self.oversized = []
+        self._file = None
+        self._shard = None
+
+    def _part_path(self, number):
+        return f"{self._stem}_part{number:02d}{self._suffix}"
+
+    def _write(self, text):
+        self._file.write(text)
+        self._shard['tokens'] += estimate_tokens(text)
+        self._shard['chars'] += len(text)
+
+    def _open_shard(self):
+        number = len(self.shards) + 1
+        self._shard = {'file': self._part_path(number), 'tokens': 0, 'chars': 0, 'posts': []}
+        self.shards.append(self._shard)
+        self._file = open(self._shard['file'], 'w', encoding='utf-8')
+        self._write(self.header(number))
+
+    def _close_shard(self):
+        if self._file is None:
+            return
+        self._write(self.footer(len(self.shards), len(self._shard['posts'])))
+        self._file.close()
+        self._file = None
+
+    def add_post(self, post_id, title, text):
+        """Append one post's prompt section, starting a new shard if it wouldn't fit"""
+        tokens = estimate_tokens(text)
+        if self._file is not None and self._shard['posts']:
+            closing = estimate_tokens(self.footer(len(self.shards), len(self._shard['posts']) + 1))
+            if self._shard['tokens'] + tokens + closing > self.token_budget:
+                self._close_shard()
+        if self._file is None:
+            self._open_shard()
+        self._write(text)
+        self._shard['posts'].append({'id': post_id, 'title': title, 'tokens': tokens})
+        if self._shard['tokens'] > self.token_budget:
+            self.oversized.append(post_id)
+
+    def close(self):
+        """Finish the last shard, tidy up old shards and write the manifest"""
+        if not self.shards:
+            self._open_shard()
+        self._close_shard()
+        if len(self.shards) == 1:
+            os.replace(self.shards[0]['file'], self.base_path)
+            self.shards[0]['file'] = self.base_path
+        current = {shard['file'] for shard in self.shards}
+        # Part numbers grow past two digits, so match any run of digits
+        for stale in glob.glob(glob.escape(self._stem) + '_part[0-9]*' + glob.escape(self._suffix)):
+            part = stale[len(self._stem):len(stale) - len(self._suffix)]
+            if _PART_RE.fullmatch(part) and stale not in current:
+                os.remove(stale)
+        if len(self.shards) > 1 and os.path.exists(self.base_path):
+            os.remove(self.base_path)
+        self._write_manifest()
+        return self.shards
+
+    def _write_manifest(self):
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'tokenBudget': self.token_budget,
+            'tokenEstimate': f"max(chars / {CHARS_PER_TOKEN}, words + symbols)",
+            'shards': [{
+                'file': os.path.basename(shard['file']),
+                'tokens': shard['tokens'],
+                'chars': shard['chars'],
+                'posts': [post['id'] for post in shard['posts']],
+            } for shard in self.shards],
+            'posts': {post['id']: {'title': post['title'], 'tokens': post['tokens'],
+                                   'shard': os.path.basename(shard['file'])}
+                      for shard in self.shards for post in shard['posts']},
+        }
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._file is not None:
+            self._file.close()
+        return False
@@ -0,0 +1,365 @@
+"""
+Readability and SEO metrics against the enhancement prompt's targets
+
+The ChatGPT prompt (blog_pipeline/prompt.py) asks for Flesch reading ease
+60-70, 1-2% density for the primary keyword, a heading every 150-200 words
+and paragraphs of at most 3-4 sentences. This measures all four, per post and
+per H2 section.
+
+Every post is tokenized once, in a single pass over its lines, into flat
+corpus-wide arrays: one entry per word (vocabulary id, sentence, section),
+per sentence (paragraph, section) and per section (post, headings). Syllables
+are counted once per distinct word. Every metric is then a np.bincount or a
+shifted-array comparison over those arrays, so thousands of posts take
+seconds. Headings, tables, code and images are not prose and are left out of
+the counts. List items count as sentences but not as paragraphs.
+
+When NumPy is available the manifest carries each post's figures under
+"metrics". For the corpus report:
+
+    python -m blog_pipeline readability [blog_dir] [--sections] [--json PATH]
+"""
+import argparse
+import json
+import math
+import os
+import re
+
+import numpy as np
+
+from blog_pipeline.frontmatter import FrontmatterError, has_frontmatter, read_post
+from blog_pipeline.output_stage import write_if_changed
+from blog_pipeline.post_manifest import is_post_file
+
+# Targets set by the enhancement prompt
+FLESCH_TARGET = (60.0, 70.0)
+KEYWORD_DENSITY_TARGET = (0.01, 0.02)
+WORDS_PER_HEADING_TARGET = (150.0, 200.0)
+MAX_PARAGRAPH_SENTENCES = 4
+KEYWORDS = ('UK energy bills', 'energy saving tips', 'reduce energy costs', 'energy tariffs',
+            'smart meters', 'heat pumps', 'solar panels', 'insulation')
+
+_WORD_RE = re.compile(r"[^\W\d_](?:[\w'’-]*\w)?|\d[\d,.]*\d|\d")
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?…])["”’)\]]*\s+')
+_HEADING_RE = re.compile(r'(#{1,6})\s+(.*)')
+_LIST_ITEM_RE = re.compile(r'\s*(?:[-*+•]|\d+[.)])\s+(.*)')
+_FENCE_RE = re.compile(r'\s*(```|~~~)')
+_SKIP_RE = re.compile(r'\s*(\||!\[|(?:[-*_]\s*){3,}$)')
+_IMAGE_RE = re.compile(r'!\[[^\]]*\]\([^)]*\)')
+_LINK_RE = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+_VOWEL_GROUP_RE = re.compile(r'[aeiouy]+')
+
+def count_syllables(word):
+    """Vowel-group syllable estimate for an English word (numbers count as one)"""
+    word = word.lower().replace('’', "'").split("'")[0]
+    if not word or not word[0].isalpha():
+        return 1
+    count = len(_VOWEL_GROUP_RE.findall(word))
+    # Silent final e ('make'), but not 'table' or 'free'
+    if word.endswith('e') and not word.endswith(('le', 'ee', 'ye')) and count > 1:
+        count -= 1
+    return max(1, count)
+
+def normalize_word(word):
+    """Lower case with plural and possessive endings dropped, for keyword matching"""
+    word = word.lower().replace('’', "'")
+    if word.endswith("'s"):
+        word = word[:-2]
+    if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+        word = word[:-1]
+    return word
+
+def _prose(text):
+    text = _IMAGE_RE.sub(' ', text)
+    return _LINK_RE.sub(r'\1', text)
+
+class CorpusTokens:
+    """Flat word, sentence, paragraph and section arrays for a set of posts"""
+
+    def __init__(self):
+        self.posts = []
+        self.vocabulary = {}
+        self._words = []
+        self._sentence_lengths = []
+        self._sentence_paragraph = []
+        self._sentence_section = []
+        self._paragraph_section = []
+        self._section_post = []
+        self._section_headings = []
+        self.section_titles = []
+
+    def _word_id(self, word):
+        word_id = self.vocabulary.get(word)
+        if word_id is None:
+            word_id = self.vocabulary[word] = len(self.vocabulary)
+        return word_id
+
+    def _new_section(self, title):
+        self._section_post.append(len(self.posts) - 1)
+        self._section_headings.append(0)
+        self.section_titles.append(title)
+
+    def _add_unit(self, text, paragraph):
+        """Split text into sentences and record its words"""
+        section = len(self._section_post) - 1
+        for sentence in _SENTENCE_END_RE.split(_prose(text)):
+            words = _WORD_RE.findall(sentence)
+            if not words:
+                continue
+            self._sentence_section.append(section)
+            self._sentence_paragraph.append(paragraph)
+            self._sentence_lengths.append(len(words))
+            self._words.extend(map(self._word_id, words))
+
+    def add_post(self, name, body):
+        """Tokenize one post's markdown body"""
+        self.posts.append(name)
+        self._new_section('')
+        paragraph = []
+        fenced = False
+
+        def flush():
+            if paragraph:
+                paragraph_id = len(self._paragraph_section)
+                self._paragraph_section.append(len(self._section_post) - 1)
+                self._add_unit(' '.join(paragraph), paragraph_id)
+                paragraph.clear()
+
+        for line in body.splitlines():
+            if _FENCE_RE.match(line):
+                flush()
+                fenced = not fenced
+                continue
+            if fenced:
+                continue
+            stripped = line.strip()
+            heading = _HEADING_RE.match(stripped)
+            if not stripped or heading or _SKIP_RE.match(line):
+                flush()
+                if heading:
+                    level = len(heading.group(1))
+                    if level == 2:
+                        self._new_section(heading.group(2).strip())
+                    if level >= 2:
+                        self._section_headings[-1] += 1
+                continue
+            item = _LIST_ITEM_RE.match(line)
+            if item:
+                flush()
+                self._add_unit(item.group(1), -1)
+            else:
+                paragraph.append(stripped)
+        flush()
+
+    def arrays(self):
+        """Everything as NumPy arrays, with per-word post/section ids resolved"""
+        words = np.asarray(self._words, dtype=np.int64)
+        sentence_section = np.asarray(self._sentence_section, dtype=np.int64)
+        word_sentence = np.repeat(np.arange(len(sentence_section)), self._sentence_lengths)
+        section_post = np.asarray(self._section_post, dtype=np.int64)
+        vocabulary = list(self.vocabulary)
+        syllables = np.fromiter((count_syllables(word) for word in vocabulary), dtype=np.int64,
+                                count=len(vocabulary))
+        normalized = {}
+        normalized_ids = np.fromiter((normalized.setdefault(normalize_word(word), len(normalized))
+                                      for word in vocabulary), dtype=np.int64, count=len(vocabulary))
+        word_section = sentence_section[word_sentence] if len(words) else words
+        return {
+            'words': words,
+            'normalized': normalized_ids[words] if len(words) else words,
+            'normalized_vocabulary': normalized,
+            'syllables': syllables[words] if len(words) else words,
+            'word_section': word_section,
+            'word_post': section_post[word_section] if len(words) else words,
+            'sentence_section': sentence_section,
+            'sentence_paragraph': np.asarray(self._sentence_paragraph, dtype=np.int64),
+            'paragraph_section': np.asarray(self._paragraph_section, dtype=np.int64),
+            'section_post': section_post,
+            'section_headings': np.asarray(self._section_headings, dtype=np.int64),
+        }
+
+def _ratio(numerator, denominator):
+    return np.divide(numerator, denominator, out=np.zeros(len(numerator)), where=denominator > 0)
+
+def keyword_hits(normalized, groups, vocabulary, keywords, count):
+    """(keywords x groups) words covered by each keyword phrase, counted per group id"""
+    hits = np.zeros((len(keywords), count))
+    for row, phrase in enumerate(keywords):
+        ids = [vocabulary.get(normalize_word(word)) for word in _WORD_RE.findall(phrase)]
+        n = len(ids)
+        if None in ids or len(normalized) < n:
+            continue
+        span = len(normalized) - n + 1
+        match = np.ones(span, dtype=bool)
+        for offset, word_id in enumerate(ids):
+            match &= normalized[offset:offset + span] == word_id
+        # A phrase may not run from one group into the next
+        match &= groups[:span] == groups[n - 1:]
+        hits[row] = np.bincount(groups[:span][match], minlength=count) * n
+    return hits
+
+def _metrics(a, groups, sentence_groups, paragraph_groups, heading_counts, count, keywords):
+    """Metric columns for count groups (posts or sections)"""
+    words = np.bincount(groups, minlength=count).astype(float)
+    syllables = np.bincount(groups, weights=a['syllables'], minlength=count)
+    sentences = np.bincount(sentence_groups, minlength=count).astype(float)
+    flesch = 206.835 - 1.015 * _ratio(words, sentences) - 84.6 * _ratio(syllables, words)
+
+    in_paragraph = a['sentence_paragraph'] >= 0
+    paragraph_sentences = np.bincount(a['sentence_paragraph'][in_paragraph],
+                                      minlength=len(paragraph_groups)).astype(float)
+    paragraphs = np.bincount(paragraph_groups, minlength=count).astype(float)
+    long_paragraphs = np.bincount(paragraph_groups, weights=paragraph_sentences > MAX_PARAGRAPH_SENTENCES,
+                                  minlength=count)
+    longest = np.zeros(count)
+    np.maximum.at(longest, paragraph_groups, paragraph_sentences)
+
+    hits = keyword_hits(a['normalized'], groups, a['normalized_vocabulary'], keywords, count)
+    primary = hits.argmax(axis=0) if len(keywords) else np.zeros(count, dtype=np.int64)
+    density = _ratio(hits.max(axis=0), words) if len(keywords) else np.zeros(count)
+    return {
+        'words': words,
+        'sentences': sentences,
+        'flesch': np.where(words > 0, flesch, 0.0),
+        'words_per_sentence': _ratio(words, sentences),
+        'words_per_heading': _ratio(words, heading_counts.astype(float)),
+        'headings': heading_counts,
+        'paragraphs': paragraphs,
+        'sentences_per_paragraph': _ratio(np.bincount(paragraph_groups, weights=paragraph_sentences,
+                                                      minlength=count), paragraphs),
+        'longest_paragraph': longest,
+        'long_paragraphs': long_paragraphs,
+        'primary': primary,
+        'has_keyword': hits.max(axis=0) > 0 if len(keywords) else np.zeros(count, dtype=bool),
+        'density': density,
+    }
+
+def _records(columns, index, keywords):
+    """JSON-ready metrics for one post or section"""
+    words = int(columns['words'][index])
+    headings = int(columns['headings'][index])
+    return {
+        'words': words,
+        'sentences': int(columns['sentences'][index]),
+        'fleschReadingEase': round(float(columns['flesch'][index]), 1),
+        'wordsPerSentence': round(float(columns['words_per_sentence'][index]), 1),
+        'headings': headings,
+        'wordsPerHeading': round(float(columns['words_per_heading'][index])) if headings else None,
+        'paragraphs': int(columns['paragraphs'][index]),
+        'sentencesPerParagraph': round(float(columns['sentences_per_paragraph'][index]), 1),
+        'longParagraphs': int(columns['long_paragraphs'][index]),
+        'primaryKeyword': keywords[int(columns['primary'][index])] if columns['has_keyword'][index] else None,
+        'keywordDensity': round(float(columns['density'][index]), 4),
+        'readMinutes': max(1, math.ceil(words / 200)) if words else 0,
+    }
+
+def analyze(tokens, keywords=KEYWORDS):
+    """({post: metrics}, {post: [(section title, metrics)]}) for a CorpusTokens"""
+    a = tokens.arrays()
+    post_count = len(tokens.posts)
+    section_count = len(a['section_post'])
+    section_post = a['section_post']
+    sentence_post = section_post[a['sentence_section']] if len(a['sentence_section']) else a['sentence_section']
+    paragraph_post = section_post[a['paragraph_section']] if len(a['paragraph_section']) else a['paragraph_section']
+
+    post_columns = _metrics(a, a['word_post'], sentence_post, paragraph_post,
+                            np.bincount(section_post, weights=a['section_headings'], minlength=post_count),
+                            post_count, keywords)
+    section_columns = _metrics(a, a['word_section'], a['sentence_section'], a['paragraph_section'],
+                               a['section_headings'], section_count, keywords)
+    posts = {name: _records(post_columns, index, keywords) for index, name in enumerate(tokens.posts)}
+    sections = {name: [] for name in tokens.posts}
+    for index in range(section_count):
+        sections[tokens.posts[section_post[index]]].append(
+            (tokens.section_titles[index] or 'Introduction', _records(section_columns, index, keywords)))
+    return posts, sections
+
+def tokenize_blog(blog_dir='blog'):
+    """CorpusTokens for every post in blog_dir whose frontmatter parses (notes without any are left out)"""
+    tokens = CorpusTokens()
+    for filename in sorted(os.listdir(blog_dir)):
+        if not is_post_file(filename):
+            continue
+        with open(os.path.join(blog_dir, filename), 'r', encoding='utf-8') as f:
+            text = f.read()
+        if not has_frontmatter(text):
+            continue
+        try:
+            _, body = read_post(text)
+        except FrontmatterError:
+            continue
+        tokens.add_post(filename, body)
+    return tokens
+
+def post_metrics(blog_dir='blog'):
+    """{filename: metrics} for the manifest"""
+    return analyze(tokenize_blog(blog_dir))[0]
+
+def _within(value, target):
+    return value is not None and target[0] <= value <= target[1]
+
+def targets_met(metrics):
+    """Which of the prompt's four targets a post or section meets"""
+    return {
+        'flesch': _within(metrics['fleschReadingEase'], FLESCH_TARGET),
+        'keywordDensity': _within(metrics['keywordDensity'], KEYWORD_DENSITY_TARGET),
+        'headingSpacing': _within(metrics['wordsPerHeading'], WORDS_PER_HEADING_TARGET),
+        'paragraphs': metrics['longParagraphs'] == 0,
+    }
+
+def _mark(ok):
+    return '✓' if ok else '⚠️'
+
+def _row(label, metrics):
+    met = targets_met(metrics)
+    per_heading = metrics['wordsPerHeading']
+    flesch = f"{metrics['fleschReadingEase']:6.1f}" if metrics['words'] else '     -'
+    return (f"  {flesch} {_mark(met['flesch'])} "
+            f"{metrics['keywordDensity']:6.1%} {_mark(met['keywordDensity'])} "
+            f"{per_heading if per_heading is not None else '-':>5} {_mark(met['headingSpacing'])} "
+            f"{metrics['longParagraphs']:4} {_mark(met['paragraphs'])}  {label}")
+
+def report(blog_dir, posts, sections=None):
+    """Print the corpus report: one row per post (and per section), then target totals"""
+    total_words = sum(metrics['words'] for metrics in posts.values())
+    print("=" * 60)
+    print(f"READABILITY: {blog_dir} ({len(posts)} posts, {total_words:,} words)")
+    print("=" * 60)
+    print(f"  {'Flesch':>8} {'Keyword':>8} {'W/head':>7} {'Long¶':>6}  Post")
+    for name, metrics in posts.items():
+        print(_row(name, metrics))
+        for title, section in (sections or {}).get(name, []):
+            print(_row(f"    {title[:60]}", section))
+    print("-" * 60)
+    counts = {key: sum(targets_met(metrics)[key] for metrics in posts.values()) for key in
+              ('flesch', 'keywordDensity', 'headingSpacing', 'paragraphs')}
+    print(f"  In target: Flesch {FLESCH_TARGET[0]:.0f}-{FLESCH_TARGET[1]:.0f} {counts['flesch']}/{len(posts)}, "
+          f"keyword density {counts['keywordDensity']}/{len(posts)}, "
+          f"heading every {WORDS_PER_HEADING_TARGET[0]:.0f}-{WORDS_PER_HEADING_TARGET[1]:.0f} words "
+          f"{counts['headingSpacing']}/{len(posts)}, "
+          f"paragraphs <= {MAX_PARAGRAPH_SENTENCES} sentences {counts['paragraphs']}/{len(posts)}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Readability and SEO metrics for every post')
+    parser.add_argument('blog_dir', nargs='?', default='blog', help='Directory of posts (default: blog)')
+    parser.add_argument('--sections', action='store_true', help='Also list every H2 section')
+    parser.add_argument('--json', metavar='PATH', help='Write the full per-post and per-section report as JSON')
+    args = parser.parse_args(argv)
+    posts, sections = analyze(tokenize_blog(args.blog_dir))
+    report(args.blog_dir, posts, sections if args.sections else None)
+    if args.json:
+        write_if_changed(args.json, json.dumps({
+            'targets': {
+                'fleschReadingEase': FLESCH_TARGET,
+                'keywordDensity': KEYWORD_DENSITY_TARGET,
+                'wordsPerHeading': WORDS_PER_HEADING_TARGET,
+                'maxParagraphSentences': MAX_PARAGRAPH_SENTENCES,
+            },
+            'posts': {name: dict(metrics, sections=[dict(section, title=title)
+                                                    for title, section in sections[name]])
+                      for name, metrics in posts.items()},
+        }, ensure_ascii=False, indent=2))
+        print(f"📊 Wrote {args.json}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+Related posts from TF-IDF cosine similarity
+
+Every post becomes a sparse TF-IDF vector over the same normalised tokens as
+the search index (title and tags weighted up, stopwords dropped), and the
+top RELATED_COUNT most similar posts are written into each post's manifest
+entry as "related".
+
+Vectors are stored as CSR/CSC arrays and similarity is computed a block of
+rows at a time: each row's non-zeros are joined against the posting list of
+their term and summed with np.bincount into a dense (block x posts) score
+matrix, so the work scales with the number of shared terms rather than with
+posts squared, and memory stays bounded by BLOCK_CELLS however large the
+blog gets. Terms in a single post can't link anything and terms in more than
+MAX_DF of posts barely do, so both are pruned before the join.
+
+Run directly to print the related posts for every post:
+
+    python -m blog_pipeline.related_posts
+"""
+import math
+
+import numpy as np
+
+from blog_pipeline.search_index import CACHE_PATH, collect_documents
+
+RELATED_COUNT = 3
+MAX_DF = 0.5
+BLOCK_CELLS = 1 << 22  # score cells per block (32MB of float64)
+
+def build_tfidf(documents):
+    """L2-normalised TF-IDF rows as CSR arrays (indptr, indices, data)"""
+    doc_count = len(documents)
+    df = {}
+    for slug, terms, length in documents:
+        for term in terms:
+            df[term] = df.get(term, 0) + 1
+    max_df = max(1, int(MAX_DF * doc_count))
+    vocabulary = {}
+    for term in sorted(df):
+        if 1 < df[term] <= max_df:
+            vocabulary[term] = len(vocabulary)
+    idf = np.empty(len(vocabulary), dtype=np.float32)
+    for term, term_id in vocabulary.items():
+        idf[term_id] = math.log((1 + doc_count) / (1 + df[term])) + 1
+
+    indptr = np.zeros(doc_count + 1, dtype=np.int64)
+    indices = []
+    tf = []
+    for doc_id, (slug, terms, length) in enumerate(documents):
+        for term, (weight, positions) in terms.items():
+            term_id = vocabulary.get(term)
+            if term_id is not None:
+                indices.append(term_id)
+                tf.append(weight)
+        indptr[doc_id + 1] = len(indices)
+    indices = np.asarray(indices, dtype=np.int64)
+    data = (1 + np.log(np.asarray(tf, dtype=np.float32))) * idf[indices]
+
+    # Normalise each row so dot products are cosines
+    rows = np.repeat(np.arange(doc_count), np.diff(indptr))
+    norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=doc_count))
+    norms[norms == 0] = 1
+    data = (data / norms[rows]).astype(np.float32)
+    return indptr, indices, data, len(vocabulary)
+
+def _transpose(indptr, indices, data, column_count):
+    """CSC arrays for the same matrix: posting lists per term"""
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    order = np.argsort(indices, kind='stable')
+    col_ptr = np.zeros(column_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=column_count), out=col_ptr[1:])
+    return col_ptr, rows[order], data[order]
+
+def _block_scores(start, stop, csr, csc, doc_count):
+    """Dense cosine similarities of rows start:stop against every post"""
+    indptr, indices, data = csr
+    col_ptr, col_rows, col_data = csc
+    lo, hi = indptr[start], indptr[stop]
+    block_rows = np.repeat(np.arange(stop - start), np.diff(indptr[start:stop + 1]))
+    terms = indices[lo:hi]
+    weights = data[lo:hi]
+
+    # Expand each non-zero into the posting list of its term
+    counts = col_ptr[terms + 1] - col_ptr[terms]
+    total = int(counts.sum())
+    ends = np.cumsum(counts)
+    postings = np.arange(total) - np.repeat(ends - counts - col_ptr[terms], counts)
+    targets = np.repeat(block_rows, counts) * doc_count + col_rows[postings]
+    products = np.repeat(weights, counts) * col_data[postings]
+    scores = np.bincount(targets, weights=products, minlength=(stop - start) * doc_count)
+    return scores.reshape(stop - start, doc_count)
+
+def top_related(documents, count=RELATED_COUNT):
+    """{slug: [related slugs, most similar first]} for tokenised documents"""
+    doc_count = len(documents)
+    slugs = [slug for slug, terms, length in documents]
+    related = {slug: [] for slug in slugs}
+    if doc_count < 2:
+        return related
+
+    indptr, indices, data, term_count = build_tfidf(documents)
+    csr = (indptr, indices, data)
+    csc = _transpose(indptr, indices, data, term_count)
+    k = min(count, doc_count - 1)
+    block = max(1, BLOCK_CELLS // doc_count)
+    for start in range(0, doc_count, block):
+        stop = min(start + block, doc_count)
+        scores = _block_scores(start, stop, csr, csc, doc_count)
+        scores[np.arange(stop - start), np.arange(start, stop)] = 0
+        best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        for row, candidates in enumerate(best):
+            row_scores = scores[row, candidates]
+            # Most similar first, ties broken by post order
+            ranked = candidates[np.lexsort((candidates, -row_scores))]
+            related[slugs[start + row]] = [slugs[doc] for doc in ranked if scores[row, doc] > 0]
+    return related
+
+def related_posts(blog_dir='blog', cache_path=CACHE_PATH, count=RELATED_COUNT):
+    """Related posts for every post in blog_dir, keyed by slug"""
+    documents, _ = collect_documents(blog_dir, cache_path)
+    return top_related(documents, count)
+
+def main():
+    for slug, related in related_posts().items():
+        print(f"📄 {slug}")
+        for other in related:
+            print(f"   → {other}")
+
+if __name__ == '__main__':
+    main()
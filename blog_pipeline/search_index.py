@@ -0,0 +1,363 @@
+"""
+Pre-built full-text search index for the blog
+
+Builds blog/search-index.bin, an array-backed inverted index over each post's
+title, tags, excerpt and body with positional postings, scored with BM25.
+lib/blogSearch.ts reads the same file on the site. Tokens go through the
+same normalisation on both sides: lowercased, accents folded (NFKD, then the
+combining marks in _COMBINING_RE dropped, the same ranges as COMBINING_MARKS
+in blogSearch.ts), US spellings folded to UK ones (optimize -> optimise,
+color -> colour) and plurals trimmed.
+
+Layout (little-endian, every section 4-byte aligned so it can be mmapped and
+viewed as typed arrays in place):
+
+    header    MAGIC, then u32 version, doc count, term count, posting count,
+              position count, and the byte offset of each of the ten sections
+    doc_len   f32[docs]     weighted length of each document
+    slugs     u32[docs + 1] offsets into the slug blob, then the blob
+    terms     u32[terms + 1] offsets into the term blob (terms sorted), then the blob
+    term_post u32[terms + 1] first posting of each term
+    post_doc  u32[postings] document id
+    post_tf   f32[postings] field-weighted term frequency
+    post_pos  u32[postings + 1] first position of each posting
+    positions u32[positions]
+
+Tokenised documents are cached in .blog_cache/ by content hash, so a rebuild
+only re-tokenises the posts that changed before reassembling the arrays.
+"""
+import hashlib
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+import unicodedata
+from array import array
+from bisect import bisect_left
+
+from blog_pipeline.frontmatter import FrontmatterError, read_post
+from blog_pipeline.output_stage import write_if_changed
+from blog_pipeline.post_manifest import is_post_file, post_slug
+
+INDEX_NAME = 'search-index.bin'
+CACHE_PATH = os.path.join('.blog_cache', 'search_docs.json')
+MAGIC = b'BSIX'
+INDEX_VERSION = 1
+TOKENIZER_VERSION = 2
+
+# (field, weight) in the order their positions are laid out
+FIELDS = (('title', 3.0), ('tags', 2.0), ('excerpt', 2.0), ('body', 1.0))
+# Gap between fields so phrases never match across a field boundary
+FIELD_GAP = 1 << 20
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_HEADER = struct.Struct('<4s15I')
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Combining mark blocks dropped after NFKD; COMBINING_MARKS in lib/blogSearch.ts lists the same ranges
+_COMBINING_RE = re.compile('[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]')
+_PHRASE_RE = re.compile(r'"([^"]+)"')
+
+STOPWORDS = frozenset('''
+a about after all also am an and any are as at be because been before being
+between both but by can could did do does doing down during each few for from
+further had has have having he her here hers him his how i if in into is it
+its itself just me more most my no nor not now of off on once only or other
+our ours out over own same she should so some such than that the their theirs
+them then there these they this those through to too under until up very was
+we were what when where which while who whom why will with you your yours
+'''.split())
+
+# US -> UK spellings that the suffix rules below don't cover
+_UK_WORDS = {
+    'color': 'colour', 'favor': 'favour', 'favorite': 'favourite', 'behavior': 'behaviour',
+    'labor': 'labour', 'neighbor': 'neighbour', 'honor': 'honour', 'flavor': 'flavour',
+    'humor': 'humour', 'center': 'centre', 'fiber': 'fibre', 'liter': 'litre',
+    'gray': 'grey', 'program': 'programme', 'tire': 'tyre', 'aluminum': 'aluminium',
+    'fueled': 'fuelled', 'fueling': 'fuelling', 'modeling': 'modelling', 'traveling': 'travelling',
+}
+# Ordered: longest suffixes first
+_UK_SUFFIXES = (
+    ('izations', 'isations'), ('ization', 'isation'), ('izing', 'ising'), ('ized', 'ised'),
+    ('izes', 'ises'), ('ize', 'ise'), ('yzing', 'ysing'), ('yzed', 'ysed'), ('yze', 'yse'),
+)
+
+def _fold_uk(word):
+    word = _UK_WORDS.get(word, word)
+    if len(word) > 5:
+        for us, uk in _UK_SUFFIXES:
+            if word.endswith(us):
+                return word[:-len(us)] + uk
+    return word
+
+def _stem(word):
+    """Trim plurals so 'tariffs' finds 'tariff' (deliberately conservative)"""
+    if len(word) > 4 and word.endswith('ies'):
+        return word[:-3] + 'y'
+    if len(word) > 3 and word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        return word[:-1]
+    return word
+
+def normalize_token(word):
+    return _fold_uk(_stem(word))
+
+def fold_text(text):
+    """Lower case with accents and apostrophes removed, as foldText in blogSearch.ts"""
+    text = _COMBINING_RE.sub('', unicodedata.normalize('NFKD', text.lower()))
+    return text.replace('’', '').replace("'", '')
+
+def tokenize(text):
+    """Normalised, stopword-free tokens of a piece of text (keeps positions)"""
+    text = fold_text(text)
+    return [None if word in STOPWORDS else normalize_token(word)
+            for word in _TOKEN_RE.findall(text)]
+
+def _document_fields(data, body):
+    tags = data.get('tags')
+    return {
+        'title': str(data.get('title') or ''),
+        'tags': ' '.join(str(tag).replace('-', ' ') for tag in tags) if isinstance(tags, list) else '',
+        'excerpt': str(data.get('excerpt') or ''),
+        'body': body,
+    }
+
+def tokenize_document(data, body):
+    """{term: [weighted tf, [positions]]} plus the weighted document length"""
+    fields = _document_fields(data, body)
+    terms = {}
+    length = 0.0
+    for field_index, (field, weight) in enumerate(FIELDS):
+        base = field_index * FIELD_GAP
+        tokens = tokenize(fields[field])
+        length += weight * len(tokens)
+        for position, term in enumerate(tokens):
+            if term is None:
+                continue
+            entry = terms.get(term)
+            if entry is None:
+                entry = terms[term] = [0.0, []]
+            entry[0] += weight
+            entry[1].append(base + position)
+    return terms, length
+
+def _load_doc_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('tokenizer') == TOKENIZER_VERSION:
+            return data['docs']
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+def _save_doc_cache(path, docs):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+        json.dump({'tokenizer': TOKENIZER_VERSION, 'docs': docs}, f, separators=(',', ':'))
+    os.replace(f"{path}.tmp", path)
+
+def collect_documents(blog_dir='blog', cache_path=CACHE_PATH):
+    """Tokenised posts, re-tokenising only those whose bytes changed.
+
+    Returns ([(slug, terms, length)], number of posts re-tokenised).
+    """
+    cached = _load_doc_cache(cache_path)
+    docs = {}
+    documents = []
+    seen = set()
+    rebuilt = 0
+    for filename in sorted(os.listdir(blog_dir)):
+        if not is_post_file(filename):
+            continue
+        with open(os.path.join(blog_dir, filename), 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        entry = cached.get(filename)
+        if entry is None or entry['sha256'] != digest:
+            try:
+                data, body = read_post(raw.decode('utf-8'))
+            except FrontmatterError:
+                # blogService never serves these, so don't index them either
+                continue
+            terms, length = tokenize_document(data, body)
+            entry = {'sha256': digest, 'slug': post_slug(filename, data), 'terms': terms, 'length': length}
+            rebuilt += 1
+        docs[filename] = entry
+        # The site serves the first file for a slug; index the same one
+        if entry['slug'] in seen:
+            continue
+        seen.add(entry['slug'])
+        documents.append((entry['slug'], entry['terms'], entry['length']))
+    if rebuilt or set(docs) != set(cached):
+        _save_doc_cache(cache_path, docs)
+    return documents, rebuilt
+
+def _pad(buffer):
+    buffer.extend(b'\0' * (-len(buffer) % 4))
+
+def _blob(strings):
+    offsets = array('I', [0])
+    blob = bytearray()
+    for value in strings:
+        blob.extend(value.encode('utf-8'))
+        offsets.append(len(blob))
+    return offsets, bytes(blob)
+
+def serialize_index(documents):
+    """Pack tokenised documents into the binary index layout"""
+    slugs = [slug for slug, terms, length in documents]
+    doc_len = array('f', [length for slug, terms, length in documents])
+
+    postings = {}
+    for doc_id, (slug, terms, length) in enumerate(documents):
+        for term, (tf, positions) in terms.items():
+            postings.setdefault(term, []).append((doc_id, tf, positions))
+    terms = sorted(postings)
+
+    term_post = array('I', [0])
+    post_doc = array('I')
+    post_tf = array('f')
+    post_pos = array('I', [0])
+    positions = array('I')
+    for term in terms:
+        for doc_id, tf, term_positions in postings[term]:
+            post_doc.append(doc_id)
+            post_tf.append(tf)
+            positions.extend(term_positions)
+            post_pos.append(len(positions))
+        term_post.append(len(post_doc))
+
+    slug_offsets, slug_blob = _blob(slugs)
+    term_offsets, term_blob = _blob(terms)
+
+    body = bytearray()
+    sections = []
+    for part in (doc_len, slug_offsets, slug_blob, term_offsets, term_blob,
+                 term_post, post_doc, post_tf, post_pos, positions):
+        sections.append(_HEADER.size + len(body))
+        body.extend(part.tobytes() if isinstance(part, array) else part)
+        _pad(body)
+    if sys.byteorder != 'little':
+        raise RuntimeError('search index writer assumes a little-endian host')
+    header = _HEADER.pack(MAGIC, INDEX_VERSION, len(slugs), len(terms), len(post_doc),
+                          len(positions), *sections)
+    return header + bytes(body)
+
+def write_search_index(blog_dir='blog', cache_path=CACHE_PATH):
+    """Rebuild blog_dir/search-index.bin. Returns (path, doc count, re-tokenised count)"""
+    documents, rebuilt = collect_documents(blog_dir, cache_path)
+    path = os.path.join(blog_dir, INDEX_NAME)
+    write_if_changed(path, serialize_index(documents))
+    return path, len(documents), rebuilt
+
+class SearchIndex:
+    """Read-only view over search-index.bin, memory-mapped"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        (magic, version, self.doc_count, self.term_count, post_count, pos_count,
+         *offsets) = _HEADER.unpack_from(view)
+        if magic != MAGIC or version != INDEX_VERSION:
+            raise ValueError(f"{path} is not a version {INDEX_VERSION} search index")
+        (doc_len, slug_offsets, slug_blob, term_offsets, term_blob,
+         term_post, post_doc, post_tf, post_pos, positions) = offsets
+
+        def u32(start, count):
+            return view[start:start + 4 * count].cast('I')
+
+        self.doc_len = view[doc_len:doc_len + 4 * self.doc_count].cast('f')
+        self.slug_offsets = u32(slug_offsets, self.doc_count + 1)
+        self.slug_blob = view[slug_blob:slug_blob + self.slug_offsets[-1]]
+        self.term_offsets = u32(term_offsets, self.term_count + 1)
+        self.term_blob = view[term_blob:term_blob + self.term_offsets[-1]]
+        self.term_post = u32(term_post, self.term_count + 1)
+        self.post_doc = u32(post_doc, post_count)
+        self.post_tf = view[post_tf:post_tf + 4 * post_count].cast('f')
+        self.post_pos = u32(post_pos, post_count + 1)
+        self.positions = u32(positions, pos_count)
+        self.avg_len = (sum(self.doc_len) / self.doc_count) if self.doc_count else 0.0
+
+    def slug(self, doc_id):
+        return bytes(self.slug_blob[self.slug_offsets[doc_id]:self.slug_offsets[doc_id + 1]]).decode('utf-8')
+
+    def _term(self, term_id):
+        return bytes(self.term_blob[self.term_offsets[term_id]:self.term_offsets[term_id + 1]])
+
+    def term_id(self, term):
+        """Binary search the sorted term table"""
+        key = term.encode('utf-8')
+        term_id = bisect_left(range(self.term_count), key, key=self._term)
+        if term_id < self.term_count and self._term(term_id) == key:
+            return term_id
+        return None
+
+    def _postings(self, term_id):
+        return range(self.term_post[term_id], self.term_post[term_id + 1])
+
+    def _positions(self, posting):
+        return self.positions[self.post_pos[posting]:self.post_pos[posting + 1]]
+
+    def _phrase_docs(self, phrase_terms):
+        """Documents containing (offset, term_id) pairs at matching relative positions"""
+        candidates = None
+        for offset, term_id in phrase_terms:
+            found = {}
+            for posting in self._postings(term_id):
+                found[self.post_doc[posting]] = {p - offset for p in self._positions(posting)}
+            if candidates is None:
+                candidates = found
+            else:
+                candidates = {doc: candidates[doc] & found[doc]
+                              for doc in candidates.keys() & found.keys()}
+                candidates = {doc: starts for doc, starts in candidates.items() if starts}
+        return set(candidates or ())
+
+    def search(self, query, limit=10):
+        """[(slug, score)] for a query; "quoted phrases" must match exactly"""
+        required = None
+        for phrase in _PHRASE_RE.findall(query):
+            # Stopwords keep their slot so 'cost of heating' needs the gap
+            phrase_terms = [(offset, self.term_id(term))
+                            for offset, term in enumerate(tokenize(phrase)) if term is not None]
+            if phrase_terms and all(term_id is not None for offset, term_id in phrase_terms):
+                docs = self._phrase_docs(phrase_terms)
+            else:
+                docs = set()
+            required = docs if required is None else required & docs
+
+        scores = {}
+        for term in set(t for t in tokenize(query) if t is not None):
+            term_id = self.term_id(term)
+            if term_id is None:
+                continue
+            postings = self._postings(term_id)
+            df = len(postings)
+            idf = math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+            for posting in postings:
+                doc_id = self.post_doc[posting]
+                tf = self.post_tf[posting]
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_len[doc_id] / (self.avg_len or 1))
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+        if required is not None:
+            scores = {doc: score for doc, score in scores.items() if doc in required}
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [(self.slug(doc_id), round(score, 4)) for doc_id, score in ranked]
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    path, count, rebuilt = write_search_index()
+    print(f"✓ Wrote {path} ({count} posts, {rebuilt} re-tokenised)")
+    if argv:
+        for slug, score in SearchIndex(path).search(' '.join(argv)):
+            print(f"  {score:8.3f}  /blog/{slug}")
+
+if __name__ == '__main__':
+    main()
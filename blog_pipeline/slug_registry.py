@@ -0,0 +1,158 @@
+"""
+Persistent source -> slug -> output registry for a blog output directory
+
+Both conversion scripts write into blog/, so a document can end up with two
+posts: say blog-post-5.md from a run that found no slug and
+understanding-your-energy-bill-...md from a later one. The site would serve
+both. Every generated post is registered against the source document it came
+from, in slug-registry.json next to the posts. When a source's output moves
+to a new slug the old file is deleted, so the directory holds exactly one post
+per source. A slug already owned by a different source is a collision and is
+refused before anything is written; the slug -> source map makes that check
+a single dict lookup.
+
+ingest and format both write into blog/ from the same documents, but don't
+always derive the same slug from them. Each entry records the pipeline that
+wrote it, and a pipeline never moves a post another pipeline published: if
+the document's output would move, the new post is refused instead and the
+existing one is left alone. An entry from before pipelines were recorded
+is adopted by the first pipeline that writes the same file. To hand a
+source's post over to the other pipeline, run it with --adopt.
+
+    python -m blog_pipeline.slug_registry [blog_dir]
+
+lists the registry and any posts in the directory that no source owns.
+"""
+import json
+import os
+import sys
+
+from blog_pipeline.output_stage import write_if_changed
+from blog_pipeline.post_manifest import is_post_file, post_slug
+
+REGISTRY_NAME = 'slug-registry.json'
+REGISTRY_VERSION = 1
+
+class SlugCollision(ValueError):
+    """A slug that already belongs to another source document"""
+
+def source_key(path):
+    """Registry key for a source document path"""
+    return os.path.normpath(path).replace(os.sep, '/')
+
+def output_slug(filename):
+    """Slug a generated post is served under (the date-stripped filename)"""
+    return post_slug(filename, {})
+
+class SlugRegistry:
+    """Which source owns which slug and output file in one output directory.
+
+    pipeline names the script writing through this registry ('ingest',
+    'format'); None only reads it. With adopt, the pipeline takes over the
+    posts other pipelines published instead of leaving them alone.
+    """
+
+    def __init__(self, output_dir, pipeline=None, adopt=False):
+        self.output_dir = output_dir
+        self.pipeline = pipeline
+        self.adopt = adopt
+        self.path = os.path.join(output_dir, REGISTRY_NAME)
+        self.sources = self._load()
+        self._owners = {entry['slug']: source for source, entry in self.sources.items()}
+        self._dirty = False
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == REGISTRY_VERSION:
+                return data['sources']
+        except (OSError, ValueError, KeyError):
+            pass
+        return {}
+
+    def owner(self, slug):
+        """Source key that owns slug, or None"""
+        return self._owners.get(slug)
+
+    def output_for(self, source):
+        """Registered output filename for a source, or None"""
+        entry = self.sources.get(source_key(source))
+        return entry['file'] if entry else None
+
+    def check(self, source, filename):
+        """Raise SlugCollision if filename's slug belongs to a different source, or if
+        it would replace a post another pipeline published for this source"""
+        key = source_key(source)
+        owner = self._owners.get(output_slug(filename))
+        if owner is not None and owner != key:
+            raise SlugCollision(f"slug '{output_slug(filename)}' already belongs to {owner}")
+        entry = self.sources.get(key)
+        if (entry is not None and entry['file'] != filename and self.pipeline is not None
+                and entry.get('pipeline') != self.pipeline and not self.adopt):
+            raise SlugCollision(f"{key} is already published as {entry['file']} by "
+                                f"{entry.get('pipeline') or 'an earlier run'}; not replacing it with {filename} "
+                                f"(--adopt to take it over)")
+
+    def claim(self, source, filename, stage):
+        """Register filename as source's output, deleting its previous output if it moved"""
+        self.check(source, filename)
+        key = source_key(source)
+        slug = output_slug(filename)
+        previous = self.sources.get(key)
+        entry = {'slug': slug, 'file': filename}
+        # Rewriting another pipeline's file in place leaves it that pipeline's post, unless adopting
+        in_place = previous is not None and previous['file'] == filename and not self.adopt
+        pipeline = previous.get('pipeline') if in_place else None
+        if pipeline or self.pipeline:
+            entry['pipeline'] = pipeline or self.pipeline
+        if previous == entry:
+            return None
+        stale = None
+        if previous is not None:
+            del self._owners[previous['slug']]
+            if previous['file'] != filename:
+                stale = previous['file']
+                stage.delete(os.path.join(self.output_dir, stale))
+        self.sources[key] = entry
+        self._owners[slug] = key
+        self._dirty = True
+        return stale
+
+    def release(self, source, stage):
+        """Forget a removed source and delete its output. Returns the deleted filename.
+
+        A post another pipeline published is left to that pipeline.
+        """
+        entry = self.sources.get(source_key(source))
+        if entry is None or entry.get('pipeline') not in (None, self.pipeline):
+            return None
+        del self.sources[source_key(source)]
+        del self._owners[entry['slug']]
+        self._dirty = True
+        stage.delete(os.path.join(self.output_dir, entry['file']))
+        return entry['file']
+
+    def unowned_posts(self):
+        """Posts in the output directory that no source has registered"""
+        owned = {entry['file'] for entry in self.sources.values()}
+        return sorted(filename for filename in os.listdir(self.output_dir)
+                      if is_post_file(filename) and filename not in owned)
+
+    def save(self):
+        if not self._dirty:
+            return
+        data = {'version': REGISTRY_VERSION, 'sources': dict(sorted(self.sources.items()))}
+        write_if_changed(self.path, json.dumps(data, ensure_ascii=False, indent=2) + '\n')
+        self._dirty = False
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    registry = SlugRegistry(argv[0] if argv else 'blog')
+    for source, entry in sorted(registry.sources.items()):
+        print(f"📄 {source} → {entry['file']}")
+    for filename in registry.unowned_posts():
+        print(f"⚠️  No source registered for {filename}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,203 @@
+"""
+Opt-in per-stage tracing for the conversion scripts
+
+With --trace, every stage of every document (docx extraction, parsing,
+metadata, normalisation, writing) is recorded with its wall time, CPU time
+and peak Python allocation (tracemalloc, so expect the build to run slower
+while tracing). The result is a Chrome trace-event JSON file: open it in
+chrome://tracing or https://ui.perfetto.dev to see the build as a timeline,
+one track per worker process. The slowest documents and the time spent in
+each stage are printed at the end of the run and stored in the file's
+otherData.
+
+Without --trace the scripts get NULL_TRACER, whose spans do nothing.
+"""
+import contextlib
+import json
+import os
+import time
+import tracemalloc
+
+TRACE_DIR = os.path.join('.blog_cache', 'traces')
+DEFAULT_TOP = 10
+
+class _Span:
+    __slots__ = ('name', 'category', 'document', 'start_ns', 'cpu_ns', 'start_mem', 'peak')
+
+class Tracer:
+    """Collects trace events for the current process"""
+
+    enabled = True
+
+    def __init__(self, memory=True):
+        self.events = []
+        self.memory = memory
+        self._stack = []
+        self._owns_tracemalloc = memory and not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start()
+
+    def document(self, name):
+        """Span covering everything done for one source document"""
+        return self._span(name, 'document', name)
+
+    def span(self, name):
+        """Span for one stage, attributed to the enclosing document if any"""
+        return self._span(name, 'stage', None)
+
+    @contextlib.contextmanager
+    def _span(self, name, category, document):
+        parent = self._stack[-1] if self._stack else None
+        span = _Span()
+        span.name = name
+        span.category = category
+        span.document = document if document is not None else (parent.document if parent else None)
+        span.start_mem = span.peak = 0
+        if self.memory:
+            # tracemalloc has one peak counter: fold it into the parent before resetting it
+            span.start_mem, peak = tracemalloc.get_traced_memory()
+            if parent is not None:
+                parent.peak = max(parent.peak, peak)
+            tracemalloc.reset_peak()
+        self._stack.append(span)
+        span.cpu_ns = time.process_time_ns()
+        span.start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            wall_ns = time.perf_counter_ns() - span.start_ns
+            cpu_ns = time.process_time_ns() - span.cpu_ns
+            self._stack.pop()
+            peak = 0
+            if self.memory:
+                span.peak = max(span.peak, tracemalloc.get_traced_memory()[1])
+                if parent is not None:
+                    parent.peak = max(parent.peak, span.peak)
+                peak = span.peak - span.start_mem
+            args = {'cpu_ms': round(cpu_ns / 1e6, 3), 'peak_alloc_kb': round(peak / 1024, 1)}
+            if span.document is not None:
+                args['document'] = span.document
+            self.events.append({
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': span.start_ns / 1000,
+                'dur': wall_ns / 1000,
+                'pid': os.getpid(),
+                'tid': os.getpid(),
+                'args': args,
+            })
+
+    def merge(self, events):
+        """Add events recorded by a worker process"""
+        self.events.extend(events)
+
+    def stop(self):
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    def slowest_documents(self, top=DEFAULT_TOP):
+        """The top slowest documents, each with its slowest stage"""
+        stages = {}
+        for event in self.events:
+            document = event['args'].get('document')
+            if event['cat'] == 'stage' and document is not None:
+                best = stages.get(document)
+                if best is None or event['dur'] > best['dur']:
+                    stages[document] = event
+        documents = sorted((event for event in self.events if event['cat'] == 'document'),
+                           key=lambda event: event['dur'], reverse=True)
+        return [{
+            'document': event['name'],
+            'wall_ms': round(event['dur'] / 1000, 3),
+            'cpu_ms': event['args']['cpu_ms'],
+            'peak_alloc_kb': event['args']['peak_alloc_kb'],
+            'slowest_stage': stages[event['name']]['name'] if event['name'] in stages else None,
+            'slowest_stage_ms': round(stages[event['name']]['dur'] / 1000, 3) if event['name'] in stages else None,
+        } for event in documents[:top]]
+
+    def stage_totals(self):
+        """Wall time, CPU time, call count and largest peak per stage, slowest first"""
+        totals = {}
+        for event in self.events:
+            if event['cat'] != 'stage':
+                continue
+            total = totals.setdefault(event['name'], {'calls': 0, 'wall_ms': 0.0, 'cpu_ms': 0.0, 'max_peak_alloc_kb': 0.0})
+            total['calls'] += 1
+            total['wall_ms'] += event['dur'] / 1000
+            total['cpu_ms'] += event['args']['cpu_ms']
+            total['max_peak_alloc_kb'] = max(total['max_peak_alloc_kb'], event['args']['peak_alloc_kb'])
+        for total in totals.values():
+            total['wall_ms'] = round(total['wall_ms'], 3)
+            total['cpu_ms'] = round(total['cpu_ms'], 3)
+        return dict(sorted(totals.items(), key=lambda item: item[1]['wall_ms'], reverse=True))
+
+    def write(self, path, top=DEFAULT_TOP):
+        """Write a Chrome trace-event file, timestamps relative to the first event"""
+        origin = min((event['ts'] for event in self.events), default=0)
+        events = [dict(event, ts=round(event['ts'] - origin, 3), dur=round(event['dur'], 3))
+                  for event in self.events]
+        main_pid = os.getpid()
+        for pid in sorted({event['pid'] for event in self.events}):
+            events.append({'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': pid,
+                           'args': {'name': 'main' if pid == main_pid else f'worker {pid}'}})
+        trace = {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {
+                'slowestDocuments': self.slowest_documents(top),
+                'stageTotals': self.stage_totals(),
+            },
+        }
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, ensure_ascii=False)
+            f.write('\n')
+        return path
+
+    def report(self, top=DEFAULT_TOP):
+        """Printable lines: slowest documents, then time per stage"""
+        lines = [f"⏱️  Slowest {min(top, sum(event['cat'] == 'document' for event in self.events))} documents:"]
+        for row in self.slowest_documents(top):
+            stage = f" — {row['slowest_stage']} {row['slowest_stage_ms']:.1f} ms" if row['slowest_stage'] else ''
+            lines.append(f"  {row['document']:<40} {row['wall_ms']:9.1f} ms  cpu {row['cpu_ms']:9.1f} ms  "
+                         f"peak {row['peak_alloc_kb'] / 1024:7.2f} MB{stage}")
+        lines.append("⏱️  Time per stage:")
+        for name, total in self.stage_totals().items():
+            lines.append(f"  {name:<40} {total['wall_ms']:9.1f} ms  cpu {total['cpu_ms']:9.1f} ms  "
+                         f"x{total['calls']:<5} peak {total['max_peak_alloc_kb'] / 1024:7.2f} MB")
+        return lines
+
+    def finish(self, path, top=DEFAULT_TOP):
+        """Stop tracing, print the summary and write the trace file"""
+        self.stop()
+        print()
+        for line in self.report(top):
+            print(line)
+        print(f"📊 Trace written to {self.write(path, top)} (open in https://ui.perfetto.dev)")
+
+class _NullTracer:
+    """Tracer stand-in when tracing is off"""
+
+    enabled = False
+    events = ()
+
+    def document(self, name):
+        return contextlib.nullcontext()
+
+    def span(self, name):
+        return contextlib.nullcontext()
+
+    def merge(self, events):
+        pass
+
+    def stop(self):
+        pass
+
+NULL_TRACER = _NullTracer()
+
+def default_trace_path(script):
+    """Where a script's trace goes when --trace is given without a path"""
+    return os.path.join(TRACE_DIR, f'{script}.trace.json')
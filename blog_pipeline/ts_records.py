@@ -0,0 +1,401 @@
+"""
+Single-pass scanner for object-literal arrays in TypeScript source
+
+Pulls the records out of an array such as MOCK_POSTS in lib/blogService.ts
+without running TypeScript. The source is read once, left to right: strings,
+template literals (escapes and nested ${...} included), regex literals and
+comments are all lexed properly, so a backtick, '];' or brace inside any of
+them can't end a record early.
+
+Values that are plain literals (strings, template literals, numbers,
+booleans, arrays and nested objects of those) come back as Python values,
+with escapes resolved and any ${...} in a template kept as written; anything
+else (new Date(...), function calls) comes back as its source text.
+
+MOCK_POSTS is kept commented out inside its array, so block comments in an
+array can optionally be scanned as elements too (include_commented=True).
+"""
+import re
+from collections import namedtuple
+
+MockPost = namedtuple('MockPost', ['id', 'title', 'slug', 'category', 'excerpt', 'tags', 'date', 'content'])
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_IDENT_START = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_$')
+_IDENT_CHARS = _IDENT_START | frozenset('0123456789')
+# After these keywords a '/' starts a regex, not a division
+_REGEX_KEYWORDS = frozenset(['return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw'])
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+Token = namedtuple('Token', ['kind', 'value', 'start', 'end'])
+
+class TsScanError(ValueError):
+    """Source the scanner couldn't make sense of"""
+
+class _Lexer:
+    def __init__(self, source, start=0, end=None):
+        self.source = source
+        self.pos = start
+        self.end = len(source) if end is None else end
+        self.comments = []  # (start, end) of block comments seen since last token
+        self._last = None
+
+    def _error(self, message):
+        line = self.source.count('\n', 0, self.pos) + 1
+        raise TsScanError(f"{message} at line {line}")
+
+    def _skip_trivia(self):
+        source, end = self.source, self.end
+        self.comments = []
+        while self.pos < end:
+            ch = source[self.pos]
+            if ch.isspace():
+                self.pos += 1
+            elif source.startswith('//', self.pos):
+                newline = source.find('\n', self.pos, end)
+                self.pos = end if newline == -1 else newline + 1
+            elif source.startswith('/*', self.pos):
+                close = source.find('*/', self.pos + 2, end)
+                if close == -1:
+                    self._error('Unterminated block comment')
+                self.comments.append((self.pos + 2, close))
+                self.pos = close + 2
+            else:
+                break
+
+    def _read_escape(self):
+        # self.pos is just past the backslash
+        ch = self.source[self.pos]
+        self.pos += 1
+        if ch in _ESCAPES:
+            return _ESCAPES[ch]
+        if ch == 'x':
+            value = chr(int(self.source[self.pos:self.pos + 2], 16))
+            self.pos += 2
+            return value
+        if ch == 'u':
+            if self.source[self.pos] == '{':
+                close = self.source.index('}', self.pos)
+                value = chr(int(self.source[self.pos + 1:close], 16))
+                self.pos = close + 1
+            else:
+                value = chr(int(self.source[self.pos:self.pos + 4], 16))
+                self.pos += 4
+            return value
+        if ch == '\r' and self.source[self.pos:self.pos + 1] == '\n':
+            self.pos += 1
+            return ''
+        if ch in '\n\u2028\u2029':
+            return ''  # line continuation
+        return ch
+
+    def _read_string(self, quote):
+        source, end = self.source, self.end
+        self.pos += 1
+        parts = []
+        while True:
+            if self.pos >= end:
+                self._error('Unterminated string')
+            ch = source[self.pos]
+            if ch == quote:
+                self.pos += 1
+                return ''.join(parts)
+            if ch == '\\':
+                self.pos += 1
+                parts.append(self._read_escape())
+            elif ch == '\n':
+                self._error('Newline in string')
+            else:
+                # Copy the run of ordinary characters in one slice
+                stop = self.pos + 1
+                while stop < end and source[stop] not in (quote, '\\', '\n'):
+                    stop += 1
+                parts.append(source[self.pos:stop])
+                self.pos = stop
+
+    def _skip_substitution(self):
+        """Skip a ${...} body (self.pos just past '${'), returning its source"""
+        start = self.pos
+        depth = 0
+        while True:
+            token = self.next()
+            if token is None:
+                self._error('Unterminated template substitution')
+            if token.kind == 'punct' and token.value in '{([':
+                depth += 1
+            elif token.kind == 'punct' and token.value in '})]':
+                if depth == 0 and token.value == '}':
+                    return self.source[start:token.start]
+                depth -= 1
+
+    def _read_template(self):
+        """Cooked template text, with each ${...} kept as written"""
+        source, end = self.source, self.end
+        self.pos += 1
+        parts = []
+        while True:
+            if self.pos >= end:
+                self._error('Unterminated template literal')
+            ch = source[self.pos]
+            if ch == '`':
+                self.pos += 1
+                return ''.join(parts)
+            if ch == '\\':
+                self.pos += 1
+                parts.append(self._read_escape())
+            elif ch == '$' and source.startswith('${', self.pos):
+                self.pos += 2
+                parts.append('${' + self._skip_substitution() + '}')
+            else:
+                stop = self.pos + 1
+                while stop < end and source[stop] not in '`\\$':
+                    stop += 1
+                parts.append(source[self.pos:stop])
+                self.pos = stop
+
+    def _read_regex(self):
+        source, end = self.source, self.end
+        start = self.pos
+        self.pos += 1
+        in_class = False
+        while True:
+            if self.pos >= end or source[self.pos] == '\n':
+                self._error('Unterminated regex literal')
+            ch = source[self.pos]
+            self.pos += 1
+            if ch == '\\':
+                self.pos += 1
+            elif ch == '[':
+                in_class = True
+            elif ch == ']':
+                in_class = False
+            elif ch == '/' and not in_class:
+                break
+        while self.pos < end and source[self.pos] in _IDENT_CHARS:
+            self.pos += 1  # flags
+        return source[start:self.pos]
+
+    def _regex_allowed(self):
+        last = self._last
+        if last is None:
+            return True
+        if last.kind in ('ident',):
+            return last.value in _REGEX_KEYWORDS
+        if last.kind in ('number', 'string', 'template', 'regex'):
+            return False
+        return last.value not in (')', ']', '}')
+
+    def next(self):
+        """Next token, or None at the end of the input"""
+        self._skip_trivia()
+        if self.pos >= self.end:
+            return None
+        source = self.source
+        start = self.pos
+        ch = source[start]
+        if ch in ('"', "'"):
+            token = Token('string', self._read_string(ch), start, None)
+        elif ch == '`':
+            token = Token('template', self._read_template(), start, None)
+        elif ch in _IDENT_START:
+            stop = start + 1
+            while stop < self.end and source[stop] in _IDENT_CHARS:
+                stop += 1
+            self.pos = stop
+            token = Token('ident', source[start:stop], start, None)
+        elif ch.isdigit() or (ch == '.' and source[start + 1:start + 2].isdigit()):
+            stop = start + 1
+            while stop < self.end and (source[stop] in _IDENT_CHARS or source[stop] == '.'):
+                stop += 1
+            self.pos = stop
+            token = Token('number', source[start:stop], start, None)
+        elif ch == '/' and self._regex_allowed():
+            token = Token('regex', self._read_regex(), start, None)
+        else:
+            self.pos += 1
+            token = Token('punct', ch, start, None)
+        token = token._replace(end=self.pos)
+        self._last = token
+        return token
+
+class _Parser:
+    def __init__(self, source, include_commented, start=0, end=None):
+        self.source = source
+        self.include_commented = include_commented
+        self.lexer = _Lexer(source, start, end)
+        self._peeked = None
+
+    def peek(self):
+        if self._peeked is None:
+            self._peeked = self.lexer.next()
+        return self._peeked
+
+    def take(self):
+        token = self.peek()
+        self._peeked = None
+        return token
+
+    def expect(self, value):
+        token = self.take()
+        if token is None or token.kind != 'punct' or token.value != value:
+            found = 'end of input' if token is None else repr(token.value)
+            self.lexer._error(f"Expected {value!r}, found {found}")
+        return token
+
+    def _skip_expression(self, start):
+        """Skip tokens up to the ',' or closing bracket that ends a value"""
+        depth = 0
+        end = start
+        while True:
+            token = self.peek()
+            if token is None:
+                return self.source[start:end].strip()
+            if token.kind == 'punct':
+                if token.value in '{([':
+                    depth += 1
+                elif token.value in '})]':
+                    if depth == 0:
+                        return self.source[start:end].strip()
+                    depth -= 1
+                elif token.value == ',' and depth == 0:
+                    return self.source[start:end].strip()
+            self.take()
+            end = token.end
+
+    def value(self):
+        token = self.peek()
+        if token is None:
+            self.lexer._error('Expected a value')
+        following = None
+        if token.kind in ('string', 'template'):
+            self.take()
+            result = token.value
+        elif token.kind == 'number':
+            self.take()
+            try:
+                result = float(token.value) if '.' in token.value else int(token.value, 0)
+            except ValueError:
+                result = token.value
+        elif token.kind == 'ident' and token.value in ('true', 'false', 'null', 'undefined'):
+            self.take()
+            result = {'true': True, 'false': False}.get(token.value)
+        elif token.kind == 'punct' and token.value == '{':
+            result = self.object()
+        elif token.kind == 'punct' and token.value == '[':
+            result = self.array()
+        else:
+            return self._skip_expression(token.start)
+        # A literal followed by more expression (e.g. 'a' + b) is kept as source
+        following = self.peek()
+        if following is not None and not (following.kind == 'punct' and following.value in ',}]'):
+            return self._skip_expression(token.start)
+        return result
+
+    def object(self):
+        self.expect('{')
+        record = {}
+        while True:
+            token = self.take()
+            if token is None:
+                self.lexer._error('Unterminated object literal')
+            if token.kind == 'punct' and token.value == '}':
+                return record
+            if token.kind == 'punct' and token.value == ',':
+                continue
+            if token.kind == 'punct' and token.value == '.':
+                # ...spread: keep its source under a synthetic key
+                self.expect('.')
+                self.expect('.')
+                record.setdefault('...', []).append(self._skip_expression(self.peek().start))
+                continue
+            if token.kind not in ('ident', 'string', 'number'):
+                self.lexer._error(f"Unexpected {token.value!r} in object literal")
+            key = token.value
+            following = self.peek()
+            if following is not None and following.kind == 'punct' and following.value in ',}':
+                record[key] = key  # shorthand property
+                continue
+            if following is not None and following.kind == 'punct' and following.value == '(':
+                # method: keep its source
+                record[key] = self._skip_expression(token.start)
+                continue
+            self.expect(':')
+            record[key] = self.value()
+
+    def _commented_elements(self):
+        elements = []
+        for comment_start, comment_end in self.lexer.comments:
+            inner = _Parser(self.source, False, comment_start, comment_end)
+            try:
+                elements.extend(inner.elements(None))
+            except TsScanError:
+                continue  # an ordinary comment, not commented-out code
+        return elements
+
+    def elements(self, closing):
+        """Values up to closing (or the end of input when closing is None)"""
+        items = []
+        while True:
+            token = self.peek()
+            if self.include_commented and self.lexer.comments:
+                items.extend(self._commented_elements())
+                self.lexer.comments = []
+            if token is None:
+                if closing is None:
+                    return items
+                self.lexer._error('Unterminated array literal')
+            if token.kind == 'punct' and token.value == closing:
+                self.take()
+                return items
+            if token.kind == 'punct' and token.value == ',':
+                self.take()
+                continue
+            items.append(self.value())
+
+    def array(self):
+        self.expect('[')
+        return self.elements(']')
+
+    def find_array(self, name):
+        """Advance to `name` ... = [ and return its elements"""
+        while True:
+            token = self.take()
+            if token is None:
+                raise TsScanError(f"{name} not found")
+            if token.kind != 'ident' or token.value != name:
+                continue
+            # Skip an optional type annotation up to '='
+            token = self.take()
+            while token is not None and not (token.kind == 'punct' and token.value in '=;'):
+                token = self.take()
+            if token is None or token.value != '=':
+                continue
+            if self.peek() is not None and self.peek().value == '[':
+                return self.array()
+
+def scan_array(source, name, include_commented=False):
+    """Elements of the array assigned to `name` in TypeScript source"""
+    return _Parser(source, include_commented).find_array(name)
+
+def extract_mock_posts(ts_path='lib/blogService.ts'):
+    """MockPost records for every post in MOCK_POSTS, commented-out ones included"""
+    with open(ts_path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    posts = []
+    for record in scan_array(source, 'MOCK_POSTS', include_commented=True):
+        if not isinstance(record, dict) or not isinstance(record.get('content'), str):
+            continue
+        tags = record.get('tags')
+        # publishedAt is usually new Date('YYYY-MM-DD').toISOString(), kept as source
+        date = _DATE_RE.search(str(record.get('publishedAt') or ''))
+        posts.append(MockPost(
+            id=str(record.get('id', '')),
+            title=record.get('title') or '',
+            slug=record.get('slug') or '',
+            category=record.get('category') or '',
+            excerpt=record.get('excerpt') or '',
+            tags=list(tags) if isinstance(tags, list) else [],
+            date=date.group(0) if date else '',
+            content=record['content'],
+        ))
+    return posts
@@ -0,0 +1,63 @@
+"""
+Polling watcher for the docx source directory
+
+Used by the conversion scripts' --watch mode. The source directory is small,
+so a stat of every .docx every POLL_INTERVAL seconds is cheap and works the
+same on every platform and on network drives where inotify doesn't. Word
+saves a document as a burst of writes and renames, so changes are collected
+until the directory has been quiet for DEBOUNCE seconds and then handed to the
+rebuild callback in one batch. Edit-to-rebuild latency is at most
+POLL_INTERVAL + DEBOUNCE plus the rebuild itself.
+"""
+import os
+import time
+
+POLL_INTERVAL = 0.2
+DEBOUNCE = 0.3
+
+def snapshot(directory, suffix='.docx'):
+    """{path: (mtime_ns, size)} for every source under directory"""
+    found = {}
+    for root, dirs, files in os.walk(directory):
+        for name in files:
+            # Word lock files (~$blog1.docx) come and go while a document is open
+            if name.lower().endswith(suffix) and not name.startswith('~$'):
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue  # removed between the listing and the stat
+                found[path] = (stat.st_mtime_ns, stat.st_size)
+    return found
+
+def watch_sources(directory, rebuild, interval=POLL_INTERVAL, debounce=DEBOUNCE):
+    """Call rebuild(changed, removed) after each burst of saves settles.
+
+    changed and removed are sorted lists of paths. Runs until interrupted
+    with Ctrl+C.
+    """
+    previous = snapshot(directory)
+    changed = set()
+    removed = set()
+    last_event = None
+    try:
+        while True:
+            time.sleep(interval)
+            current = snapshot(directory)
+            for path, stamp in current.items():
+                if previous.get(path) != stamp:
+                    changed.add(path)
+                    removed.discard(path)
+                    last_event = time.monotonic()
+            for path in previous.keys() - current.keys():
+                removed.add(path)
+                changed.discard(path)
+                last_event = time.monotonic()
+            previous = current
+            if (changed or removed) and time.monotonic() - last_event >= debounce:
+                batch_changed, batch_removed = sorted(changed), sorted(removed)
+                changed.clear()
+                removed.clear()
+                rebuild(batch_changed, batch_removed)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
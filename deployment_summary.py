@@ -1,61 +1,11 @@
 """
 Create deployment summary for the 12 enhanced blog posts
-"""
-import os
-
-blogs = []
-for f in sorted(os.listdir('blog')):
-    if f.startswith('2025-') and f.endswith('.md'):
-        with open(f'blog/{f}', 'r', encoding='utf-8') as file:
-            content = file.read()
-            title = ''
-            category = ''
-            read_time = ''
-            for line in content.split('\n'):
-                if 'title:' in line:
-                    title = line.split('title:')[1].strip().strip('"').strip("'")
-                if 'category:' in line:
-                    category = line.split('category:')[1].strip().strip('"').strip("'")
-                if 'readTime:' in line:
-                    read_time = line.split('readTime:')[1].strip().strip('"').strip("'")
-            if title:
-                blogs.append((f, title, category, read_time))
-
-print('\n' + '='*80)
-print('✓ DEPLOYMENT COMPLETE: 12 Enhanced Blog Posts Now Live')
-print('='*80)
-print('\nURL: https://cost-saver-app.vercel.app/blog')
-print('\n' + '-'*80 + '\n')
 
-categories = {}
-for filename, title, cat, read_time in blogs:
-    if cat not in categories:
-        categories[cat] = []
-    categories[cat].append((filename, title, read_time))
-
-for cat in ['energy', 'home-upgrades', 'guides']:
-    if cat in categories:
-        print(f'\n📁 {cat.upper()} ({len(categories[cat])} posts)')
-        print('-'*80)
-        for filename, title, read_time in categories[cat]:
-            print(f'  • {title}')
-            print(f'    {read_time} | {filename}')
-            print()
+Shim for `python -m blog_pipeline summary deployment`, kept so existing commands keep working.
+"""
+import sys
 
-print('\n' + '='*80)
-print('ENHANCEMENTS APPLIED BY CHATGPT:')
-print('='*80)
-print('''
-✓ Factual Accuracy: All statistics updated to December 2025
-✓ SEO Optimization: Keywords, meta descriptions, heading structure
-✓ Readability: Improved paragraph structure, added tables & bullets
-✓ Engagement: Added hooks, CTAs, real-world examples
-✓ UK-Specific: Energy price caps, Ofgem data, regional variations
-✓ Actionable Content: Specific savings amounts, timeframes, next steps
-✓ Professional Formatting: Consistent structure across all posts
-''')
+from blog_pipeline.cli import main
 
-print('='*80)
-print(f'Total Word Count: ~{sum([len(open(f"blog/{f[0]}", "r", encoding="utf-8").read().split()) for f in blogs]):,} words')
-print(f'Total Reading Time: ~{sum([int(f[3].split()[0]) for f in blogs])} minutes')
-print('='*80)
+if __name__ == '__main__':
+    sys.exit(main(['summary', 'deployment', *sys.argv[1:]]))
@@ -0,0 +1,292 @@
+/**
+ * BLOG SEARCH
+ *
+ * Queries the pre-built inverted index (blog/search-index.bin) written by
+ * the Python content pipeline (blog_pipeline/search_index.py).
+ * - BM25 ranking over title, tags, excerpt and body
+ * - "Quoted phrases" matched with positional postings
+ * - Same UK-English token normalisation as the index builder
+ *
+ * The index is read once per server process and queried in place through
+ * typed-array views, so a search never touches the markdown files.
+ *
+ * @module lib/blogSearch
+ */
+
+// Only import fs/path on server side
+let fs: any;
+let path: any;
+
+if (typeof window === 'undefined') {
+  fs = require('fs');
+  path = require('path');
+}
+
+// ============================================================================
+// TYPES
+// ============================================================================
+
+export interface BlogSearchResult {
+  slug: string;
+  score: number;
+}
+
+interface LoadedSearchIndex {
+  mtimeMs: number;
+  docCount: number;
+  termCount: number;
+  avgLen: number;
+  docLen: Float32Array;
+  slugOffsets: Uint32Array;
+  slugBlob: Uint8Array;
+  termOffsets: Uint32Array;
+  termBlob: Uint8Array;
+  termPost: Uint32Array;
+  postDoc: Uint32Array;
+  postTf: Float32Array;
+  postPos: Uint32Array;
+  positions: Uint32Array;
+}
+
+// ============================================================================
+// CONSTANTS (keep in sync with blog_pipeline/search_index.py)
+// ============================================================================
+
+const INDEX_MAGIC = 'BSIX';
+const INDEX_VERSION = 1;
+const HEADER_FIELDS = 15;
+const BM25_K1 = 1.2;
+const BM25_B = 0.75;
+
+const STOPWORDS = new Set(`
+a about after all also am an and any are as at be because been before being
+between both but by can could did do does doing down during each few for from
+further had has have having he her here hers him his how i if in into is it
+its itself just me more most my no nor not now of off on once only or other
+our ours out over own same she should so some such than that the their theirs
+them then there these they this those through to too under until up very was
+we were what when where which while who whom why will with you your yours
+`.split(/\s+/).filter(Boolean));
+
+const UK_WORDS: Record<string, string> = {
+  color: 'colour', favor: 'favour', favorite: 'favourite', behavior: 'behaviour',
+  labor: 'labour', neighbor: 'neighbour', honor: 'honour', flavor: 'flavour',
+  humor: 'humour', center: 'centre', fiber: 'fibre', liter: 'litre',
+  gray: 'grey', program: 'programme', tire: 'tyre', aluminum: 'aluminium',
+  fueled: 'fuelled', fueling: 'fuelling', modeling: 'modelling', traveling: 'travelling',
+};
+
+const UK_SUFFIXES: [string, string][] = [
+  ['izations', 'isations'], ['ization', 'isation'], ['izing', 'ising'], ['ized', 'ised'],
+  ['izes', 'ises'], ['ize', 'ise'], ['yzing', 'ysing'], ['yzed', 'ysed'], ['yze', 'yse'],
+];
+
+// Combining mark blocks dropped after NFKD (the same ranges as _COMBINING_RE in search_index.py)
+const COMBINING_MARKS = /[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]/g;
+
+const decoder = new TextDecoder('utf-8');
+
+// ============================================================================
+// TOKENISATION
+// ============================================================================
+
+function foldUk(word: string): string {
+  word = UK_WORDS[word] || word;
+  if (word.length > 5) {
+    for (const [us, uk] of UK_SUFFIXES) {
+      if (word.endsWith(us)) {
+        return word.slice(0, -us.length) + uk;
+      }
+    }
+  }
+  return word;
+}
+
+function stem(word: string): string {
+  if (word.length > 4 && word.endsWith('ies')) {
+    return word.slice(0, -3) + 'y';
+  }
+  if (word.length > 3 && word.endsWith('s') && !['ss', 'us', 'is'].some(end => word.endsWith(end))) {
+    return word.slice(0, -1);
+  }
+  return word;
+}
+
+/**
+ * Lower case with accents and apostrophes removed (fold_text in search_index.py)
+ */
+export function foldText(text: string): string {
+  return text.toLowerCase().normalize('NFKD').replace(COMBINING_MARKS, '').replace(/[’']/g, '');
+}
+
+/**
+ * Normalised tokens, with null in place of stopwords so positions line up
+ */
+export function tokenizeQuery(text: string): (string | null)[] {
+  const words = foldText(text).match(/[a-z0-9]+/g) || [];
+  return words.map(word => (STOPWORDS.has(word) ? null : foldUk(stem(word))));
+}
+
+// ============================================================================
+// INDEX LOADING
+// ============================================================================
+
+let searchIndexCache: LoadedSearchIndex | null = null;
+
+function loadSearchIndex(): LoadedSearchIndex | null {
+  if (typeof window !== 'undefined' || !fs || !path) {
+    return null;
+  }
+
+  const indexPath = path.join(process.cwd(), 'blog', 'search-index.bin');
+  try {
+    const { mtimeMs } = fs.statSync(indexPath);
+    if (searchIndexCache && searchIndexCache.mtimeMs === mtimeMs) {
+      return searchIndexCache;
+    }
+
+    // Copy into a fresh ArrayBuffer so every section is 4-byte aligned
+    const bytes = new Uint8Array(fs.readFileSync(indexPath)).slice();
+    const buffer = bytes.buffer;
+    if (decoder.decode(bytes.subarray(0, 4)) !== INDEX_MAGIC) {
+      return null;
+    }
+    const header = new Uint32Array(buffer, 4, HEADER_FIELDS);
+    const [version, docCount, termCount, postCount, posCount] = header;
+    if (version !== INDEX_VERSION) {
+      return null;
+    }
+    const [docLenAt, slugOffsetsAt, slugBlobAt, termOffsetsAt, termBlobAt,
+      termPostAt, postDocAt, postTfAt, postPosAt, positionsAt] = Array.from(header.subarray(5));
+
+    const docLen = new Float32Array(buffer, docLenAt, docCount);
+    const slugOffsets = new Uint32Array(buffer, slugOffsetsAt, docCount + 1);
+    const termOffsets = new Uint32Array(buffer, termOffsetsAt, termCount + 1);
+    let totalLen = 0;
+    docLen.forEach(len => { totalLen += len; });
+
+    searchIndexCache = {
+      mtimeMs,
+      docCount,
+      termCount,
+      avgLen: docCount ? totalLen / docCount : 0,
+      docLen,
+      slugOffsets,
+      slugBlob: new Uint8Array(buffer, slugBlobAt, slugOffsets[docCount]),
+      termOffsets,
+      termBlob: new Uint8Array(buffer, termBlobAt, termOffsets[termCount]),
+      termPost: new Uint32Array(buffer, termPostAt, termCount + 1),
+      postDoc: new Uint32Array(buffer, postDocAt, postCount),
+      postTf: new Float32Array(buffer, postTfAt, postCount),
+      postPos: new Uint32Array(buffer, postPosAt, postCount + 1),
+      positions: new Uint32Array(buffer, positionsAt, posCount),
+    };
+    return searchIndexCache;
+  } catch (error) {
+    searchIndexCache = null;
+    return null;
+  }
+}
+
+function termAt(index: LoadedSearchIndex, termId: number): string {
+  return decoder.decode(index.termBlob.subarray(index.termOffsets[termId], index.termOffsets[termId + 1]));
+}
+
+/**
+ * Binary search the sorted term table (terms are ASCII, so string order matches)
+ */
+function findTerm(index: LoadedSearchIndex, term: string): number | null {
+  let lo = 0;
+  let hi = index.termCount;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (termAt(index, mid) < term) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  return lo < index.termCount && termAt(index, lo) === term ? lo : null;
+}
+
+function phraseDocs(index: LoadedSearchIndex, phraseTerms: [number, number][]): Set<number> {
+  let candidates: Map<number, Set<number>> | null = null;
+  for (const [offset, termId] of phraseTerms) {
+    const found = new Map<number, Set<number>>();
+    for (let posting = index.termPost[termId]; posting < index.termPost[termId + 1]; posting++) {
+      const starts = new Set<number>();
+      for (let p = index.postPos[posting]; p < index.postPos[posting + 1]; p++) {
+        starts.add(index.positions[p] - offset);
+      }
+      found.set(index.postDoc[posting], starts);
+    }
+    if (candidates === null) {
+      candidates = found;
+    } else {
+      const next = new Map<number, Set<number>>();
+      candidates.forEach((starts, doc) => {
+        const other = found.get(doc);
+        if (!other) return;
+        const shared = new Set(Array.from(starts).filter(start => other.has(start)));
+        if (shared.size) next.set(doc, shared);
+      });
+      candidates = next;
+    }
+  }
+  return new Set(candidates ? Array.from(candidates.keys()) : []);
+}
+
+// ============================================================================
+// SEARCH
+// ============================================================================
+
+/**
+ * Search published blog posts. Returns slugs ranked by BM25 score;
+ * "quoted phrases" in the query must appear verbatim.
+ */
+export async function searchBlogPosts(query: string, limit: number = 10): Promise<BlogSearchResult[]> {
+  const index = loadSearchIndex();
+  if (!index || !query.trim()) {
+    return [];
+  }
+
+  let required: Set<number> | null = null;
+  for (const match of Array.from(query.matchAll(/"([^"]+)"/g))) {
+    const phraseTerms: [number, number][] = [];
+    let missing = false;
+    tokenizeQuery(match[1]).forEach((term, offset) => {
+      if (term === null) return;
+      const termId = findTerm(index, term);
+      if (termId === null) missing = true;
+      else phraseTerms.push([offset, termId]);
+    });
+    const docs = !missing && phraseTerms.length ? phraseDocs(index, phraseTerms) : new Set<number>();
+    required = required === null ? docs : new Set(Array.from(docs).filter(doc => required!.has(doc)));
+  }
+
+  const scores = new Map<number, number>();
+  const terms = new Set(tokenizeQuery(query).filter((term): term is string => term !== null));
+  terms.forEach(term => {
+    const termId = findTerm(index, term);
+    if (termId === null) return;
+    const start = index.termPost[termId];
+    const end = index.termPost[termId + 1];
+    const df = end - start;
+    const idf = Math.log(1 + (index.docCount - df + 0.5) / (df + 0.5));
+    for (let posting = start; posting < end; posting++) {
+      const doc = index.postDoc[posting];
+      const tf = index.postTf[posting];
+      const norm = BM25_K1 * (1 - BM25_B + (BM25_B * index.docLen[doc]) / (index.avgLen || 1));
+      scores.set(doc, (scores.get(doc) || 0) + (idf * tf * (BM25_K1 + 1)) / (tf + norm));
+    }
+  });
+
+  return Array.from(scores.entries())
+    .filter(([doc]) => required === null || required.has(doc))
+    .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+    .slice(0, limit)
+    .map(([doc, score]) => ({
+      slug: decoder.decode(index.slugBlob.subarray(index.slugOffsets[doc], index.slugOffsets[doc + 1])),
+      score: Math.round(score * 10000) / 10000,
+    }));
+}
@@ -11,11 +11,13 @@
 let fs: any;
 let path: any;
 let matter: any;
+let crypto: any;
 
 if (typeof window === 'undefined') {
   fs = require('fs');
   path = require('path');
   matter = require('gray-matter');
+  crypto = require('crypto');
 }
 
 export interface BlogPost {
@@ -41,10 +43,19 @@ export interface BlogPost {
     keywords?: string[];
   };
   readTime?: number; // minutes
+  relatedSlugs?: string[]; // most similar posts first
+  html?: string; // Pre-rendered, sanitized HTML of content (blog_pipeline/html_render.py)
+  toc?: BlogTocEntry[]; // H2/H3 headings of the pre-rendered HTML
   views?: number;
   likes?: number;
 }
 
+export interface BlogTocEntry {
+  id: string; // id of the heading element
+  text: string;
+  level: number; // 2 or 3
+}
+
 export interface BlogCategory {
   id: BlogPost['category'];
   label: string;
@@ -1532,6 +1543,52 @@ The price cap:
   */
 ];
 
+/**
+ * Build a BlogPost from a markdown file's frontmatter and body
+ */
+function createPostFromMarkdown(
+  filename: string,
+  data: Record<string, any>,
+  content: string,
+  fallbackReadTime?: number
+): BlogPost {
+  // Extract date from filename (format: YYYY-MM-DD-slug.md)
+  const dateMatch = filename.match(/^(\d{4}-\d{2}-\d{2})/);
+  const fileDate = dateMatch ? dateMatch[1] : data.date || new Date().toISOString();
+
+  // Create blog post object
+  const slug = (data.slug || filename.replace(/^\d{4}-\d{2}-\d{2}-/, '').replace(/\.md$/, '')).toLowerCase();
+  return {
+    id: slug,
+    title: data.title || 'Untitled',
+    slug,
+    excerpt: data.excerpt || content.substring(0, 150) + '...',
+    content: content,
+    category: data.category || 'guides',
+    tags: Array.isArray(data.tags) ? data.tags : [],
+    author: {
+      id: 'cost-saver-team',
+      name: data.author || 'Cost Saver Team',
+    },
+    publishedAt: fileDate,
+    updatedAt: data.date || fileDate,
+    status: 'published',
+    seo: {
+      metaTitle: data.title,
+      metaDescription: data.excerpt,
+      keywords: Array.isArray(data.tags) ? data.tags : [],
+    },
+    readTime: data.readTime ? parseInt(data.readTime) : fallbackReadTime ?? calculateReadTime(content),
+    views: 0,
+    likes: 0,
+  };
+}
+
+function isPostFilename(filename: string): boolean {
+  // Only process markdown files, skip README
+  return filename.endsWith('.md') && !filename.toLowerCase().includes('readme');
+}
+
 /**
  * Load blog posts from markdown files
  */
@@ -1553,8 +1610,7 @@ function loadBlogPostsFromMarkdown(): BlogPost[] {
   const posts: BlogPost[] = [];
 
   filenames.forEach((filename: string) => {
-    // Only process markdown files, skip README
-    if (!filename.endsWith('.md') || filename.toLowerCase().includes('readme')) {
+    if (!isPostFilename(filename)) {
       return;
     }
 
@@ -1562,39 +1618,7 @@ function loadBlogPostsFromMarkdown(): BlogPost[] {
       const filePath = path.join(blogDirectory, filename);
       const fileContents = fs.readFileSync(filePath, 'utf8');
       const { data, content } = matter(fileContents);
-
-      // Extract date from filename (format: YYYY-MM-DD-slug.md)
-      const dateMatch = filename.match(/^(\d{4}-\d{2}-\d{2})/);
-      const fileDate = dateMatch ? dateMatch[1] : data.date || new Date().toISOString();
-
-      // Create blog post object
-      const slug = (data.slug || filename.replace(/^\d{4}-\d{2}-\d{2}-/, '').replace(/\.md$/, '')).toLowerCase();
-      const post: BlogPost = {
-        id: slug,
-        title: data.title || 'Untitled',
-        slug,
-        excerpt: data.excerpt || content.substring(0, 150) + '...',
-        content: content,
-        category: data.category || 'guides',
-        tags: Array.isArray(data.tags) ? data.tags : [],
-        author: {
-          id: 'cost-saver-team',
-          name: data.author || 'Cost Saver Team',
-        },
-        publishedAt: fileDate,
-        updatedAt: data.date || fileDate,
-        status: 'published',
-        seo: {
-          metaTitle: data.title,
-          metaDescription: data.excerpt,
-          keywords: Array.isArray(data.tags) ? data.tags : [],
-        },
-        readTime: data.readTime ? parseInt(data.readTime) : calculateReadTime(content),
-        views: 0,
-        likes: 0,
-      };
-
-      posts.push(post);
+      posts.push(createPostFromMarkdown(filename, data, content));
     } catch (error) {
       console.error(`Error loading blog post ${filename}:`, error);
     }
@@ -1603,6 +1627,144 @@ function loadBlogPostsFromMarkdown(): BlogPost[] {
   return posts;
 }
 
+/**
+ * Pre-parsed post entry written by the Python content pipeline
+ * (blog_pipeline/post_manifest.py) to blog/manifest.json
+ */
+interface BlogManifestEntry {
+  file: string;
+  slug: string;
+  data: Record<string, any>;
+  wordCount: number;
+  readMinutes: number;
+  bodyOffset: number; // UTF-8 byte offset of the body in the markdown file
+  fileBytes: number;
+  sha256?: string; // of the markdown file the offset was taken from
+  related?: string[]; // slugs of the most similar posts (blog_pipeline/related_posts.py)
+  rendered?: string; // pre-rendered HTML file, relative to blog/ (blog_pipeline/html_render.py)
+  toc?: BlogTocEntry[];
+}
+
+interface LoadedBlogManifest {
+  mtimeMs: number;
+  posts: BlogPost[];
+  entries: Map<BlogPost, BlogManifestEntry>;
+  bySlug: Map<string, BlogPost>;
+}
+
+let blogManifestCache: LoadedBlogManifest | null = null;
+
+/**
+ * Load blog/manifest.json once per process (reloaded only when it changes).
+ * Returns null when there is no usable manifest, e.g. a post was added
+ * without re-running the pipeline.
+ */
+function loadBlogManifest(): LoadedBlogManifest | null {
+  if (typeof window !== 'undefined' || !fs || !path) {
+    return null;
+  }
+
+  const blogDirectory = path.join(process.cwd(), 'blog');
+  const manifestPath = path.join(blogDirectory, 'manifest.json');
+
+  try {
+    const { mtimeMs } = fs.statSync(manifestPath);
+    if (blogManifestCache && blogManifestCache.mtimeMs === mtimeMs) {
+      return blogManifestCache;
+    }
+
+    const manifest = JSON.parse(fs.readFileSync(manifestPath, 'utf8'));
+    const manifestEntries: BlogManifestEntry[] = manifest.posts || [];
+
+    // Only trust the manifest if it covers exactly the posts on disk
+    const onDisk: string[] = fs.readdirSync(blogDirectory).filter(isPostFilename);
+    const onDiskSet = new Set(onDisk);
+    const listed = new Set([...manifestEntries.map(entry => entry.file), ...(manifest.skipped || [])]);
+    if (onDisk.some(filename => !listed.has(filename)) || manifestEntries.some(entry => !onDiskSet.has(entry.file))) {
+      blogManifestCache = null;
+      return null;
+    }
+
+    const posts: BlogPost[] = [];
+    const entries = new Map<BlogPost, BlogManifestEntry>();
+    const bySlug = new Map<string, BlogPost>();
+    manifestEntries.forEach(entry => {
+      // Bodies are read on demand, except where the excerpt has to come from one
+      const content = entry.data.excerpt ? '' : readManifestBody(blogDirectory, entry);
+      const post = createPostFromMarkdown(entry.file, entry.data, content, entry.readMinutes);
+      if (entry.related) {
+        post.relatedSlugs = entry.related;
+      }
+      posts.push(post);
+      entries.set(post, entry);
+      if (!bySlug.has(post.slug)) {
+        bySlug.set(post.slug, post);
+      }
+    });
+
+    blogManifestCache = { mtimeMs, posts, entries, bySlug };
+    return blogManifestCache;
+  } catch (error) {
+    blogManifestCache = null;
+    return null;
+  }
+}
+
+/**
+ * Whether a post's markdown is byte-for-byte the file the manifest entry was
+ * built from. An edit that keeps the size still changes the hash.
+ */
+function isManifestEntryCurrent(raw: Buffer, entry: BlogManifestEntry): boolean {
+  return raw.length === entry.fileBytes && !!entry.sha256 &&
+    crypto.createHash('sha256').update(raw).digest('hex') === entry.sha256;
+}
+
+/**
+ * Read a post body straight from its byte offset, re-parsing the file if it
+ * was edited after the manifest was built
+ */
+function readManifestBody(blogDirectory: string, entry: BlogManifestEntry): string {
+  const raw = fs.readFileSync(path.join(blogDirectory, entry.file));
+  if (isManifestEntryCurrent(raw, entry)) {
+    return raw.subarray(entry.bodyOffset).toString('utf8');
+  }
+  return matter ? matter(raw.toString('utf8')).content : '';
+}
+
+/**
+ * Copy of a manifest post with its body filled in
+ */
+function withContent(post: BlogPost, manifest: LoadedBlogManifest): BlogPost {
+  const entry = manifest.entries.get(post);
+  if (!entry || post.content) {
+    return { ...post };
+  }
+  const blogDirectory = path.join(process.cwd(), 'blog');
+  return { ...post, content: readManifestBody(blogDirectory, entry) };
+}
+
+/**
+ * Copy of a manifest post with its body and pre-rendered HTML filled in.
+ * The HTML is only used while the markdown it came from is unchanged.
+ */
+function withRenderedHtml(post: BlogPost, manifest: LoadedBlogManifest): BlogPost {
+  const full = withContent(post, manifest);
+  const entry = manifest.entries.get(post);
+  if (!entry?.rendered) {
+    return full;
+  }
+  const blogDirectory = path.join(process.cwd(), 'blog');
+  try {
+    if (!isManifestEntryCurrent(fs.readFileSync(path.join(blogDirectory, entry.file)), entry)) {
+      return full;
+    }
+    const rendered = JSON.parse(fs.readFileSync(path.join(blogDirectory, entry.rendered), 'utf8'));
+    return { ...full, html: rendered.html, toc: entry.toc || rendered.toc };
+  } catch (error) {
+    return full;
+  }
+}
+
 /**
  * Get all published blog posts
  */
@@ -1614,8 +1776,9 @@ export async function getBlogPosts(
   },
   limit?: number
 ): Promise<BlogPost[]> {
-  // Load posts from markdown files
-  let posts = loadBlogPostsFromMarkdown();
+  // Load posts from the pre-built manifest, falling back to the markdown files
+  const manifest = loadBlogManifest();
+  let posts = manifest ? manifest.posts.slice() : loadBlogPostsFromMarkdown();
 
   // Filter by category
   if (filters?.category) {
@@ -1647,18 +1810,42 @@ export async function getBlogPosts(
     posts = posts.slice(0, limit);
   }
 
-  return posts;
+  // Only read bodies for the posts actually returned
+  return manifest ? posts.map(post => withContent(post, manifest)) : posts;
 }
 
 /**
  * Get single blog post by slug
  */
 export async function getBlogPost(slug: string): Promise<BlogPost | null> {
+  const manifest = loadBlogManifest();
+  if (manifest) {
+    const post = manifest.bySlug.get(slug);
+    return post ? withRenderedHtml(post, manifest) : null;
+  }
+
   const posts = loadBlogPostsFromMarkdown();
   const post = posts.find(p => p.slug === slug);
   return post || null;
 }
 
+/**
+ * Get the posts most similar to a post, as precomputed into the manifest
+ */
+export async function getRelatedPosts(slug: string, limit: number = 3): Promise<BlogPost[]> {
+  const manifest = loadBlogManifest();
+  const post = manifest?.bySlug.get(slug);
+  if (!manifest || !post?.relatedSlugs) {
+    return [];
+  }
+
+  return post.relatedSlugs
+    .map(relatedSlug => manifest.bySlug.get(relatedSlug))
+    .filter((related): related is BlogPost => !!related && related.status === 'published')
+    .slice(0, limit)
+    .map(related => withContent(related, manifest));
+}
+
 /**
  * Generate URL-friendly slug from title
  */
@@ -0,0 +1,104 @@
+from blog_pipeline.combined_output import split_posts
+
+
+def split(text):
+    return list(split_posts(text.split('\n')))
+
+
+def test_posts_split_on_frontmatter():
+    posts = split('''Here are your enhanced posts.
+
+---
+title: "First"
+slug: "first"
+---
+
+# First
+
+Body one.
+
+---
+title: "Second"
+tags: ["a",
+  "b"]
+---
+
+# Second
+
+Body two.
+''')
+
+    assert posts == [
+        '---\ntitle: "First"\nslug: "first"\n---\n\n# First\n\nBody one.',
+        '---\ntitle: "Second"\ntags: ["a",\n  "b"]\n---\n\n# Second\n\nBody two.',
+    ]
+
+
+def test_horizontal_rule_stays_in_post():
+    posts = split('''---
+title: "Only"
+---
+
+Before the rule.
+
+---
+
+After the rule.
+''')
+
+    assert posts == ['---\ntitle: "Only"\n---\n\nBefore the rule.\n\n---\n\nAfter the rule.']
+
+
+def test_frontmatter_needs_title_or_slug():
+    posts = split('''---
+title: "Only"
+---
+
+Intro.
+
+---
+note: not a post
+---
+
+Still the same post.
+''')
+
+    assert len(posts) == 1
+    assert posts[0].endswith('note: not a post\n---\n\nStill the same post.')
+
+
+def test_fenced_posts_drop_commentary():
+    posts = split('''Sure!
+
+```markdown
+---
+title: "First"
+---
+
+```python
+print("kept")
+```
+
+Body.
+```
+
+Let me know if you want changes.
+
+```markdown
+---
+title: "Second"
+---
+
+Body two.
+```
+''')
+
+    assert posts == [
+        '---\ntitle: "First"\n---\n\n```python\nprint("kept")\n```\n\nBody.',
+        '---\ntitle: "Second"\n---\n\nBody two.',
+    ]
+
+
+def test_no_frontmatter_is_one_post():
+    assert split('\n# Just a post\n\nText.\n') == ['\n# Just a post\n\nText.']
+    assert split('\n\n') == []
@@ -0,0 +1,38 @@
+import io
+import os
+
+import pytest
+
+from blog_pipeline.docx_images import DocumentImages, _existing_assets, _optimize_with_pillow, variant_sizes
+
+
+def test_variant_sizes_scale_from_the_largest_variant():
+    # 265 * 480 / 1601 rounds to 79, but every reader scales 1600x265 to 80
+    assert variant_sizes(1601, 265) == [(480, 80), (960, 159), (1600, 265)]
+    assert variant_sizes(1600, 900) == [(480, 270), (960, 540), (1600, 900)]
+    assert variant_sizes(300, 200) == [(300, 200)]
+    assert variant_sizes(3000, 2) == [(480, 1), (960, 1), (1600, 1)]
+
+
+def test_existing_assets_list_their_variants(tmp_path):
+    for name in ['abc-480x80.webp', 'abc-960x159.webp', 'abc-1600x265.webp', 'def-300x200.png']:
+        (tmp_path / name).write_bytes(b'')
+
+    assets = _existing_assets(str(tmp_path))
+
+    assert assets['abc'].src == '/blog-images/abc-1600x265.webp'
+    assert assets['abc'].variants == ((480, 80), (960, 159))
+    assert assets['def'].variants == ()
+    assert DocumentImages({'rId1': assets['abc']})('rId1', 'A [wide] chart') == \
+        '![A (wide) chart](/blog-images/abc-1600x265.webp#1600x265,480x80,960x159)'
+
+
+def test_pillow_writes_the_variants_it_lists(tmp_path):
+    Image = pytest.importorskip('PIL.Image')
+    buffer = io.BytesIO()
+    Image.new('RGB', (1601, 265)).save(buffer, 'PNG')
+
+    asset = _optimize_with_pillow(buffer.getvalue(), 'abc', str(tmp_path))
+
+    assert (asset.width, asset.height, asset.variants) == (1600, 265, ((480, 80), (960, 159)))
+    assert sorted(os.listdir(tmp_path)) == ['abc-1600x265.webp', 'abc-480x80.webp', 'abc-960x159.webp']
@@ -0,0 +1,64 @@
+import re
+
+from blog_pipeline.docx_images import DocumentImages, _existing_assets, variant_sizes
+from blog_pipeline.html_render import heading_anchor, render_inline, render_markdown, safe_url
+
+
+def test_raw_html_is_escaped():
+    html, _ = render_markdown('<script>alert("x")</script>\n\n**<b>bold</b>** & `<i>`\n')
+
+    assert '<script>' not in html
+    assert '&lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt;' in html
+    assert '<strong>&lt;b&gt;bold&lt;/b&gt;</strong> &amp; <code>&lt;i&gt;</code>' in html
+
+
+def test_unsafe_urls_are_dropped():
+    assert safe_url('javascript:alert(1)') == '#'
+    assert safe_url(' data:text/html,x') == '#'
+    assert safe_url('https://example.com/a') == 'https://example.com/a'
+    assert safe_url('/tariffs') == '/tariffs'
+    assert render_inline('[click](JavaScript:alert%281%29)') == '<a href="#">click</a>'
+
+
+def test_attributes_are_quoted_safely():
+    html = render_inline('[x](/a "say \\"hi\\"") ![a"b](/img.png)')
+
+    assert 'title="say &quot;hi&quot;"' in html
+    assert 'alt="a&quot;b"' in html
+
+
+def test_headings_get_unique_anchors_and_toc():
+    html, toc = render_markdown('## Costs\n\n### Costs\n\n## The *Real* Costs!\n')
+
+    assert '<h2 id="costs">Costs</h2>' in html
+    assert toc == [{'id': 'costs', 'text': 'Costs', 'level': 2},
+                   {'id': 'costs-1', 'text': 'Costs', 'level': 3},
+                   {'id': 'the-real-costs', 'text': 'The Real Costs!', 'level': 2}]
+
+
+def test_heading_anchor_records_used():
+    used = set()
+
+    assert [heading_anchor('Tips & Tricks', used) for _ in range(2)] == ['tips--tricks', 'tips--tricks-1']
+
+
+def test_srcset_names_files_docx_images_wrote(tmp_path):
+    for width, height in [(1601, 265), (1600, 900), (2000, 333), (999, 77)]:
+        for w, h in variant_sizes(width, height):
+            (tmp_path / f'img{width}-{w}x{h}.webp').write_bytes(b'')
+    images = DocumentImages(_existing_assets(str(tmp_path)))
+
+    for rid in images.assets:
+        html = render_inline(images(rid, 'chart'))
+        srcset = re.search(r'srcset="([^"]*)"', html).group(1)
+        for candidate in srcset.split(', '):
+            url, descriptor = candidate.split(' ')
+            assert (tmp_path / url.rsplit('/', 1)[1]).exists(), url
+            assert descriptor == url.rsplit('-', 1)[1].split('x')[0] + 'w'
+
+
+def test_image_without_variants_has_no_srcset():
+    html = render_inline('![a](/blog-images/abc-300x200.png#300x200)')
+
+    assert 'width="300" height="200"' in html
+    assert 'srcset' not in html
@@ -0,0 +1,48 @@
+import pytest
+
+from blog_pipeline.near_duplicates import DuplicateIndex, NearDuplicate, load_index, minhash, similarity
+
+BODY = ' '.join(f'Heat pumps move heat from outside air into the home, and tip {n} saves money.' for n in range(40))
+REWORDED = BODY.replace('tip 3 ', 'idea 3 ').replace('tip 17 ', 'idea 17 ')
+OTHER = ' '.join(f'Solar panels on a south facing roof return {n} pounds a year in export income.' for n in range(40))
+
+
+def post(body):
+    return f'---\ntitle: "Post"\n---\n\n{body}\n'
+
+
+def test_similarity_estimate():
+    assert similarity(minhash(BODY), minhash(BODY)) == 1.0
+    assert similarity(minhash(BODY), minhash(REWORDED)) > 0.8
+    assert similarity(minhash(BODY), minhash(OTHER)) < 0.2
+    assert minhash('') is None
+
+
+def test_index_blocks_rewrites(tmp_path):
+    (tmp_path / 'heat-pumps.md').write_text(post(BODY), encoding='utf-8')
+    index = load_index(str(tmp_path), cache_path=str(tmp_path / 'minhash.json'))
+
+    with pytest.raises(NearDuplicate):
+        index.check('heat-pumps-2025.md', post(REWORDED))
+    assert index.check('solar.md', post(OTHER)) == []
+    # A source's own previous output is not a duplicate of its new one
+    assert index.check('heat-pumps-2025.md', post(REWORDED), ignore=['heat-pumps.md']) == []
+
+
+def test_deleted_posts_no_longer_match(tmp_path):
+    (tmp_path / 'heat-pumps.md').write_text(post(BODY), encoding='utf-8')
+    index = DuplicateIndex(str(tmp_path), block=False)
+    index.add_post('heat-pumps.md', post(BODY))
+    assert index.matches(minhash(REWORDED))
+
+    (tmp_path / 'heat-pumps.md').unlink()
+    assert index.matches(minhash(REWORDED)) == []
+
+
+def test_pairs(tmp_path):
+    for name, body in [('a.md', BODY), ('b.md', REWORDED), ('c.md', OTHER)]:
+        (tmp_path / name).write_text(post(body), encoding='utf-8')
+
+    pairs = load_index(str(tmp_path), cache_path=str(tmp_path / 'minhash.json')).pairs()
+
+    assert [(a, b) for a, b, _ in pairs] == [('a.md', 'b.md')]
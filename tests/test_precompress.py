@@ -0,0 +1,31 @@
+import gzip
+
+from blog_pipeline.precompress import precompress
+
+TEXT = 'Energy saving tips. ' * 50
+
+
+def test_siblings_round_trip(tmp_path):
+    post = tmp_path / 'post.md'
+    post.write_text(TEXT, encoding='utf-8')
+    cache = str(tmp_path / 'precompress.json')
+
+    compressed, _ = precompress([str(post)], cache_path=cache)
+    assert len(compressed) == 1
+    assert gzip.decompress((tmp_path / 'post.md.gz').read_bytes()).decode('utf-8') == TEXT
+    assert precompress([str(post)], cache_path=cache)[0] == []
+
+
+def test_only_its_own_orphans_are_removed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'post.md').write_text(TEXT, encoding='utf-8')
+    (tmp_path / 'backup.tar.gz').write_bytes(gzip.compress(b'not ours'))
+    precompress(['post.md'], cache_path='precompress.json')
+
+    (tmp_path / 'post.md').unlink()
+    (tmp_path / 'other.md').write_text(TEXT, encoding='utf-8')
+    precompress(['other.md'], cache_path='precompress.json')
+
+    assert not (tmp_path / 'post.md.gz').exists()
+    assert (tmp_path / 'backup.tar.gz').exists()
+    assert (tmp_path / 'other.md.gz').exists()
@@ -0,0 +1,71 @@
+from blog_pipeline.prompt_delta import SectionState, merge_reply, parse_reply, section_block, split_sections
+
+POST = '''---
+title: "Smart Meters"
+---
+
+# Smart Meters
+
+Opening paragraph.
+
+## How They Work
+
+They send readings.
+
+```markdown
+## Not a section
+```
+
+## Common Problems
+
+Signal drops.
+'''
+
+
+def test_split_sections():
+    sections = split_sections(POST)
+
+    assert [section.anchor for section in sections] == ['introduction', 'how-they-work', 'common-problems']
+    assert ''.join(section.text for section in sections) == POST
+    assert '## Not a section' in sections[1].text
+
+
+def test_merge_round_trip():
+    sections = split_sections(POST)
+    reply = 'Here you go:\n\n' + section_block(sections[1]).replace('They send readings.', 'They send readings every 30 minutes.')
+
+    merged, anchors = merge_reply(POST, reply)
+
+    assert anchors == ['how-they-work']
+    assert merged == POST.replace('They send readings.', 'They send readings every 30 minutes.')
+
+
+def test_merge_unchanged_reply_is_identity():
+    reply = ''.join(section_block(section) for section in split_sections(POST))
+
+    merged, anchors = merge_reply(POST, reply)
+
+    assert anchors == ['introduction', 'how-they-work', 'common-problems']
+    assert merged == POST
+
+
+def test_parse_reply_ignores_unknown_text_and_crlf():
+    reply = 'Sure!\r\n<<<SECTION common-problems>>>\r\n## Common Problems\r\n\r\nFixed.\r\n<<<END SECTION>>>\r\nThanks'
+
+    assert parse_reply(reply) == {'common-problems': '## Common Problems\n\nFixed.\n'}
+
+
+def test_state_only_moves_on_save(tmp_path):
+    path = str(tmp_path / 'prompt_sections.json')
+    state = SectionState(path)
+    assert state.diff('post.md', POST).status == 'new'
+    assert SectionState(path).diff('post.md', POST).status == 'new'
+
+    state.save()
+    edited = POST.replace('Signal drops.', 'Signal drops in thick-walled homes.')
+    delta = SectionState(path).diff('post.md', edited)
+
+    assert delta.status == 'changed'
+    assert [section.anchor for section in delta.changed] == ['common-problems']
+    assert [section.anchor for section in delta.unchanged] == ['introduction', 'how-they-work']
+    assert SectionState(path).diff('post.md', POST).status == 'unchanged'
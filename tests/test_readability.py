@@ -0,0 +1,12 @@
+from blog_pipeline.readability import post_metrics, tokenize_blog
+
+POST = '---\ntitle: "Heat Pumps"\n---\n\n# Heat Pumps\n\nHeat pumps cut bills. They move heat.\n'
+
+
+def test_notes_without_frontmatter_are_not_posts(tmp_path):
+    (tmp_path / '2025-01-01-heat-pumps.md').write_text(POST, encoding='utf-8')
+    (tmp_path / 'BLOG_FORMATTING_STANDARDS.md').write_text('# Standards\n\nUse ![alt](url).\n', encoding='utf-8')
+    (tmp_path / 'README.md').write_text('# Blog\n', encoding='utf-8')
+
+    assert tokenize_blog(str(tmp_path)).posts == ['2025-01-01-heat-pumps.md']
+    assert list(post_metrics(str(tmp_path))) == ['2025-01-01-heat-pumps.md']
@@ -0,0 +1,46 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from blog_pipeline.search_index import _COMBINING_RE, fold_text, tokenize
+
+BLOG_SEARCH_TS = os.path.join(os.path.dirname(__file__), '..', 'lib', 'blogSearch.ts')
+
+# Accents inside and outside U+0300-036F, a ligature and a curly apostrophe
+SAMPLES = ['Café façade: naïve résumé', 'Heat-pump rénovation', 'e⃗co ﬁnance', 'Ofgem’s Price Cap']
+
+
+def ts_source():
+    with open(BLOG_SEARCH_TS, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def ts_combining_marks():
+    return re.search(r'const COMBINING_MARKS = /(\[[^\]]+\])/g;', ts_source()).group(1)
+
+
+def test_accents_fold_to_the_indexed_terms():
+    assert [term for term in tokenize('Café façade naïve') if term] == tokenize('cafe facade naive')
+    assert fold_text('e⃗co') == 'eco'
+
+
+def test_typescript_folds_the_same_marks():
+    assert ts_combining_marks() == _COMBINING_RE.pattern.encode('unicode_escape').decode('ascii')
+
+
+def test_typescript_fold_matches_python():
+    node = shutil.which('node')
+    if node is None:
+        pytest.skip('node is not installed')
+    # foldText from lib/blogSearch.ts, run as plain JavaScript
+    body = re.search(r'export function foldText\(text: string\): string \{\n(.*?)\n\}', ts_source(), re.S).group(1)
+    script = (f"const COMBINING_MARKS = /{ts_combining_marks()}/g;"
+              f"function foldText(text) {{ {body} }}"
+              "console.log(JSON.stringify(JSON.parse(process.argv[1]).map(foldText)));")
+    output = subprocess.run([node, '-e', script, json.dumps(SAMPLES)],
+                            capture_output=True, text=True, check=True).stdout
+    assert json.loads(output) == [fold_text(text) for text in SAMPLES]
@@ -0,0 +1,113 @@
+import pytest
+
+from blog_pipeline.output_stage import OutputStage
+from blog_pipeline.slug_registry import SlugCollision, SlugRegistry
+
+POST = '2025-01-05-understanding-your-energy-bill.md'
+MOVED = '2025-01-05-your-energy-bill-explained.md'
+
+
+def publish(tmp_path, registry, source, filename):
+    stage = OutputStage()
+    stage.write(str(tmp_path / filename), f'---\ntitle: "{filename}"\n---\n\nBody\n')
+    return registry.claim(source, filename, stage), stage
+
+
+def test_claim_registers_and_persists(tmp_path):
+    registry = SlugRegistry(str(tmp_path), 'ingest')
+    stale, _ = publish(tmp_path, registry, 'ChatGPT/Blogs/blog5.docx', POST)
+    registry.save()
+
+    assert stale is None
+    reloaded = SlugRegistry(str(tmp_path))
+    assert reloaded.output_for('ChatGPT/Blogs/blog5.docx') == POST
+    assert reloaded.owner('understanding-your-energy-bill') == 'ChatGPT/Blogs/blog5.docx'
+    assert reloaded.sources['ChatGPT/Blogs/blog5.docx']['pipeline'] == 'ingest'
+
+
+def test_slug_owned_by_another_source_is_refused(tmp_path):
+    registry = SlugRegistry(str(tmp_path), 'ingest')
+    publish(tmp_path, registry, 'ChatGPT/Blogs/blog5.docx', POST)
+
+    with pytest.raises(SlugCollision):
+        registry.check('ChatGPT/Blogs/blog6.docx', POST)
+
+
+def test_moved_slug_deletes_the_old_post(tmp_path):
+    registry = SlugRegistry(str(tmp_path), 'ingest')
+    publish(tmp_path, registry, 'ChatGPT/Blogs/blog5.docx', POST)
+    stale, stage = publish(tmp_path, registry, 'ChatGPT/Blogs/blog5.docx', MOVED)
+
+    assert stale == POST
+    assert stage.counts['deleted'] == 1
+    assert not (tmp_path / POST).exists()
+    assert registry.owner('understanding-your-energy-bill') is None
+    assert registry.output_for('ChatGPT/Blogs/blog5.docx') == MOVED
+
+
+def test_other_pipeline_cannot_move_a_post(tmp_path):
+    ingest = SlugRegistry(str(tmp_path), 'ingest')
+    publish(tmp_path, ingest, 'ChatGPT/Blogs/blog5.docx', POST)
+    ingest.save()
+
+    formatting = SlugRegistry(str(tmp_path), 'format')
+    with pytest.raises(SlugCollision):
+        formatting.claim('ChatGPT/Blogs/blog5.docx', MOVED, OutputStage())
+    assert (tmp_path / POST).exists()
+
+
+def test_rewriting_in_place_keeps_the_owning_pipeline(tmp_path):
+    ingest = SlugRegistry(str(tmp_path), 'ingest')
+    publish(tmp_path, ingest, 'ChatGPT/Blogs/blog5.docx', POST)
+    ingest.save()
+
+    formatting = SlugRegistry(str(tmp_path), 'format')
+    publish(tmp_path, formatting, 'ChatGPT/Blogs/blog5.docx', POST)
+    assert formatting.sources['ChatGPT/Blogs/blog5.docx']['pipeline'] == 'ingest'
+
+
+def test_release_leaves_other_pipelines_posts(tmp_path):
+    ingest = SlugRegistry(str(tmp_path), 'ingest')
+    publish(tmp_path, ingest, 'ChatGPT/Blogs/blog5.docx', POST)
+    ingest.save()
+
+    assert SlugRegistry(str(tmp_path), 'format').release('ChatGPT/Blogs/blog5.docx', OutputStage()) is None
+    assert (tmp_path / POST).exists()
+    assert ingest.release('ChatGPT/Blogs/blog5.docx', OutputStage()) == POST
+    assert not (tmp_path / POST).exists()
+
+
+def test_unowned_posts(tmp_path):
+    registry = SlugRegistry(str(tmp_path), 'ingest')
+    publish(tmp_path, registry, 'ChatGPT/Blogs/blog5.docx', POST)
+    (tmp_path / 'blog-post-5.md').write_text('---\ntitle: "Old"\n---\n', encoding='utf-8')
+    (tmp_path / 'README.md').write_text('# Blog\n', encoding='utf-8')
+
+    assert registry.unowned_posts() == ['blog-post-5.md']
+
+
+def test_adopt_takes_over_another_pipelines_post(tmp_path):
+    ingest = SlugRegistry(str(tmp_path), 'ingest')
+    publish(tmp_path, ingest, 'ChatGPT/Blogs/blog5.docx', POST)
+    ingest.save()
+
+    formatting = SlugRegistry(str(tmp_path), 'format', adopt=True)
+    stale, _ = publish(tmp_path, formatting, 'ChatGPT/Blogs/blog5.docx', MOVED)
+    formatting.save()
+
+    assert stale == POST
+    assert not (tmp_path / POST).exists()
+    assert SlugRegistry(str(tmp_path)).sources['ChatGPT/Blogs/blog5.docx'] == {
+        'slug': 'your-energy-bill-explained', 'file': MOVED, 'pipeline': 'format'}
+
+
+def test_unchanged_claim_leaves_the_registry_alone(tmp_path):
+    registry = SlugRegistry(str(tmp_path), 'ingest')
+    publish(tmp_path, registry, 'ChatGPT/Blogs/blog5.docx', POST)
+    registry.save()
+    before = (tmp_path / 'slug-registry.json').stat().st_mtime_ns
+
+    again = SlugRegistry(str(tmp_path), 'format')
+    assert again.claim('ChatGPT/Blogs/blog5.docx', POST, OutputStage()) is None
+    again.save()
+    assert (tmp_path / 'slug-registry.json').stat().st_mtime_ns == before